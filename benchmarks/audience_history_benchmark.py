@@ -0,0 +1,88 @@
+"""
+Benchmark of the audience history stage: legacy ``iterrows`` loop vs. the columnar AudienceHistoryEngine.
+
+Usage:
+    PYTHONPATH=. python benchmarks/audience_history_benchmark.py --sizes 10000 1000000 10000000
+"""
+import argparse
+import time
+from collections import defaultdict
+
+import numpy as np
+import pandas as pd
+
+from src.domain.services.audience_history import AudienceHistoryEngine
+
+WEEKDAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+
+def generate_audience(rows: int, signals: int = 10, programs: int = 500, seed: int = 42) -> pd.DataFrame:
+    """
+    Generates a synthetic, already validated audience frame.
+
+    :param rows: Number of audience rows.
+    :param signals: Number of distinct signals.
+    :param programs: Number of distinct program codes.
+    :param seed: Random seed.
+    :return: DataFrame with signal, program_code, weekday and average_audience columns.
+    """
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "signal": np.array([f"SIGNAL{i}" for i in range(signals)])[rng.integers(0, signals, rows)],
+        "program_code": np.array([f"P{i:04d}" for i in range(programs)])[rng.integers(0, programs, rows)],
+        "weekday": np.array(WEEKDAYS)[rng.integers(0, len(WEEKDAYS), rows)],
+        "average_audience": rng.random(rows) * 100,
+    })
+
+
+def legacy_history(audience_df: pd.DataFrame, window_size: int = 4):
+    """
+    Reference implementation of the previous row-by-row history loop.
+    """
+    history = defaultdict(list)
+    for _, row in audience_df.iterrows():
+        weekday = row["weekday"] if pd.notna(row["weekday"]) else "Unknown"
+        key = (row["signal"], row["program_code"], weekday)
+        history[key].append(row["average_audience"])
+        if len(history[key]) > window_size:
+            history[key].pop(0)
+    return {key: pd.Series(values).median() for key, values in history.items()}
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 1_000_000, 10_000_000])
+    parser.add_argument("--window-size", type=int, default=4)
+    parser.add_argument("--legacy-max-rows", type=int, default=None,
+                        help="Skip the legacy loop above this many rows (it takes minutes at 10M).")
+    args = parser.parse_args()
+
+    engine = AudienceHistoryEngine(window_size=args.window_size)
+    print(f"{'rows':>12} {'legacy (s)':>12} {'engine (s)':>12} {'speedup':>10}")
+
+    for size in args.sizes:
+        audience_df = generate_audience(size)
+        medians, engine_seconds = timed(engine.median_table, audience_df)
+
+        if args.legacy_max_rows is not None and size > args.legacy_max_rows:
+            print(f"{size:>12} {'skipped':>12} {engine_seconds:>12.3f} {'-':>10}")
+            continue
+
+        legacy, legacy_seconds = timed(legacy_history, audience_df, args.window_size)
+        engine_result = dict(zip(
+            medians[engine.key_columns].itertuples(index=False, name=None), medians[engine.median_column]
+        ))
+        assert legacy.keys() == engine_result.keys()
+        assert all(np.isclose(legacy[key], engine_result[key], equal_nan=True) for key in legacy)
+
+        print(f"{size:>12} {legacy_seconds:>12.3f} {engine_seconds:>12.3f} {legacy_seconds / engine_seconds:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Synthetic audience and inventory CSV generator for the benchmark suite.
+
+Key vocabularies (signals and program codes) come from Faker; rows are drawn with numpy so that millions of rows
+are generated in seconds. The same seed always produces the same files.
+
+Usage:
+    PYTHONPATH=. python benchmarks/data_generator.py --output-dir /tmp/tv-data --audience-rows 1000000
+"""
+import argparse
+import os
+import string
+from dataclasses import dataclass
+from datetime import date
+from typing import List
+
+import numpy as np
+import pandas as pd
+from faker import Faker
+
+AUDIENCE_FILE = "audience.csv"
+INVENTORY_FILE = "inventory.csv"
+
+
+@dataclass
+class DatasetSpec:
+    audience_rows: int = 100_000
+    inventory_rows: int = 20_000
+    signals: int = 5
+    programs: int = 200
+    audience_days: int = 365
+    inventory_days: int = 30
+    start_date: date = date(2023, 1, 1)
+    seed: int = 42
+
+
+def generate_keys(fake: Faker, count: int, pattern: str) -> List[str]:
+    """
+    Generates distinct codes from a Faker ``bothify`` pattern.
+
+    :param fake: Seeded Faker instance.
+    :param count: Number of codes.
+    :param pattern: Pattern where ``?`` is an uppercase letter and ``#`` a digit.
+    :return: List of distinct codes.
+    """
+    return [fake.unique.bothify(pattern, letters=string.ascii_uppercase) for _ in range(count)]
+
+
+def generate_datasets(spec: DatasetSpec) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Generates raw audience and inventory frames in the layout of the S3 input files.
+
+    :param spec: Sizes, key cardinalities and date ranges of the dataset.
+    :return: Tuple containing the audience and inventory DataFrames.
+    """
+    fake = Faker()
+    fake.seed_instance(spec.seed)
+    rng = np.random.default_rng(spec.seed)
+    signals = np.array(generate_keys(fake, spec.signals, "??#"))
+    programs = np.array(generate_keys(fake, spec.programs, "?????"))
+    start_times = np.array([f"{hour:02d}:{minute:02d}:00" for hour in range(24) for minute in (0, 30)])
+
+    audience_dates = pd.Timestamp(spec.start_date) + pd.to_timedelta(
+        np.sort(rng.integers(0, spec.audience_days, spec.audience_rows)), unit="D")
+    audience_df = pd.DataFrame({
+        "signal": signals[rng.integers(0, spec.signals, spec.audience_rows)],
+        "program_code": programs[rng.integers(0, spec.programs, spec.audience_rows)],
+        "exhibition_date": audience_dates.strftime("%Y-%m-%d"),
+        "program_start_time": start_times[rng.integers(0, len(start_times), spec.audience_rows)],
+        "average_audience": rng.gamma(2.0, 5.0, spec.audience_rows),
+    })
+
+    inventory_dates = pd.Timestamp(spec.start_date) + pd.to_timedelta(
+        spec.audience_days + rng.integers(0, spec.inventory_days, spec.inventory_rows), unit="D")
+    inventory_df = pd.DataFrame({
+        "signal": signals[rng.integers(0, spec.signals, spec.inventory_rows)],
+        "program_code": programs[rng.integers(0, spec.programs, spec.inventory_rows)],
+        "date": inventory_dates.strftime("%d/%m/%Y"),
+        "available_time": rng.integers(10, 120, spec.inventory_rows),
+    })
+    return audience_df, inventory_df
+
+
+def write_datasets(spec: DatasetSpec, output_dir: str) -> tuple[str, str]:
+    """
+    Generates the datasets and writes them as CSV files.
+
+    :param spec: Sizes, key cardinalities and date ranges of the dataset.
+    :param output_dir: Directory where the files are written.
+    :return: Tuple containing the audience and inventory file names, relative to the output directory.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    audience_df, inventory_df = generate_datasets(spec)
+    audience_df.to_csv(os.path.join(output_dir, AUDIENCE_FILE), index=False)
+    inventory_df.to_csv(os.path.join(output_dir, INVENTORY_FILE), index=False)
+    return AUDIENCE_FILE, INVENTORY_FILE
+
+
+def add_dataset_arguments(parser: argparse.ArgumentParser) -> None:
+    defaults = DatasetSpec()
+    parser.add_argument("--audience-rows", type=int, default=defaults.audience_rows)
+    parser.add_argument("--inventory-rows", type=int, default=defaults.inventory_rows)
+    parser.add_argument("--signals", type=int, default=defaults.signals)
+    parser.add_argument("--programs", type=int, default=defaults.programs)
+    parser.add_argument("--audience-days", type=int, default=defaults.audience_days)
+    parser.add_argument("--inventory-days", type=int, default=defaults.inventory_days)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+
+
+def dataset_spec(args: argparse.Namespace) -> DatasetSpec:
+    return DatasetSpec(audience_rows=args.audience_rows, inventory_rows=args.inventory_rows, signals=args.signals,
+                       programs=args.programs, audience_days=args.audience_days,
+                       inventory_days=args.inventory_days, seed=args.seed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output-dir", required=True)
+    add_dataset_arguments(parser)
+    args = parser.parse_args()
+
+    files = write_datasets(dataset_spec(args), args.output_dir)
+    print(f"Wrote {', '.join(files)} to {args.output_dir}")
+
+
+if __name__ == "__main__":
+    main()
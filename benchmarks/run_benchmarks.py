@@ -0,0 +1,195 @@
+"""
+Offline benchmark suite of the ingestion pipeline and the open_tv endpoints.
+
+Synthetic CSVs are generated with benchmarks/data_generator.py and read from a local directory, and Redis is
+replaced by the in-memory repository, so no credentials or network are needed. The suite times every ingestion
+stage, then drives the endpoints through the ASGI app with concurrent clients and reports latency percentiles
+and throughput. Results are written as JSON so they can be compared across commits.
+
+Usage:
+    PYTHONPATH=. python benchmarks/run_benchmarks.py --audience-rows 1000000 --requests 5000 --output results.json
+"""
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import random
+import statistics
+import subprocess
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+import httpx
+
+from benchmarks.data_generator import add_dataset_arguments, dataset_spec, write_datasets
+from src.cross.timing import collect_durations
+from src.domain.core.config import ENVIRONMENT
+from src.domain.services.tv_data_query_cache import TvDataQueryCache
+from src.domain.services.tv_data_service import TvDataService
+from src.infra.repositories.csv_local_repository import LocalCSVRepository
+from src.infra.repositories.memory_repository import AsyncInMemoryRepository, InMemoryRepository
+
+
+def run_ingestion(service: TvDataService, audience_file: str, inventory_file: str, chunksize: int) -> dict:
+    """
+    Runs the full ingestion pipeline once.
+
+    :param service: Service bound to the local CSV directory and the in-memory repository.
+    :param audience_file: Name of the audience CSV file.
+    :param inventory_file: Name of the inventory CSV file.
+    :param chunksize: Number of CSV rows processed at a time, 0 loads each file at once.
+    :return: Dictionary with the total time, the time of every stage and the number of stored programs.
+    """
+    with collect_durations() as stages:
+        start = time.perf_counter()
+        service.process_and_store_data(audience_file, inventory_file, chunksize=chunksize)
+        total = time.perf_counter() - start
+
+    programs = service.get_program_codes()
+    return {"total_seconds": total, "stages": stages, "programs": len(programs)}
+
+
+def build_requests(scenario: str, program_codes: list, first_date: datetime, days: int, count: int,
+                   bulk_items: int, rng: random.Random) -> list:
+    """
+    Builds the requests of a load scenario.
+
+    :return: List of (method, url, json body) tuples.
+    """
+    def random_date():
+        return (first_date + timedelta(days=rng.randrange(days))).strftime("%Y-%m-%d")
+
+    requests = []
+    for _ in range(count):
+        program_code = rng.choice(program_codes)
+        if scenario == "program":
+            requests.append(("GET", f"/api/v1/program?program_code={program_code}&date={random_date()}", None))
+        elif scenario == "period":
+            start_date, end_date = sorted([random_date(), random_date()])
+            requests.append(("GET", f"/api/v1/period?program_code={program_code}&start_date={start_date}"
+                                    f"&end_date={end_date}", None))
+        else:
+            items = [{"program_code": rng.choice(program_codes), "date": random_date()} for _ in range(bulk_items)]
+            requests.append(("POST", "/api/v1/bulk", {"items": items}))
+    return requests
+
+
+async def run_load(app, requests: list, concurrency: int) -> dict:
+    """
+    Sends requests to the ASGI app from concurrent clients.
+
+    :param app: The FastAPI application.
+    :param requests: List of (method, url, json body) tuples.
+    :param concurrency: Number of concurrent clients.
+    :return: Dictionary with latency percentiles in milliseconds, throughput and status code counts.
+    """
+    queue = asyncio.Queue()
+    for request in requests:
+        queue.put_nowait(request)
+    latencies, statuses = [], {}
+
+    async def client_loop(client):
+        while not queue.empty():
+            method, url, body = queue.get_nowait()
+            start = time.perf_counter()
+            response = await client.request(method, url, json=body)
+            latencies.append((time.perf_counter() - start) * 1000)
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+    async with httpx.AsyncClient(app=app, base_url="http://benchmark") as client:
+        start = time.perf_counter()
+        await asyncio.gather(*(client_loop(client) for _ in range(concurrency)))
+        wall = time.perf_counter() - start
+
+    percentiles = statistics.quantiles(latencies, n=100, method="inclusive")
+    return {
+        "requests": len(latencies),
+        "throughput_rps": len(latencies) / wall,
+        "mean_ms": statistics.fmean(latencies),
+        "p50_ms": percentiles[49],
+        "p95_ms": percentiles[94],
+        "p99_ms": percentiles[98],
+        "max_ms": max(latencies),
+        "status_codes": {str(status): count for status, count in sorted(statuses.items())},
+    }
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    add_dataset_arguments(parser)
+    parser.add_argument("--data-dir", default=None, help="Directory of the generated CSVs. Defaults to a temp dir.")
+    parser.add_argument("--chunksize", type=int, default=ENVIRONMENT.csv_chunk_size,
+                        help="CSV rows per chunk, 0 loads each file at once. Defaults to CSV_CHUNK_SIZE.")
+    parser.add_argument("--scenarios", nargs="+", default=["program", "period", "bulk"],
+                        choices=["program", "period", "bulk"])
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per scenario.")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--bulk-items", type=int, default=50)
+    parser.add_argument("--output", default=None, help="Path of the JSON results. Printed to stdout if omitted.")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    spec = dataset_spec(args)
+    data_dir = args.data_dir or tempfile.mkdtemp(prefix="tv-benchmark-")
+
+    start = time.perf_counter()
+    audience_file, inventory_file = write_datasets(spec, data_dir)
+    generation_seconds = time.perf_counter() - start
+
+    repository = InMemoryRepository()
+    service = TvDataService(LocalCSVRepository(data_dir), repository, AsyncInMemoryRepository(repository))
+    ingestion = run_ingestion(service, audience_file, inventory_file, args.chunksize)
+
+    from main import app
+
+    app.state.tv_query_cache = TvDataQueryCache(service)
+    program_codes = sorted(service.get_program_codes())
+    first_inventory_date = datetime.combine(spec.start_date, datetime.min.time()) + timedelta(days=spec.audience_days)
+    rng = random.Random(spec.seed)
+
+    endpoints = {}
+    for scenario in args.scenarios:
+        requests = build_requests(scenario, program_codes, first_inventory_date, spec.inventory_days,
+                                  args.requests, args.bulk_items, rng)
+        endpoints[scenario] = asyncio.run(run_load(app, requests, args.concurrency))
+
+    results = {
+        "commit": git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "parameters": {**vars(args), "data_dir": data_dir},
+        "generation_seconds": generation_seconds,
+        "ingestion": ingestion,
+        "endpoints": endpoints,
+        "query_cache": app.state.tv_query_cache.stats(),
+    }
+
+    print(f"{'stage':<40} {'seconds':>10}")
+    for stage, seconds in ingestion["stages"].items():
+        print(f"{stage:<40} {seconds:>10.3f}")
+    print(f"{'total':<40} {ingestion['total_seconds']:>10.3f}\n")
+    print(f"{'scenario':<10} {'rps':>10} {'p50 (ms)':>10} {'p99 (ms)':>10} {'max (ms)':>10}")
+    for scenario, load in endpoints.items():
+        print(f"{scenario:<10} {load['throughput_rps']:>10.1f} {load['p50_ms']:>10.2f} {load['p99_ms']:>10.2f} "
+              f"{load['max_ms']:>10.2f}")
+
+    serialized = json.dumps(results, indent=2, default=str)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(serialized)
+    else:
+        print(serialized)
+
+
+if __name__ == "__main__":
+    main()
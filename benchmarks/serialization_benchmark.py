@@ -0,0 +1,99 @@
+"""
+Size and speed of the Redis value encodings against the legacy ``json.dumps`` records.
+
+Records are built from the synthetic inventory of benchmarks/data_generator.py and encoded one value per record,
+the layout of the program hashes in Redis. Every format and compression supported by the Serializer is measured
+with the configured minimum compression size, then with compression forced on every value.
+
+Usage:
+    PYTHONPATH=. python benchmarks/serialization_benchmark.py --inventory-rows 100000 --output serialization.json
+"""
+import argparse
+import json
+import time
+
+import numpy as np
+
+from benchmarks.data_generator import add_dataset_arguments, dataset_spec, generate_datasets
+from src.cross.serialization import COMPRESSIONS, FORMATS, Serializer
+from src.domain.core.config import ENVIRONMENT
+
+
+def build_records(spec) -> list:
+    """
+    Builds TV data records from the synthetic inventory.
+
+    :param spec: Sizes, key cardinalities and date ranges of the dataset.
+    :return: List of record dictionaries, as written by TvDataWriter.
+    """
+    _, inventory_df = generate_datasets(spec)
+    dates = inventory_df["date"].str.slice(6, 10) + "-" + inventory_df["date"].str.slice(3, 5) + "-" \
+        + inventory_df["date"].str.slice(0, 2)
+    weekdays = np.array(["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"])
+    rng = np.random.default_rng(spec.seed)
+    return [
+        {"signal": signal, "program_code": program_code, "weekday": weekday, "available_time": int(available_time),
+         "predicted_audience": float(predicted_audience), "exhibition_date": exhibition_date}
+        for signal, program_code, weekday, available_time, predicted_audience, exhibition_date in zip(
+            inventory_df["signal"], inventory_df["program_code"],
+            weekdays[rng.integers(0, 7, len(inventory_df))], inventory_df["available_time"],
+            rng.gamma(2.0, 5.0, len(inventory_df)), dates)
+    ]
+
+
+def measure(encode, records: list) -> dict:
+    """
+    Encodes and decodes every record.
+
+    :param encode: Function encoding a record.
+    :param records: Record dictionaries.
+    :return: Dictionary with the total size and the encode and decode times per record.
+    """
+    start = time.perf_counter()
+    values = [encode(record) for record in records]
+    encode_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    decoded = [Serializer.loads(value) for value in values]
+    decode_seconds = time.perf_counter() - start
+    assert decoded == records
+
+    return {
+        "bytes": sum(len(value) for value in values),
+        "bytes_per_record": sum(len(value) for value in values) / len(values),
+        "encode_us": encode_seconds / len(values) * 1e6,
+        "decode_us": decode_seconds / len(values) * 1e6,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    add_dataset_arguments(parser)
+    parser.add_argument("--compression-min-bytes", type=int, default=ENVIRONMENT.redis_value_compression_min_bytes)
+    parser.add_argument("--output", default=None, help="Path of the JSON results.")
+    args = parser.parse_args()
+
+    records = build_records(dataset_spec(args))
+    results = {"legacy json.dumps": measure(lambda record: json.dumps(record).encode(), records)}
+    for value_format in FORMATS:
+        for compression in COMPRESSIONS:
+            minimums = [args.compression_min_bytes] if compression == "none" else [args.compression_min_bytes, 0]
+            for minimum in dict.fromkeys(minimums):
+                serializer = Serializer(value_format, compression, minimum)
+                results[f"{value_format}+{compression} (min {minimum})"] = measure(serializer.dumps, records)
+
+    baseline = results["legacy json.dumps"]
+    print(f"{len(records)} records\n")
+    print(f"{'encoding':<28} {'bytes/rec':>10} {'size':>7} {'enc (us)':>9} {'dec (us)':>9}")
+    for name, result in results.items():
+        result["size_ratio"] = result["bytes"] / baseline["bytes"]
+        print(f"{name:<28} {result['bytes_per_record']:>10.1f} {result['size_ratio']:>7.2f} "
+              f"{result['encode_us']:>9.2f} {result['decode_us']:>9.2f}")
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump({"records": len(records), "results": results}, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark of the API cold start: importing ``main`` and running the application startup in a fresh interpreter,
+without any credentials in the environment.
+
+Exits with status 1 if the median startup time exceeds the budget or if a module reserved to the ingestion
+pipeline is imported.
+
+Usage:
+    python benchmarks/startup_benchmark.py --runs 10 --budget 1.0
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+INGESTION_MODULES = ["pandas", "numpy", "boto3", "botocore", "pyarrow"]
+
+STARTUP_SCRIPT = f"""
+import asyncio, json, sys, time
+start = time.perf_counter()
+import main
+imported = time.perf_counter()
+
+async def startup():
+    async with main.app.router.lifespan_context(main.app):
+        pass
+
+asyncio.run(startup())
+print(json.dumps({{
+    "import": imported - start,
+    "total": time.perf_counter() - start,
+    "loaded": [module for module in {INGESTION_MODULES!r} if module in sys.modules],
+}}))
+"""
+
+
+def measure_startup() -> dict:
+    """
+    Starts the API once in a fresh interpreter.
+
+    :return: Dictionary with the import and total startup times, in seconds, and the ingestion modules loaded.
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    environment = {"PATH": os.environ.get("PATH", ""), "PYTHONPATH": root}
+    output = subprocess.run([sys.executable, "-c", STARTUP_SCRIPT], cwd=root, env=environment,
+                            capture_output=True, text=True, check=True).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--budget", type=float, default=1.0, help="Maximum median startup time, in seconds.")
+    args = parser.parse_args()
+
+    results = [measure_startup() for _ in range(args.runs)]
+    import_seconds = statistics.median(result["import"] for result in results)
+    total_seconds = statistics.median(result["total"] for result in results)
+    loaded = sorted({module for result in results for module in result["loaded"]})
+
+    print(f"{'runs':>6} {'import (s)':>12} {'startup (s)':>12} {'budget (s)':>12}")
+    print(f"{args.runs:>6} {import_seconds:>12.3f} {total_seconds:>12.3f} {args.budget:>12.3f}")
+
+    if loaded:
+        print(f"Ingestion modules imported by the API: {', '.join(loaded)}")
+    if loaded or total_seconds > args.budget:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
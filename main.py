@@ -1,15 +1,38 @@
+from contextlib import asynccontextmanager
+
 import uvicorn
 from fastapi import FastAPI
 
+from src.application.observability import get_metrics, observe_requests
+from src.application.v1.dependencies import create_tv_query_cache
 from src.application.v1.endpoints import open_tv
+from src.domain.core.config import ENVIRONMENT
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    app.state.tv_query_cache = create_tv_query_cache()
+    yield
+    await app.state.tv_query_cache.tv_service.close()
+
+
 app = FastAPI(
     title="Globo Eng Dados Challange",
     description="FastApi to handle tv programs date medians",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
+app.middleware("http")(observe_requests)
+app.add_api_route("/metrics", get_metrics, methods=["GET"], include_in_schema=False)
 app.include_router(open_tv.router, prefix="/api/v1", tags=["Webhooks"])
 
 
 if __name__ == "__main__":
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
+    uvicorn.run(
+        "main:app",
+        host=ENVIRONMENT.api_host,
+        port=ENVIRONMENT.api_port,
+        workers=ENVIRONMENT.api_workers,
+        reload=ENVIRONMENT.api_reload
+    )
@@ -1,5 +1,7 @@
 import logging
 
+from src.cross.metrics import push_metrics
+from src.domain.core.config import ENVIRONMENT
 from src.domain.services.tv_data_service import TvDataService
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -11,7 +13,19 @@ def run_cron_task():
     service = TvDataService()
     audience_csv_key = "tvaberta_program_audience.csv"
     inventory_csv_key = "tvaberta_inventory_availability.csv"
-    service.process_and_store_data(audience_csv_key, inventory_csv_key)
+    if ENVIRONMENT.ingestion_from_snapshot:
+        service.process_and_store_from_snapshot()
+    elif ENVIRONMENT.ingestion_incremental:
+        service.process_and_store_incremental(audience_csv_key, inventory_csv_key)
+    elif ENVIRONMENT.ingestion_shards > 1 and ENVIRONMENT.ingestion_shard_index is not None:
+        service.process_and_store_shard(audience_csv_key, inventory_csv_key, ENVIRONMENT.ingestion_shard_index,
+                                        ENVIRONMENT.ingestion_shards, ENVIRONMENT.ingestion_run_id)
+    elif ENVIRONMENT.ingestion_shards > 1:
+        service.process_and_store_sharded(audience_csv_key, inventory_csv_key, ENVIRONMENT.ingestion_shards)
+    else:
+        service.process_and_store_data(audience_csv_key, inventory_csv_key)
+    if ENVIRONMENT.prometheus_pushgateway:
+        push_metrics(ENVIRONMENT.prometheus_pushgateway, job="tv_data_ingestion")
 
     logging.info("✅ Processamento concluído e salvo no Redis.")
 
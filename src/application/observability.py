@@ -0,0 +1,62 @@
+import logging
+import os
+import time
+
+from fastapi import Request, Response
+
+from src.cross.metrics import HTTP_REQUEST_DURATION, render_metrics
+from src.cross.profiler import SamplingProfiler
+from src.domain.core.config import ENVIRONMENT
+
+logger = logging.getLogger(__name__)
+
+
+async def observe_requests(request: Request, call_next):
+    """
+    HTTP middleware observing the latency of every request, labeled by endpoint function and status code.
+
+    With ``API_PROFILING_ENABLED``, requests sent with an ``X-Profile`` header are run under the sampling
+    profiler; the folded stacks are written to ``API_PROFILE_DIR`` and the file path is returned in the
+    ``X-Profile-File`` response header.
+    """
+    profiler = None
+    if ENVIRONMENT.api_profiling_enabled and request.headers.get("x-profile"):
+        profiler = SamplingProfiler(ENVIRONMENT.api_profiling_interval).__enter__()
+
+    start = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+    finally:
+        route = request.scope.get("route")
+        handler = route.name if route is not None else "unmatched"
+        HTTP_REQUEST_DURATION.labels(request.method, handler, str(status)).observe(time.perf_counter() - start)
+        if profiler is not None:
+            profiler.__exit__(None, None, None)
+
+    if profiler is not None:
+        response.headers["X-Profile-File"] = _write_profile(profiler, handler)
+    return response
+
+
+async def get_metrics() -> Response:
+    content, media_type = render_metrics()
+    return Response(content=content, media_type=media_type)
+
+
+def _write_profile(profiler: SamplingProfiler, handler: str) -> str:
+    """
+    Writes the folded stacks of a profiled request.
+
+    :param profiler: The stopped profiler.
+    :param handler: Name of the endpoint function of the request, used in the file name.
+    :return: Path of the written file.
+    """
+    os.makedirs(ENVIRONMENT.api_profile_dir, exist_ok=True)
+    path = os.path.join(ENVIRONMENT.api_profile_dir, f"{time.time_ns()}-{handler}.folded")
+    with open(path, "w") as file:
+        file.write(profiler.folded())
+
+    logger.info(f"Profile of {handler} written to {path} ({sum(profiler.samples.values())} samples).")
+    return path
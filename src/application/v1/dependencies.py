@@ -0,0 +1,27 @@
+from fastapi import Request
+
+from src.domain.services.tv_data_query_cache import TvDataQueryCache
+from src.domain.services.tv_data_reader import TvDataReader
+
+
+def create_tv_query_cache() -> TvDataQueryCache:
+    """
+    Creates the query cache of a server worker. Clients are only connected when the first query runs.
+
+    :return: A TvDataQueryCache in front of a new TvDataReader.
+    """
+    return TvDataQueryCache(TvDataReader())
+
+
+def get_tv_query_cache(request: Request) -> TvDataQueryCache:
+    """
+    Provides the query cache created by the application lifespan, creating it on first use if the lifespan did
+    not run.
+
+    :param request: The incoming request.
+    :return: The TvDataQueryCache of the current worker.
+    """
+    state = request.app.state
+    if getattr(state, "tv_query_cache", None) is None:
+        state.tv_query_cache = create_tv_query_cache()
+    return state.tv_query_cache
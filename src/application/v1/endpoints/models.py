@@ -1,5 +1,9 @@
-from pydantic import BaseModel
-from typing import Optional
+from datetime import datetime
+
+from pydantic import BaseModel, Field, model_validator
+from typing import List, Optional
+
+from src.domain.core.config import ENVIRONMENT
 
 
 class DateRangeRequest(BaseModel):
@@ -7,3 +11,17 @@ class DateRangeRequest(BaseModel):
     start_date: Optional[str] = None
     end_date: Optional[str] = None
     date: Optional[str] = None
+
+    @model_validator(mode="after")
+    def validate_dates(self):
+        if self.date is None and (self.start_date is None or self.end_date is None):
+            raise ValueError("Either date or both start_date and end_date must be provided.")
+
+        for value in (self.date, self.start_date, self.end_date):
+            if value is not None:
+                datetime.strptime(value, "%Y-%m-%d")
+        return self
+
+
+class BulkQueryRequest(BaseModel):
+    items: List[DateRangeRequest] = Field(min_length=1, max_length=ENVIRONMENT.bulk_query_max_items)
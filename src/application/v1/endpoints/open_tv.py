@@ -1,16 +1,20 @@
 from datetime import datetime
 from typing import List
 
-from fastapi import APIRouter, HTTPException
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
 
-from src.application.v1.endpoints.models import DateRangeRequest
+from src.application.v1.dependencies import get_tv_query_cache
+from src.application.v1.http_cache import get_cache_validators
+from src.application.v1.endpoints.models import BulkQueryRequest, DateRangeRequest
+from src.domain.core.config import ENVIRONMENT
 from src.domain.entities.open_tv import TVData
-from src.domain.services.tv_data_service import TvDataService
+from src.domain.services.query_index import ProgramIndex
+from src.domain.services.tv_data_query_cache import TvDataQueryCache
 
 router = APIRouter()
 
-tv_service = TvDataService()
-
 weekday_map = {
     "Monday": 0,
     "Tuesday": 1,
@@ -23,33 +27,80 @@ weekday_map = {
 
 
 @router.get("/program", response_model=List[TVData])
-def get_program_data(program_code: str, date: str):
-    tv_data_list = tv_service.get_all_data()
+async def get_program_data(program_code: str, date: str, request: Request, response: Response,
+                           tv_query_cache: TvDataQueryCache = Depends(get_tv_query_cache)):
     weekday = datetime.strptime(date, "%Y-%m-%d").strftime("%A")
-    result = [
-        item for item in tv_data_list
-        if item.program_code == program_code and item.weekday == weekday
-    ]
+    validators, not_modified = await get_cache_validators(request, tv_query_cache, "program", program_code, date)
+    if not_modified is not None:
+        return not_modified
+
+    if ENVIRONMENT.api_fast_responses:
+        payload = await tv_query_cache.get_program_payload_async(program_code, weekday)
+        if payload == ProgramIndex.empty_payload:
+            raise HTTPException(status_code=404, detail="No data found for this program and date")
+        return Response(content=payload, media_type="application/json", headers=validators.headers)
+
+    result = await tv_query_cache.get_program_data_async(program_code, weekday)
 
     if not result:
         raise HTTPException(status_code=404, detail="No data found for this program and date")
 
+    response.headers.update(validators.headers)
     return result
 
 
 @router.get("/period", response_model=List[TVData])
-def get_period_data(program_code: str, start_date: str, end_date: str):
-    tv_data_list = tv_service.get_all_data()
-
+async def get_period_data(program_code: str, start_date: str, end_date: str, request: Request, response: Response,
+                          tv_query_cache: TvDataQueryCache = Depends(get_tv_query_cache)):
     start_date_obj = datetime.strptime(start_date, "%Y-%m-%d")
     end_date_obj = datetime.strptime(end_date, "%Y-%m-%d")
-    result = [
-        item for item in tv_data_list
-        if item.program_code == program_code and
-           start_date_obj >= datetime.strptime(item.exhibition_date, "%Y-%m-%d") <= end_date_obj
-    ]
+    validators, not_modified = await get_cache_validators(request, tv_query_cache, "period", program_code,
+                                                          start_date, end_date)
+    if not_modified is not None:
+        return not_modified
+
+    if ENVIRONMENT.api_fast_responses:
+        payload = await tv_query_cache.get_period_payload_async(program_code, start_date_obj, end_date_obj)
+        if payload == ProgramIndex.empty_payload:
+            raise HTTPException(status_code=404, detail="No data found for the specified period")
+        return Response(content=payload, media_type="application/json", headers=validators.headers)
+
+    result = await tv_query_cache.get_period_data_async(program_code, start_date_obj, end_date_obj)
 
     if not result:
         raise HTTPException(status_code=404, detail="No data found for the specified period")
 
+    response.headers.update(validators.headers)
     return result
+
+
+@router.post("/bulk")
+async def get_bulk_data(request: BulkQueryRequest, stream: bool = False,
+                        tv_query_cache: TvDataQueryCache = Depends(get_tv_query_cache)):
+    """
+    Resolves many program/date and program/period queries at once. Every program is loaded in a single round
+    trip and the results are grouped per query item, in request order.
+
+    Set ``stream=true`` to receive one NDJSON line per item instead of a single JSON array.
+    """
+    indexes = await tv_query_cache.get_program_indexes_async([item.program_code for item in request.items])
+    lines = (_bulk_item_payload(item, indexes[item.program_code]) for item in request.items)
+
+    if stream:
+        return StreamingResponse((line + b"\n" for line in lines), media_type="application/x-ndjson")
+    return Response(content=b"[" + b",".join(lines) + b"]", media_type="application/json")
+
+
+def _bulk_item_payload(item: DateRangeRequest, index: ProgramIndex) -> bytes:
+    if item.date is not None:
+        weekday = datetime.strptime(item.date, "%Y-%m-%d").strftime("%A")
+        data = index.weekday_payload(weekday)
+    else:
+        data = index.period_payload(datetime.strptime(item.start_date, "%Y-%m-%d"),
+                                    datetime.strptime(item.end_date, "%Y-%m-%d"))
+    return b'{"query":' + orjson.dumps(item.model_dump()) + b',"data":' + data + b"}"
+
+
+@router.get("/cache/stats")
+async def get_cache_stats(tv_query_cache: TvDataQueryCache = Depends(get_tv_query_cache)):
+    return tv_query_cache.stats()
@@ -0,0 +1,84 @@
+import hashlib
+import time
+
+from fastapi import Request, Response
+
+from src.domain.core.config import ENVIRONMENT
+from src.domain.services.tv_data_query_cache import TvDataQueryCache
+
+
+class CacheValidators:
+    """
+    HTTP caching headers of a query result: a strong ETag derived from the dataset version and the query, and a
+    Cache-Control header expiring at the next expected dataset refresh.
+
+    Results only change when a new dataset version is published, so a client or gateway holding the ETag of the
+    current version can be answered with 304 Not Modified without computing the result.
+    """
+
+    def __init__(self, version: str | None, published_at: float | None, *query: str):
+        """
+        Initializes the validators.
+
+        :param version: The dataset version served, None if no dataset was published yet.
+        :param published_at: (Optional) Unix time at which the dataset version was published.
+        :param query: Name of the endpoint followed by the query parameters.
+        """
+        self.etag = None
+        if version is not None:
+            digest = hashlib.blake2b("\0".join(query).encode(), digest_size=8).hexdigest()
+            self.etag = f'"{version}-{digest}"'
+        self.cache_control = self._cache_control(published_at)
+
+    @property
+    def headers(self) -> dict:
+        if self.etag is None:
+            return {}
+        return {"ETag": self.etag, "Cache-Control": self.cache_control}
+
+    def not_modified(self, if_none_match: str | None) -> bool:
+        """
+        Checks an ``If-None-Match`` request header against the ETag, using the weak comparison required by
+        RFC 9110. ``*`` is not matched: it is checked before the result is looked up, when it is not yet known
+        whether a current representation exists.
+
+        :param if_none_match: Value of the request header, if any.
+        :return: True if the client already holds the current result.
+        """
+        if self.etag is None or not if_none_match:
+            return False
+        tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return self.etag in tags
+
+    @staticmethod
+    def _cache_control(published_at: float | None) -> str:
+        """
+        Builds the Cache-Control header. With ``DATASET_REFRESH_INTERVAL`` set, results may be reused until the
+        next expected refresh; otherwise, or once the refresh is overdue, they must be revalidated on every use.
+        """
+        refresh_interval = ENVIRONMENT.dataset_refresh_interval
+        if not refresh_interval or published_at is None:
+            return "no-cache"
+        max_age = int(published_at + refresh_interval - time.time())
+        return f"public, max-age={max_age}" if max_age > 0 else "no-cache"
+
+
+async def get_cache_validators(request: Request, tv_query_cache: TvDataQueryCache,
+                               *query: str) -> tuple[CacheValidators, Response | None]:
+    """
+    Builds the caching headers of a query and answers conditional requests.
+
+    The dataset version is read from the query cache, which checks Redis at most once per
+    ``QUERY_CACHE_VERSION_CHECK_INTERVAL``, so a 304 is answered without touching Redis or the dataset.
+
+    :param request: The incoming request.
+    :param tv_query_cache: The query cache of the worker.
+    :param query: Name of the endpoint followed by the query parameters.
+    :return: Tuple containing the validators and, if the client already holds the current result, the 304
+             response to send instead of the result.
+    """
+    version = await tv_query_cache.get_dataset_version_async()
+    validators = CacheValidators(version, tv_query_cache.dataset_info.get("published_at"), *query)
+    if validators.not_modified(request.headers.get("if-none-match")):
+        return validators, Response(status_code=304, headers=validators.headers)
+    return validators, None
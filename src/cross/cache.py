@@ -0,0 +1,92 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable
+
+
+class LRUCache:
+    """
+    Thread-safe least-recently-used cache bounded by the estimated size of its entries.
+    """
+
+    def __init__(self, max_bytes: int):
+        """
+        Initializes the cache.
+
+        :param max_bytes: Maximum estimated size, in bytes, of all entries together.
+        """
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Retrieves an entry and marks it as the most recently used.
+
+        :param key: The key of the entry.
+        :param default: Value returned when the key is not cached.
+        :return: The cached value, or the default if not found.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key: Hashable, value: Any, size: int) -> None:
+        """
+        Stores an entry, evicting the least recently used ones until it fits.
+
+        Entries larger than the whole cache are not stored.
+
+        :param key: The key of the entry.
+        :param value: The value to be cached.
+        :param size: Estimated size of the value in bytes.
+        """
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self.current_bytes -= self._entries.pop(key)[1]
+
+            while self._entries and self.current_bytes + size > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_size
+                self.evictions += 1
+
+            self._entries[key] = (value, size)
+            self.current_bytes += size
+
+    def clear(self) -> None:
+        """
+        Removes every entry from the cache.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def stats(self) -> dict:
+        """
+        Reports the usage counters of the cache.
+
+        :return: Dictionary with hits, misses, hit ratio, evictions, entries and sizes.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+            }
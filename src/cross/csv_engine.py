@@ -0,0 +1,216 @@
+import functools
+import io
+from typing import BinaryIO, Dict, Iterator
+
+import pandas as pd
+
+ENGINES = ("arrow", "pandas")
+DELIMITERS = (",", ";", "\t", "|")
+SNIFF_BYTES = 64 * 1024
+
+
+class CsvSchema:
+    """
+    Column types of a CSV file, applied while the file is parsed.
+
+    Types are ``category``, ``string``, ``float64``, ``Int64`` or ``date``. Date columns are parsed with the
+    format given in ``date_formats``; values that do not match the format are read as missing.
+    Columns missing from the file are ignored.
+    """
+
+    def __init__(self, dtypes: Dict[str, str], date_formats: Dict[str, str] = None):
+        """
+        Initializes the schema.
+
+        :param dtypes: Dictionary mapping column names to their type.
+        :param date_formats: (Optional) Dictionary mapping every date column to its ``strptime`` format.
+        :raises ValueError: If a date column has no format.
+        """
+        date_formats = date_formats or {}
+        missing = [column for column, dtype in dtypes.items() if dtype == "date" and column not in date_formats]
+        if missing:
+            raise ValueError(f"Missing date format for columns {', '.join(missing)}.")
+        self.dtypes = dtypes
+        self.date_formats = date_formats
+
+    @property
+    def pandas_dtypes(self) -> dict:
+        """
+        Column dtypes for ``pd.read_csv``. Date columns are read as strings and converted by the caller.
+        """
+        return {column: "string" if dtype == "date" else dtype for column, dtype in self.dtypes.items()}
+
+
+class CsvEngine:
+    """
+    Parses CSV files into DataFrames, detecting the delimiter from the header line.
+
+    The ``arrow`` engine parses blocks of the file on every core with the pyarrow CSV reader, decodes the typed
+    columns while parsing and returns Arrow-backed DataFrames, with categorical columns as pandas categoricals
+    and date columns as ``timestamp[s]``. The ``pandas`` engine uses ``pd.read_csv`` and leaves the date columns as
+    strings. pyarrow is imported on first use.
+    """
+
+    def __init__(self, engine: str = "arrow", block_size: int = 1 << 20):
+        """
+        Initializes the engine.
+
+        :param engine: Parser to use, ``arrow`` or ``pandas``.
+        :param block_size: Size in bytes of the blocks parsed in parallel by the ``arrow`` engine.
+        :raises ValueError: If the engine is unknown.
+        """
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown CSV engine {engine}, expected one of {', '.join(ENGINES)}.")
+        self.engine = engine
+        self.block_size = block_size
+
+    @classmethod
+    def from_settings(cls) -> "CsvEngine":
+        from src.domain.core.config import ENVIRONMENT
+
+        return cls(ENVIRONMENT.csv_engine, ENVIRONMENT.csv_block_size)
+
+    def read(self, source: bytes | str | BinaryIO, schema: CsvSchema = None) -> pd.DataFrame:
+        """
+        Parses a whole CSV file.
+
+        :param source: Content of the file, path of the file or binary file object.
+        :param schema: (Optional) Column types applied while parsing.
+        :return: DataFrame containing the CSV data.
+        """
+        with _open(source) as stream:
+            delimiter = sniff_delimiter(stream.peek(SNIFF_BYTES))
+            if self.engine == "pandas":
+                return pd.read_csv(stream, sep=delimiter, dtype=schema.pandas_dtypes if schema else None)
+
+            table = _pyarrow_csv().read_csv(_arrow_input(source, stream), **self._arrow_options(delimiter, schema))
+            return _to_pandas(table, schema)
+
+    def read_in_chunks(self, source: bytes | str | BinaryIO, chunksize: int,
+                       schema: CsvSchema = None) -> Iterator[pd.DataFrame]:
+        """
+        Parses a CSV file as a sequence of DataFrames, so only the current chunk is held in memory.
+
+        :param source: Content of the file, path of the file or binary file object.
+        :param chunksize: Maximum number of rows per chunk.
+        :param schema: (Optional) Column types applied while parsing.
+        :return: Iterator over the DataFrame chunks.
+        """
+        with _open(source) as stream:
+            delimiter = sniff_delimiter(stream.peek(SNIFF_BYTES))
+            if self.engine == "pandas":
+                with pd.read_csv(stream, sep=delimiter, dtype=schema.pandas_dtypes if schema else None,
+                                 chunksize=chunksize) as reader:
+                    yield from reader
+                return
+
+            import pyarrow as pa
+
+            reader = _pyarrow_csv().open_csv(_arrow_input(source, stream), **self._arrow_options(delimiter, schema))
+            batches, rows, chunks = [], 0, 0
+            for batch in reader:
+                batches.append(batch)
+                rows += batch.num_rows
+                while rows >= chunksize:
+                    table = pa.Table.from_batches(batches, reader.schema)
+                    yield _to_pandas(table.slice(0, chunksize), schema)
+                    batches, rows, chunks = table.slice(chunksize).to_batches(), rows - chunksize, chunks + 1
+            if rows or not chunks:
+                yield _to_pandas(pa.Table.from_batches(batches, reader.schema), schema)
+
+    def _arrow_options(self, delimiter: str, schema: CsvSchema | None) -> dict:
+        import pyarrow as pa
+
+        csv = _pyarrow_csv()
+        arrow_types = {
+            "category": pa.dictionary(pa.int32(), pa.string()),
+            # dates repeat a lot, so only the distinct values are parsed, see _parse_dates
+            "date": pa.dictionary(pa.int32(), pa.string()),
+            "string": pa.string(),
+            "float64": pa.float64(),
+            "Int64": pa.int64(),
+        }
+        column_types = {column: arrow_types[dtype] for column, dtype in (schema.dtypes if schema else {}).items()}
+        return {
+            "read_options": csv.ReadOptions(use_threads=True, block_size=self.block_size),
+            "parse_options": csv.ParseOptions(delimiter=delimiter),
+            "convert_options": csv.ConvertOptions(column_types=column_types, strings_can_be_null=True),
+        }
+
+
+def sniff_delimiter(sample: bytes) -> str:
+    """
+    Detects the delimiter of a CSV file as the candidate found most often in its header line.
+
+    :param sample: First bytes of the file.
+    :return: The delimiter, ``,`` if none of the candidates appears in the header.
+    """
+    header = sample.split(b"\n", 1)[0]
+    counts = {delimiter: header.count(delimiter.encode()) for delimiter in DELIMITERS}
+    delimiter = max(counts, key=counts.get)
+    return delimiter if counts[delimiter] else ","
+
+
+def _open(source: bytes | str | BinaryIO) -> io.BufferedReader:
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return io.BufferedReader(io.BytesIO(source), SNIFF_BYTES)
+    if isinstance(source, str):
+        return open(source, "rb", buffering=SNIFF_BYTES)
+    return io.BufferedReader(_RawStream(source), SNIFF_BYTES)
+
+
+def _arrow_input(source: bytes | str | BinaryIO, stream: io.BufferedReader):
+    # in-memory content and local files are handed to Arrow directly, avoiding reads through Python
+    import pyarrow as pa
+
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return pa.BufferReader(source)
+    if isinstance(source, str):
+        return pa.OSFile(source)
+    return stream
+
+
+class _RawStream(io.RawIOBase):
+    # adapts streams that only implement read(), like the S3 response body, so they can be peeked at
+    def __init__(self, stream):
+        self._stream = stream
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self._stream.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+
+def _to_pandas(table, schema: CsvSchema | None) -> pd.DataFrame:
+    import pyarrow as pa
+
+    for column, date_format in (schema.date_formats if schema else {}).items():
+        position = table.schema.get_field_index(column)
+        if position >= 0:
+            table = table.set_column(position, column, _parse_dates(table.column(column), date_format))
+    return table.to_pandas(types_mapper=lambda arrow_type: None if pa.types.is_dictionary(arrow_type)
+                           else pd.ArrowDtype(arrow_type))
+
+
+def _parse_dates(column, date_format: str):
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    chunks = []
+    for chunk in column.chunks:
+        dictionary = chunk.dictionary
+        dates = pc.strptime(dictionary, format=date_format, unit="s", error_is_null=True)
+        # strptime normalizes impossible dates such as 31/02, keep only the dates that format back to their text
+        dates = pc.if_else(pc.equal(pc.strftime(dates, format=date_format), dictionary), dates, None)
+        chunks.append(dates.take(chunk.indices))
+    return pa.chunked_array(chunks, pa.timestamp("s"))
+
+
+@functools.cache
+def _pyarrow_csv():
+    import pyarrow.csv
+
+    return pyarrow.csv
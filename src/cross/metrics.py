@@ -0,0 +1,149 @@
+import functools
+import inspect
+import os
+import time
+from typing import Callable
+
+from prometheus_client import (CONTENT_TYPE_LATEST, CollectorRegistry, Counter, Gauge, Histogram, REGISTRY,
+                               generate_latest, multiprocess, push_to_gateway)
+
+STAGE_DURATION = Histogram(
+    "tv_data_stage_duration_seconds", "Duration of the ingestion stages.", ["stage"],
+    buckets=(0.01, 0.05, 0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600)
+)
+STAGE_ROWS = Counter("tv_data_stage_rows", "Rows processed by the ingestion stages.", ["stage"])
+REDIS_COMMAND_DURATION = Histogram(
+    "tv_data_redis_command_duration_seconds", "Latency of the Redis commands issued by the repositories.",
+    ["command"], buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5)
+)
+REDIS_PAYLOAD_BYTES = Histogram(
+    "tv_data_redis_payload_bytes", "Size of the values sent to and read from Redis.", ["command", "direction"],
+    buckets=(64, 256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "tv_data_http_request_duration_seconds", "Latency of the API requests.", ["method", "handler", "status"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+)
+DATASET_VERSION = Gauge("tv_data_dataset_version", "Version of the dataset served by the API.",
+                        multiprocess_mode="max")
+DATASET_PROGRAMS = Gauge("tv_data_dataset_programs", "Number of programs in the served dataset.",
+                         multiprocess_mode="max")
+DATASET_PUBLISHED = Gauge("tv_data_dataset_published_timestamp_seconds",
+                          "Unix time at which the served dataset was published.", multiprocess_mode="max")
+DATASET_AGE = Gauge("tv_data_dataset_age_seconds", "Seconds since the served dataset was published. Not "
+                    "reported in multiprocess mode, use the published timestamp instead.")
+
+
+def observe_rows(stage: str, rows: int) -> None:
+    STAGE_ROWS.labels(stage).inc(rows)
+
+
+def observe_dataset(version: str | None, info: dict) -> None:
+    """
+    Updates the dataset gauges after the API switched to a new dataset version.
+
+    :param version: The dataset version.
+    :param info: Dataset information published by the ingestion, see ``TvDataWriter.commit``.
+    """
+    DATASET_VERSION.set(int(version or 0))
+    DATASET_PROGRAMS.set(info.get("programs", 0))
+    published_at = info.get("published_at")
+    if published_at is not None:
+        DATASET_PUBLISHED.set(published_at)
+        DATASET_AGE.set_function(lambda: time.time() - published_at)
+
+
+def payload_size(value) -> int:
+    """
+    Estimates the number of bytes of a Redis request or reply.
+
+    :param value: A string, a number, or a list, set or dictionary of those.
+    :return: Size in bytes, 0 for unknown types.
+    """
+    if isinstance(value, (str, bytes, memoryview)):
+        return len(value)
+    if isinstance(value, (int, float)):
+        return 8
+    if isinstance(value, dict):
+        return sum(payload_size(item) for item in value.values())
+    if isinstance(value, (list, tuple, set)):
+        return sum(payload_size(item) for item in value)
+    return 0
+
+
+def instrument_command(command: str | Callable[[dict], str], request_argument: str = None):
+    """
+    Decorates a repository method to observe the latency and payload sizes of its Redis command.
+
+    Commands buffered in a pipeline are not observed individually; the pipeline execution is observed instead.
+
+    :param command: Name of the command, used as the metric label, or a function returning the name from the
+                    arguments of the call, for methods issuing different commands.
+    :param request_argument: (Optional) Name of the argument holding the values sent to Redis.
+    :return: The decorator.
+    """
+    def decorator(method):
+        signature = inspect.signature(method)
+
+        def observe(self, start, reply, args, kwargs):
+            elapsed = time.perf_counter() - start
+            arguments = None
+            if callable(command) or request_argument is not None:
+                arguments = signature.bind(self, *args, **kwargs)
+                arguments.apply_defaults()
+                arguments = arguments.arguments
+            label = command(arguments) if callable(command) else command
+            REDIS_COMMAND_DURATION.labels(label).observe(elapsed)
+            if request_argument is not None:
+                REDIS_PAYLOAD_BYTES.labels(label, "sent").observe(payload_size(arguments.get(request_argument)))
+            if reply is not None:
+                REDIS_PAYLOAD_BYTES.labels(label, "received").observe(payload_size(reply))
+
+        if inspect.iscoroutinefunction(method):
+            @functools.wraps(method)
+            async def async_wrapper(self, *args, **kwargs):
+                if self.pipelined:
+                    return await method(self, *args, **kwargs)
+                start = time.perf_counter()
+                reply = await method(self, *args, **kwargs)
+                observe(self, start, reply, args, kwargs)
+                return reply
+
+            return async_wrapper
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if self.pipelined:
+                return method(self, *args, **kwargs)
+            start = time.perf_counter()
+            reply = method(self, *args, **kwargs)
+            observe(self, start, reply, args, kwargs)
+            return reply
+
+        return wrapper
+
+    return decorator
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """
+    Renders every metric in the Prometheus text format. When ``PROMETHEUS_MULTIPROC_DIR`` is set, the metrics of
+    every server worker are aggregated.
+
+    :return: Tuple containing the rendered metrics and their content type.
+    """
+    registry = REGISTRY
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def push_metrics(gateway: str, job: str) -> None:
+    """
+    Pushes every metric of a batch process to a Prometheus Pushgateway.
+
+    :param gateway: Address of the Pushgateway.
+    :param job: Name of the job, used as the grouping key.
+    """
+    push_to_gateway(gateway, job=job, registry=REGISTRY)
@@ -0,0 +1,81 @@
+import queue
+import threading
+from typing import Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+_POLL_SECONDS = 0.1
+
+
+class Prefetcher(Iterator[T]):
+    """
+    Iterates over an iterable in a background thread, keeping up to ``depth`` items ready ahead of the consumer.
+
+    The thread starts on creation, so downloading and parsing the items overlaps with whatever the caller does
+    before and while consuming them. Exceptions raised by the iterable are re-raised to the consumer. Closing the
+    prefetcher stops the thread and closes the iterable.
+    """
+
+    def __init__(self, iterable: Iterable[T], depth: int):
+        """
+        Initializes the prefetcher and starts the background thread.
+
+        :param iterable: Iterable producing the items, e.g. the chunks of a CSV file.
+        :param depth: Maximum number of items produced ahead of the consumer.
+        :raises ValueError: If the depth is not a positive integer.
+        """
+        if depth < 1:
+            raise ValueError("The prefetch depth must be a positive integer.")
+
+        self._items = queue.Queue(maxsize=depth)
+        self._stopped = threading.Event()
+        self._done = False
+        self._thread = threading.Thread(target=self._produce, args=(iter(iterable),), name="prefetch", daemon=True)
+        self._thread.start()
+
+    def __next__(self) -> T:
+        if self._done:
+            raise StopIteration
+        finished, item = self._items.get()
+        if finished:
+            self._done = True
+            if item is not None:
+                raise item
+            raise StopIteration
+        return item
+
+    def __enter__(self) -> "Prefetcher[T]":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Stops the background thread. Items not consumed yet are discarded.
+        """
+        self._done = True
+        self._stopped.set()
+
+    def _produce(self, iterator: Iterator[T]) -> None:
+        try:
+            for item in iterator:
+                if not self._put((False, item)):
+                    return
+            self._put((True, None))
+        except BaseException as e:
+            self._put((True, e))
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+
+    def _put(self, entry: tuple) -> bool:
+        # a consumer that stopped early never drains the queue, so waiting for room is bounded by the stop event
+        while not self._stopped.is_set():
+            try:
+                self._items.put(entry, timeout=_POLL_SECONDS)
+                return True
+            except queue.Full:
+                pass
+        return False
@@ -0,0 +1,53 @@
+import sys
+import threading
+from collections import Counter
+
+
+class SamplingProfiler:
+    """
+    Statistical profiler that samples the call stack of a single thread at a fixed interval from a background
+    thread, so the profiled code runs unmodified.
+
+    Samples are aggregated as folded stacks (``outer;inner;leaf count`` lines), the input format of flame graph
+    tools. When profiling an event loop thread, the samples include every task the loop ran meanwhile.
+    """
+
+    def __init__(self, interval: float = 0.001, thread_id: int = None):
+        """
+        Initializes the profiler.
+
+        :param interval: Seconds between samples.
+        :param thread_id: (Optional) Identifier of the sampled thread. Defaults to the calling thread.
+        """
+        self.interval = interval
+        self.thread_id = threading.get_ident() if thread_id is None else thread_id
+        self.samples = Counter()
+        self._stopped = threading.Event()
+        self._sampler = threading.Thread(target=self._sample, name="sampling-profiler", daemon=True)
+
+    def __enter__(self):
+        self._sampler.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stopped.set()
+        self._sampler.join()
+
+    def folded(self) -> str:
+        """
+        Renders the collected samples.
+
+        :return: One ``frame;frame;frame count`` line per distinct stack, most frequent first.
+        """
+        return "\n".join(f"{stack} {count}" for stack, count in self.samples.most_common())
+
+    def _sample(self) -> None:
+        while not self._stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({code.co_filename}:{frame.f_lineno})")
+                frame = frame.f_back
+            if stack:
+                self.samples[";".join(reversed(stack))] += 1
@@ -0,0 +1,135 @@
+import functools
+import threading
+import zlib
+
+import orjson
+
+HEADER_MARKER = 0
+FORMATS = {"json": 1, "msgpack": 2}
+COMPRESSIONS = {"none": 0, "zlib": 1, "zstd": 2, "lz4": 3}
+
+_contexts = threading.local()
+
+
+class Serializer:
+    """
+    Encodes structured values for storage, optionally compressed.
+
+    Encoded values start with a three byte header: a zero marker, the format id and the compression id. A zero
+    byte never starts a JSON document, so values written before the header existed are still read as plain JSON.
+    With the ``json`` format and no compression values are written without a header, exactly like the legacy
+    encoding, so older readers keep working until every reader understands the header.
+
+    msgpack, zstandard and lz4 are imported on first use, so only the configured codecs have to be installed.
+    """
+
+    def __init__(self, format: str = "json", compression: str = "none", compression_min_bytes: int = 0):
+        """
+        Initializes the serializer.
+
+        :param format: Encoding of the values, ``json`` or ``msgpack``.
+        :param compression: Compression of the encoded values, ``none``, ``zlib``, ``zstd`` or ``lz4``.
+        :param compression_min_bytes: Encoded values shorter than this are stored uncompressed, since the
+                                      compression frame would outweigh the savings.
+        :raises ValueError: If the format or the compression is unknown.
+        """
+        if format not in FORMATS:
+            raise ValueError(f"Unknown serialization format {format}, expected one of {', '.join(FORMATS)}.")
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Unknown compression {compression}, expected one of {', '.join(COMPRESSIONS)}.")
+        self.format = format
+        self.compression = compression
+        self.compression_min_bytes = compression_min_bytes
+
+    @classmethod
+    def from_settings(cls) -> "Serializer":
+        from src.domain.core.config import ENVIRONMENT
+
+        return cls(ENVIRONMENT.redis_value_format, ENVIRONMENT.redis_value_compression,
+                   ENVIRONMENT.redis_value_compression_min_bytes)
+
+    @property
+    def headerless(self) -> bool:
+        return self.format == "json" and self.compression == "none"
+
+    def dumps(self, value) -> bytes:
+        """
+        Encodes a value.
+
+        :param value: A JSON-compatible value.
+        :return: The encoded value, prefixed with the format header unless headerless.
+        """
+        payload = orjson.dumps(value) if self.format == "json" else _msgpack().packb(value)
+        if self.headerless:
+            return payload
+
+        compression = self.compression if len(payload) >= self.compression_min_bytes else "none"
+        if compression != "none":
+            payload = _compressor(compression)(payload)
+        return bytes((HEADER_MARKER, FORMATS[self.format], COMPRESSIONS[compression])) + payload
+
+    @staticmethod
+    def loads(raw: bytes | str):
+        """
+        Decodes a value written by any serializer configuration, or by the legacy plain JSON encoding.
+
+        :param raw: The encoded value.
+        :return: The decoded value.
+        :raises ValueError: If the header names an unknown format or compression.
+        """
+        if isinstance(raw, str) or not raw or raw[0] != HEADER_MARKER:
+            return orjson.loads(raw)
+
+        format_id, compression_id, payload = raw[1], raw[2], memoryview(raw)[3:]
+        if compression_id == COMPRESSIONS["zlib"]:
+            payload = zlib.decompress(payload)
+        elif compression_id == COMPRESSIONS["zstd"]:
+            payload = _zstd_decompressor().decompress(payload)
+        elif compression_id == COMPRESSIONS["lz4"]:
+            payload = _lz4().decompress(payload)
+        elif compression_id != COMPRESSIONS["none"]:
+            raise ValueError(f"Unknown compression id {compression_id}.")
+
+        if format_id == FORMATS["json"]:
+            return orjson.loads(payload)
+        if format_id == FORMATS["msgpack"]:
+            return _msgpack().unpackb(payload)
+        raise ValueError(f"Unknown serialization format id {format_id}.")
+
+
+@functools.cache
+def _msgpack():
+    import msgpack
+
+    return msgpack
+
+
+@functools.cache
+def _lz4():
+    import lz4.frame
+
+    return lz4.frame
+
+
+def _zstd_decompressor():
+    # zstandard contexts are not thread safe, so every thread keeps its own
+    decompressor = getattr(_contexts, "zstd_decompressor", None)
+    if decompressor is None:
+        import zstandard
+
+        decompressor = _contexts.zstd_decompressor = zstandard.ZstdDecompressor()
+    return decompressor
+
+
+def _compressor(compression: str):
+    if compression == "zlib":
+        return zlib.compress
+    if compression == "lz4":
+        return _lz4().compress
+
+    compressor = getattr(_contexts, "zstd_compressor", None)
+    if compressor is None:
+        import zstandard
+
+        compressor = _contexts.zstd_compressor = zstandard.ZstdCompressor(level=3)
+    return compressor.compress
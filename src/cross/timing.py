@@ -0,0 +1,54 @@
+import logging
+import time
+from contextlib import contextmanager
+from typing import Dict, List
+
+from src.cross.metrics import STAGE_DURATION
+
+logger = logging.getLogger(__name__)
+
+_collectors: List[Dict[str, float]] = []
+
+
+@contextmanager
+def log_duration(stage: str):
+    """
+    Logs the wall-clock duration of a block of code.
+
+    :param stage: Name of the timed stage, used in the log line.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_duration(stage, time.perf_counter() - start)
+
+
+def record_duration(stage: str, seconds: float) -> None:
+    """
+    Logs the duration of a stage timed elsewhere, e.g. in a worker process, observes it in the stage duration
+    metric and adds it to the active collectors.
+
+    :param stage: Name of the timed stage, used in the log line.
+    :param seconds: Duration of the stage.
+    """
+    logger.info(f"Stage '{stage}' took {seconds:.3f}s.")
+    STAGE_DURATION.labels(stage).observe(seconds)
+    for durations in _collectors:
+        durations[stage] = durations.get(stage, 0.0) + seconds
+
+
+@contextmanager
+def collect_durations():
+    """
+    Collects the durations of every stage timed while the context is active. Stages timed more than once are
+    summed.
+
+    :return: Context manager yielding a dictionary mapping stage names to seconds, filled as stages complete.
+    """
+    durations = {}
+    _collectors.append(durations)
+    try:
+        yield durations
+    finally:
+        _collectors.remove(durations)
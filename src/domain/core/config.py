@@ -18,8 +18,48 @@ class Settings(BaseSettings):
     aws_region_name: SecretStr = Field(SecretStr(""), validation_alias="AWS_REGION_NAME")
     redis_host: str = Field("localhost", validation_alias="REDIS_HOST")
     redis_port: int = Field(default=6379, validation_alias="REDIS_PORT")
-    redis_user: str = Field(validation_alias="REDIS_HOST")
-    redis_password: SecretStr = Field(validation_alias="REDIS_PASSWORD")
+    redis_user: str = Field("", validation_alias="REDIS_USER")
+    redis_password: SecretStr = Field(SecretStr(""), validation_alias="REDIS_PASSWORD")
+    redis_max_connections: int = Field(default=50, validation_alias="REDIS_MAX_CONNECTIONS")
+    redis_cluster: bool = Field(default=False, validation_alias="REDIS_CLUSTER")
+    redis_read_from_replicas: bool = Field(default=False, validation_alias="REDIS_READ_FROM_REPLICAS")
+    redis_value_format: str = Field(default="json", validation_alias="REDIS_VALUE_FORMAT")
+    redis_value_compression: str = Field(default="none", validation_alias="REDIS_VALUE_COMPRESSION")
+    redis_value_compression_min_bytes: int = Field(default=256, validation_alias="REDIS_VALUE_COMPRESSION_MIN_BYTES")
+    s3_multipart_threshold: int = Field(default=16 * 1024 * 1024, validation_alias="S3_MULTIPART_THRESHOLD")
+    s3_part_size: int = Field(default=8 * 1024 * 1024, validation_alias="S3_PART_SIZE")
+    s3_max_concurrency: int = Field(default=8, validation_alias="S3_MAX_CONCURRENCY")
+    ingestion_parallel: bool = Field(default=True, validation_alias="INGESTION_PARALLEL")
+    ingestion_prefetch_chunks: int = Field(default=2, validation_alias="INGESTION_PREFETCH_CHUNKS")
+    ingestion_process_workers: int = Field(default=2, validation_alias="INGESTION_PROCESS_WORKERS")
+    ingestion_incremental: bool = Field(default=False, validation_alias="INGESTION_INCREMENTAL")
+    ingestion_from_snapshot: bool = Field(default=False, validation_alias="INGESTION_FROM_SNAPSHOT")
+    ingestion_shards: int = Field(default=1, validation_alias="INGESTION_SHARDS")
+    ingestion_shard_index: int | None = Field(default=None, validation_alias="JOB_COMPLETION_INDEX")
+    ingestion_run_id: str = Field(default="", validation_alias="INGESTION_RUN_ID")
+    csv_chunk_size: int = Field(default=250_000, validation_alias="CSV_CHUNK_SIZE")
+    csv_engine: str = Field(default="arrow", validation_alias="CSV_ENGINE")
+    csv_block_size: int = Field(default=1024 * 1024, validation_alias="CSV_BLOCK_SIZE")
+    api_host: str = Field(default="0.0.0.0", validation_alias="API_HOST")
+    api_port: int = Field(default=8000, validation_alias="API_PORT")
+    api_workers: int = Field(default=1, validation_alias="API_WORKERS")
+    api_reload: bool = Field(default=False, validation_alias="API_RELOAD")
+    api_fast_responses: bool = Field(default=True, validation_alias="API_FAST_RESPONSES")
+    bulk_query_max_items: int = Field(default=1000, validation_alias="BULK_QUERY_MAX_ITEMS")
+    api_profiling_enabled: bool = Field(default=False, validation_alias="API_PROFILING_ENABLED")
+    api_profiling_interval: float = Field(default=0.001, validation_alias="API_PROFILING_INTERVAL")
+    api_profile_dir: str = Field(default="/tmp/profiles", validation_alias="API_PROFILE_DIR")
+    prometheus_pushgateway: str = Field(default="", validation_alias="PROMETHEUS_PUSHGATEWAY")
+    snapshot_path: str = Field(default="", validation_alias="SNAPSHOT_PATH")
+    snapshot_bucket: str = Field(default="", validation_alias="SNAPSHOT_BUCKET")
+    api_data_source: str = Field(default="redis", validation_alias="API_DATA_SOURCE")
+    history_window_size: int = Field(default=4, validation_alias="HISTORY_WINDOW_SIZE")
+    redis_pipeline_batch_size: int = Field(default=500, validation_alias="REDIS_PIPELINE_BATCH_SIZE")
+    tv_data_validation_sample_size: int = Field(default=100, validation_alias="TV_DATA_VALIDATION_SAMPLE_SIZE")
+    query_cache_max_bytes: int = Field(default=64 * 1024 * 1024, validation_alias="QUERY_CACHE_MAX_BYTES")
+    query_cache_version_check_interval: float = Field(default=5.0,
+                                                      validation_alias="QUERY_CACHE_VERSION_CHECK_INTERVAL")
+    dataset_refresh_interval: int = Field(default=0, validation_alias="DATASET_REFRESH_INTERVAL")
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -1,6 +1,10 @@
 from abc import ABC, abstractmethod
+from typing import Iterator
+
 import pandas as pd
 
+from src.cross.csv_engine import CsvSchema
+
 
 class ICsvRepository(ABC):
     """
@@ -8,12 +12,37 @@ class ICsvRepository(ABC):
     """
 
     @abstractmethod
-    def fetch_csv_as_dataframe(self, file_key: str) -> pd.DataFrame:
+    def fetch_csv_as_dataframe(self, file_key: str, schema: CsvSchema = None) -> pd.DataFrame:
         """
         Retrieves a CSV file and loads it as a Pandas DataFrame.
 
         :param file_key: Path to the CSV file.
+        :param schema: (Optional) Column types applied while parsing. Columns missing from the file are ignored.
         :return: DataFrame containing the CSV data.
         :raises NotImplementedError: If the method is not implemented by a subclass.
         """
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
+
+    @abstractmethod
+    def fetch_csv_bytes(self, file_key: str) -> bytes:
+        """
+        Retrieves the raw content of a CSV file, leaving the parsing to the caller.
+
+        :param file_key: Path to the CSV file.
+        :return: The content of the file.
+        :raises NotImplementedError: If the method is not implemented by a subclass.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def fetch_csv_in_chunks(self, file_key: str, chunksize: int, schema: CsvSchema = None) -> Iterator[pd.DataFrame]:
+        """
+        Streams a CSV file as a sequence of Pandas DataFrames of at most ``chunksize`` rows.
+
+        :param file_key: Path to the CSV file.
+        :param chunksize: Maximum number of rows per chunk.
+        :param schema: (Optional) Column types applied while parsing. Columns missing from the file are ignored.
+        :return: Iterator over the DataFrame chunks.
+        :raises NotImplementedError: If the method is not implemented by a subclass.
+        """
+        raise NotImplementedError
@@ -1,11 +1,19 @@
 from abc import ABC, abstractmethod
+from contextlib import AbstractContextManager
+from typing import Iterable, List
+
+from src.cross.serialization import Serializer
 
 
 class IDataBaseRepository(ABC):
     """
     Interface for a database repository that defines methods for setting up connections,
     storing, and retrieving data.
+
+    ``serializer`` encodes structured values before they are stored; values it produced are read back with
+    ``raw=True`` and decoded with ``Serializer.loads``.
     """
+    serializer: Serializer = Serializer()
 
     @classmethod
     @abstractmethod
@@ -35,7 +43,21 @@ class IDataBaseRepository(ABC):
 
         :param key: The key under which the value will be stored.
         :param value: The value to be stored in the database.
-        :param expiration_time: (Optional) Expiration time in seconds.
+        :param expiration_time: (Optional) Expiration time in seconds. 0 disables expiration.
+        :raises NotImplementedError: If the method is not implemented by a subclass.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def create_if_absent(self, key: str, value: bytes | memoryview | str | int | float,
+                         expiration_time: int = None) -> bool:
+        """
+        Atomically stores a value unless the key already exists.
+
+        :param key: The key under which the value will be stored.
+        :param value: The value to be stored in the database.
+        :param expiration_time: (Optional) Expiration time in seconds. 0 disables expiration.
+        :return: Whether the value was stored.
         :raises NotImplementedError: If the method is not implemented by a subclass.
         """
         raise NotImplementedError
@@ -49,4 +71,123 @@ class IDataBaseRepository(ABC):
         :return: The value associated with the given key.
         :raises NotImplementedError: If the method is not implemented by a subclass.
         """
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
+
+    @abstractmethod
+    def create_hash(self, key: str, mapping: dict, expiration_time: int = None) -> None:
+        """
+        Stores the fields of a hash.
+
+        :param key: The key of the hash.
+        :param mapping: Dictionary mapping hash fields to their values.
+        :param expiration_time: (Optional) Expiration time in seconds. 0 disables expiration.
+        :raises NotImplementedError: If the method is not implemented by a subclass.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_hash_values(self, key: str, fields: List[str] = None, raw: bool = False) -> list:
+        """
+        Retrieves values from a hash.
+
+        :param key: The key of the hash.
+        :param fields: (Optional) Fields to fetch. All values of the hash are returned if not provided.
+        :param raw: (Optional) Whether to return the values undecoded, as written by the serializer.
+        :return: The values of the requested fields.
+        :raises NotImplementedError: If the method is not implemented by a subclass.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def add_to_set(self, key: str, members: Iterable[str], expiration_time: int = None) -> None:
+        """
+        Adds members to a set.
+
+        :param key: The key of the set.
+        :param members: The members to be added.
+        :param expiration_time: (Optional) Expiration time in seconds. 0 disables expiration.
+        :raises NotImplementedError: If the method is not implemented by a subclass.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_set_members(self, key: str) -> set:
+        """
+        Retrieves all members of a set.
+
+        :param key: The key of the set.
+        :return: The members of the set.
+        :raises NotImplementedError: If the method is not implemented by a subclass.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def add_to_sorted_set(self, key: str, mapping: dict, expiration_time: int = None) -> None:
+        """
+        Adds scored members to a sorted set.
+
+        :param key: The key of the sorted set.
+        :param mapping: Dictionary mapping members to their scores.
+        :param expiration_time: (Optional) Expiration time in seconds. 0 disables expiration.
+        :raises NotImplementedError: If the method is not implemented by a subclass.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def range_by_score(self, key: str, min_score: float, max_score: float) -> list:
+        """
+        Retrieves the members of a sorted set whose score lies within an inclusive range.
+
+        :param key: The key of the sorted set.
+        :param min_score: Lower bound of the range.
+        :param max_score: Upper bound of the range.
+        :return: The members within the range, ordered by score.
+        :raises NotImplementedError: If the method is not implemented by a subclass.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def increment(self, key: str) -> int:
+        """
+        Atomically increments an integer counter, creating it if it does not exist.
+
+        :param key: The key of the counter.
+        :return: The value of the counter after the increment.
+        :raises NotImplementedError: If the method is not implemented by a subclass.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def copy(self, source: str, destination: str) -> bool:
+        """
+        Copies the value of a key to another key, replacing the destination.
+
+        :param source: The key to be copied.
+        :param destination: The key receiving the copy.
+        :return: Whether the source key existed.
+        :raises NotImplementedError: If the method is not implemented by a subclass.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, *keys: str) -> None:
+        """
+        Deletes keys from the database.
+
+        :param keys: The keys to be deleted.
+        :raises NotImplementedError: If the method is not implemented by a subclass.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def pipeline(self) -> AbstractContextManager:
+        """
+        Opens a batch in which commands are buffered and sent to the database in a single round trip on exit.
+
+        The context yields a repository bound to the batch; the replies of its commands are available in
+        its ``results`` attribute once the context exits.
+
+        :return: Context manager yielding the batched repository.
+        :raises NotImplementedError: If the method is not implemented by a subclass.
+        """
+        raise NotImplementedError
@@ -0,0 +1,67 @@
+from abc import ABC, abstractmethod
+from contextlib import AbstractContextManager
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+
+
+class ISnapshotRepository(ABC):
+    """
+    Interface for a snapshot repository that stores DataFrames in a columnar format and loads them back
+    through memory-mapping.
+    """
+
+    @abstractmethod
+    def snapshot_writer(self, name: str) -> AbstractContextManager:
+        """
+        Opens a snapshot for writing. The yielded writer exposes ``write(dataframe)``, which appends the rows of a
+        DataFrame; the snapshot is published when the context exits.
+
+        :param name: Name of the snapshot.
+        :return: Context manager yielding the snapshot writer.
+        :raises NotImplementedError: If the method is not implemented by a subclass.
+        """
+        raise NotImplementedError
+
+    def write_snapshot(self, name: str, dataframe: "pd.DataFrame") -> None:
+        """
+        Stores a DataFrame as a snapshot, replacing any previous snapshot with the same name.
+
+        :param name: Name of the snapshot.
+        :param dataframe: DataFrame to be stored.
+        """
+        with self.snapshot_writer(name) as writer:
+            writer.write(dataframe)
+
+    @abstractmethod
+    def read_table(self, name: str) -> "pa.Table | None":
+        """
+        Loads a snapshot as a memory-mapped Arrow table.
+
+        :param name: Name of the snapshot.
+        :return: The Arrow table, or None if the snapshot does not exist.
+        :raises NotImplementedError: If the method is not implemented by a subclass.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete_snapshot(self, name: str) -> None:
+        """
+        Deletes a snapshot. Tables already loaded from it stay readable.
+
+        :param name: Name of the snapshot.
+        :raises NotImplementedError: If the method is not implemented by a subclass.
+        """
+        raise NotImplementedError
+
+    def read_snapshot(self, name: str) -> "pd.DataFrame | None":
+        """
+        Loads a snapshot as a Pandas DataFrame.
+
+        :param name: Name of the snapshot.
+        :return: DataFrame containing the snapshot data, or None if the snapshot does not exist.
+        """
+        table = self.read_table(name)
+        return None if table is None else table.to_pandas()
@@ -0,0 +1,86 @@
+from typing import Dict, List, Tuple
+
+import pandas as pd
+
+HistoryKey = Tuple[str, str, str]
+
+
+class AudienceHistoryEngine:
+    """
+    Columnar engine that builds the audience history of every (signal, program_code, weekday) key.
+
+    The audience frame is sorted and grouped once, the last ``window_size`` rows of each group are kept
+    and the medians are computed in bulk, replacing the per-row Python loop.
+    """
+    key_columns: List[str] = ["signal", "program_code", "weekday"]
+    value_column: str = "average_audience"
+    median_column: str = "median_audience"
+    unknown_weekday: str = "Unknown"
+
+    def __init__(self, window_size: int = 4):
+        """
+        Initializes the engine.
+
+        :param window_size: Number of most recent audience records kept per key.
+        :raises ValueError: If the window size is not a positive integer.
+        """
+        if window_size < 1:
+            raise ValueError("The history window size must be a positive integer.")
+
+        self.window_size = window_size
+
+    def last_records(self, audience_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Keeps only the last ``window_size`` audience records of each key, in file order.
+
+        :param audience_df: DataFrame containing validated audience data.
+        :return: DataFrame with the key columns and the audience value, grouped by key.
+        """
+        frame = audience_df[self.key_columns + [self.value_column]].copy()
+        frame["weekday"] = frame["weekday"].fillna(self.unknown_weekday)
+
+        frame = frame.sort_values(self.key_columns, kind="stable", na_position="last")
+        return frame.groupby(self.key_columns, sort=False, dropna=False, observed=True).tail(self.window_size)
+
+    def update(self, window_df: pd.DataFrame | None, audience_chunk: pd.DataFrame) -> pd.DataFrame:
+        """
+        Folds a new chunk of audience data into the rolling window of last records.
+
+        :param window_df: Window returned by a previous call, or None for the first chunk.
+        :param audience_chunk: DataFrame containing the next validated audience rows, in file order.
+        :return: DataFrame with the last ``window_size`` records of each key seen so far.
+        """
+        if window_df is None or window_df.empty:
+            return self.last_records(audience_chunk)
+        return self.last_records(pd.concat([window_df, audience_chunk[window_df.columns]], ignore_index=True))
+
+    def medians(self, window_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Computes the median audience of every key of a window of last records.
+
+        :param window_df: DataFrame returned by ``last_records`` or ``update``.
+        :return: DataFrame with the key columns and a ``median_audience`` column.
+        """
+        grouped = window_df.groupby(self.key_columns, sort=False, dropna=False, observed=True)[self.value_column]
+        return grouped.median().rename(self.median_column).reset_index()
+
+    def build_history(self, audience_df: pd.DataFrame) -> Dict[HistoryKey, list]:
+        """
+        Builds the audience history mapping used by the prediction stage.
+
+        :param audience_df: DataFrame containing validated audience data.
+        :return: Dictionary mapping (signal, program_code, weekday) to the last audience records.
+        """
+        # list aggregation is not implemented for Arrow-backed columns
+        windowed = self.last_records(audience_df).astype({self.value_column: "float64"})
+        grouped = windowed.groupby(self.key_columns, sort=False, dropna=False, observed=True)[self.value_column]
+        return grouped.agg(list).to_dict()
+
+    def median_table(self, audience_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Computes the median audience of every key over its last ``window_size`` records.
+
+        :param audience_df: DataFrame containing validated audience data.
+        :return: DataFrame with the key columns and a ``median_audience`` column.
+        """
+        return self.medians(self.last_records(audience_df))
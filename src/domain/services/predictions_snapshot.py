@@ -0,0 +1,50 @@
+from typing import Dict, List
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from src.domain.services.record_store import RecordStore
+
+
+class PredictionsSnapshot:
+    """
+    Read-only view over a memory-mapped predictions snapshot, giving direct access to the rows of each program.
+
+    Only the row positions of each program are kept in memory; record values stay in the mapped Arrow buffers
+    until a program is requested.
+    """
+
+    def __init__(self, table: pa.Table):
+        """
+        Indexes the snapshot by program_code.
+
+        :param table: Arrow table with the TVData columns.
+        """
+        self.table = table
+        encoded = pc.dictionary_encode(table.column("program_code")).combine_chunks()
+        dictionary = encoded.dictionary.to_pylist()
+        codes = encoded.indices.fill_null(len(dictionary)).to_numpy()
+
+        order = np.argsort(codes, kind="stable")
+        bounds = np.cumsum(np.bincount(codes, minlength=len(dictionary) + 1))
+        self.rows: Dict[str, np.ndarray] = {
+            program_code: order[bounds[position] - count:bounds[position]]
+            for position, (program_code, count) in enumerate(zip(dictionary, np.diff(bounds, prepend=0)))
+        }
+
+    @property
+    def program_codes(self) -> List[str]:
+        return list(self.rows)
+
+    def records(self, program_code: str) -> RecordStore:
+        """
+        Copies the records of a program out of the mapped buffers.
+
+        :param program_code: The program code.
+        :return: RecordStore with the records, in snapshot order.
+        """
+        rows = self.rows.get(program_code)
+        if rows is None:
+            return RecordStore()
+        return RecordStore.from_columns(self.table.take(rows).to_pydict())
@@ -0,0 +1,115 @@
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from datetime import date
+from typing import Dict, Iterable, List
+
+import orjson
+
+from src.domain.entities.open_tv import TVData
+from src.domain.services.record_store import RecordStore
+
+
+class ProgramIndex:
+    """
+    Query index over the records of a single program, built once per dataset version.
+
+    Records are kept in a RecordStore sorted by exhibition date, whose array of date ordinals answers period
+    queries with binary search, and the row positions of every weekday are precomputed, so weekday queries are
+    dictionary hits. TVData objects are only materialized for the rows a query returns.
+
+    When built with ``serialize=True`` each record is also encoded to JSON once, so the ``*_payload`` methods
+    return query results as ready-made JSON arrays by joining the encoded records. Otherwise the payloads are
+    encoded on every call.
+    """
+    empty_payload: bytes = b"[]"
+
+    def __init__(self, records: RecordStore | List[TVData], serialize: bool = False):
+        """
+        Builds the index.
+
+        :param records: Every record of the program.
+        :param serialize: Whether to pre-serialize the records for the ``*_payload`` methods.
+        """
+        if not isinstance(records, RecordStore):
+            records = RecordStore.from_models(records)
+        self.serialized = serialize
+        dates = records.date_ordinals
+        self.records: RecordStore = records.take(sorted(range(len(records)), key=dates.__getitem__))
+        self.dates: array = self.records.date_ordinals
+        self.weekdays: Dict[str, array] = defaultdict(lambda: array("I"))
+        for row in range(len(self.records)):
+            self.weekdays[self.records.weekday[row]].append(row)
+
+        self.payloads: List[bytes] = []
+        if serialize:
+            self.payloads = [self._encode(self.records.row(row)) for row in range(len(self.records))]
+
+    def by_weekday(self, weekday: str) -> List[TVData]:
+        """
+        Retrieves the records exhibited on a weekday.
+
+        :param weekday: Weekday name, e.g. ``Saturday``.
+        :return: List of TVData objects ordered by exhibition date.
+        """
+        return self.records.models(self.weekdays.get(weekday, ()))
+
+    def by_period(self, start_date: date, end_date: date) -> List[TVData]:
+        """
+        Retrieves the records exhibited between two dates, both inclusive.
+
+        :param start_date: First exhibition date of the period.
+        :param end_date: Last exhibition date of the period.
+        :return: List of TVData objects ordered by exhibition date.
+        """
+        return self.records.models(self._period_rows(start_date, end_date))
+
+    def weekday_payload(self, weekday: str) -> bytes:
+        """
+        Serializes the records exhibited on a weekday.
+
+        :param weekday: Weekday name, e.g. ``Saturday``.
+        :return: JSON array of the records ordered by exhibition date.
+        """
+        return self._join_rows(self.weekdays.get(weekday, ()))
+
+    def period_payload(self, start_date: date, end_date: date) -> bytes:
+        """
+        Serializes the records exhibited between two dates, both inclusive.
+
+        :param start_date: First exhibition date of the period.
+        :param end_date: Last exhibition date of the period.
+        :return: JSON array of the records ordered by exhibition date.
+        """
+        rows = self._period_rows(start_date, end_date)
+        if self.serialized:
+            return self._join(self.payloads[rows.start:rows.stop])
+        return self._join_rows(rows)
+
+    def index_size(self) -> int:
+        """
+        Estimates the memory held by the index, including its records.
+
+        :return: Estimated size in bytes.
+        """
+        return (self.records.nbytes() + sum(rows.itemsize * len(rows) for rows in self.weekdays.values())
+                + sys.getsizeof(self.payloads) + sum(sys.getsizeof(payload) for payload in self.payloads))
+
+    def _period_rows(self, start_date: date, end_date: date) -> range:
+        start = bisect_left(self.dates, RecordStore.date_ordinal(start_date))
+        end = bisect_right(self.dates, RecordStore.date_ordinal(end_date))
+        return range(start, max(start, end))
+
+    def _join_rows(self, rows: Iterable[int]) -> bytes:
+        if self.serialized:
+            return self._join([self.payloads[row] for row in rows])
+        return self._join([self._encode(self.records.row(row)) for row in rows])
+
+    @staticmethod
+    def _encode(record: dict) -> bytes:
+        return orjson.dumps(record)
+
+    @staticmethod
+    def _join(payloads: List[bytes]) -> bytes:
+        return b"[" + b",".join(payloads) + b"]"
@@ -0,0 +1,217 @@
+import sys
+from array import array
+from datetime import date, datetime
+from typing import Dict, Hashable, Iterable, Iterator, List, Sequence
+
+from src.cross.serialization import Serializer
+from src.domain.entities.open_tv import TVData
+
+
+class DictionaryColumn:
+    """
+    Column of repeated values stored once each, with one small integer code per row.
+    """
+
+    def __init__(self, typecode: str = "I"):
+        """
+        Initializes an empty column.
+
+        :param typecode: ``array`` type code of the row codes, must fit the number of distinct values.
+        """
+        self.values: List[Hashable] = []
+        self.codes = array(typecode)
+        self._positions: Dict[Hashable, int] = {}
+
+    def append(self, value: Hashable) -> None:
+        position = self._positions.get(value)
+        if position is None:
+            position = self._positions[value] = len(self.values)
+            self.values.append(value)
+        self.codes.append(position)
+
+    def take(self, rows: Iterable[int]) -> "DictionaryColumn":
+        """
+        Copies some rows into a new column sharing the same dictionary.
+
+        :param rows: Positions of the rows, in the order of the new column.
+        :return: The new column.
+        """
+        column = DictionaryColumn(self.codes.typecode)
+        column.values, column._positions = self.values, self._positions
+        codes = self.codes
+        column.codes = array(codes.typecode, [codes[row] for row in rows])
+        return column
+
+    def nbytes(self) -> int:
+        return (self.codes.itemsize * len(self.codes) + sys.getsizeof(self.values) + sys.getsizeof(self._positions)
+                + sum(sys.getsizeof(value) for value in self.values))
+
+    def __getitem__(self, row: int) -> Hashable:
+        return self.values[self.codes[row]]
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+
+class RecordStore(Sequence[TVData]):
+    """
+    Compact, column-oriented container of TV data records for the read path.
+
+    Signals, program codes, weekdays and exhibition dates are dictionary-encoded, numbers are kept in typed arrays
+    and the exhibition date ordinal of every row is precomputed, so a record costs a few dozen bytes instead of a
+    pydantic model with its own dictionary. TVData objects are only materialized for the rows that are actually
+    returned; ``row`` gives the plain dictionary of a record for serialization.
+
+    A missing ``predicted_audience`` is stored as NaN and read back as None.
+    """
+
+    def __init__(self):
+        self.signal = DictionaryColumn()
+        self.program_code = DictionaryColumn()
+        self.weekday = DictionaryColumn("B")
+        self.exhibition_date = DictionaryColumn()
+        self.available_time = array("q")
+        self.predicted_audience = array("d")
+        self.date_ordinals = array("i")
+        self._ordinals: Dict[Hashable, int] = {}
+
+    @classmethod
+    def from_dicts(cls, records: Iterable[dict]) -> "RecordStore":
+        """
+        Builds a store from plain record dictionaries.
+
+        :param records: Dictionaries with the TVData fields.
+        :return: The record store.
+        """
+        store = cls()
+        for record in records:
+            store.append(record)
+        return store
+
+    @classmethod
+    def from_encoded(cls, raw_records: Iterable[str | bytes | None]) -> "RecordStore":
+        """
+        Builds a store from records read from Redis, skipping missing ones.
+
+        :param raw_records: Records encoded by the Serializer, or legacy JSON strings.
+        :return: The record store.
+        """
+        return cls.from_dicts(Serializer.loads(item) for item in raw_records if item)
+
+    @classmethod
+    def from_models(cls, records: Iterable[TVData]) -> "RecordStore":
+        return cls.from_dicts(record.model_dump() for record in records)
+
+    @classmethod
+    def from_columns(cls, columns: Dict[str, list]) -> "RecordStore":
+        """
+        Builds a store from a column-oriented mapping, such as ``pyarrow.Table.to_pydict()``.
+
+        :param columns: Dictionary mapping each TVData field to the list of its values.
+        :return: The record store.
+        """
+        names = list(columns)
+        return cls.from_dicts(dict(zip(names, values)) for values in zip(*columns.values()))
+
+    def append(self, record: dict) -> None:
+        """
+        Appends a record.
+
+        :param record: Dictionary with the TVData fields.
+        """
+        exhibition_date = record["exhibition_date"]
+        ordinal = self._ordinals.get(exhibition_date)
+        if ordinal is None:
+            ordinal = self._ordinals[exhibition_date] = self.date_ordinal(exhibition_date)
+
+        predicted_audience = record.get("predicted_audience", 0)
+        self.signal.append(record["signal"])
+        self.program_code.append(record["program_code"])
+        self.weekday.append(record["weekday"])
+        self.exhibition_date.append(exhibition_date)
+        self.available_time.append(int(record["available_time"]))
+        self.predicted_audience.append(float("nan") if predicted_audience is None else predicted_audience)
+        self.date_ordinals.append(ordinal)
+
+    def take(self, rows: Sequence[int]) -> "RecordStore":
+        """
+        Copies some rows into a new store.
+
+        :param rows: Positions of the rows, in the order of the new store.
+        :return: The new record store.
+        """
+        store = RecordStore()
+        store.signal = self.signal.take(rows)
+        store.program_code = self.program_code.take(rows)
+        store.weekday = self.weekday.take(rows)
+        store.exhibition_date = self.exhibition_date.take(rows)
+        store.available_time = array("q", [self.available_time[row] for row in rows])
+        store.predicted_audience = array("d", [self.predicted_audience[row] for row in rows])
+        store.date_ordinals = array("i", [self.date_ordinals[row] for row in rows])
+        store._ordinals = self._ordinals
+        return store
+
+    def row(self, position: int) -> dict:
+        """
+        Reads a record without materializing a model.
+
+        :param position: Position of the row.
+        :return: Dictionary with the TVData fields, in the order of ``TVData.model_dump``.
+        """
+        predicted_audience = self.predicted_audience[position]
+        return {
+            "signal": self.signal[position],
+            "program_code": self.program_code[position],
+            "weekday": self.weekday[position],
+            "available_time": self.available_time[position],
+            "predicted_audience": None if predicted_audience != predicted_audience else predicted_audience,
+            "exhibition_date": self.exhibition_date[position],
+        }
+
+    def models(self, rows: Iterable[int] = None) -> List[TVData]:
+        """
+        Materializes records as TVData objects.
+
+        :param rows: (Optional) Positions of the rows. Defaults to every row.
+        :return: List of TVData objects.
+        """
+        return [TVData(**self.row(row)) for row in (range(len(self)) if rows is None else rows)]
+
+    def nbytes(self) -> int:
+        """
+        Estimates the memory held by the store.
+
+        :return: Estimated size in bytes.
+        """
+        arrays = (self.available_time, self.predicted_audience, self.date_ordinals)
+        return (self.signal.nbytes() + self.program_code.nbytes() + self.weekday.nbytes()
+                + self.exhibition_date.nbytes() + sum(values.itemsize * len(values) for values in arrays))
+
+    def __len__(self) -> int:
+        return len(self.date_ordinals)
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return self.models(range(*position.indices(len(self))))
+        if position < 0:
+            position += len(self)
+        if not 0 <= position < len(self):
+            raise IndexError("record position out of range")
+        return TVData(**self.row(position))
+
+    def __iter__(self) -> Iterator[TVData]:
+        return (TVData(**self.row(row)) for row in range(len(self)))
+
+    @staticmethod
+    def date_ordinal(value: str | date) -> int:
+        """
+        Converts an exhibition date into its proleptic Gregorian ordinal.
+
+        :param value: Date as a ``YYYY-MM-DD`` string, a date or a datetime.
+        :return: The ordinal of the date.
+        """
+        if isinstance(value, str):
+            return date.fromisoformat(value[:10]).toordinal()
+        if isinstance(value, datetime):
+            return value.date().toordinal()
+        return value.toordinal()
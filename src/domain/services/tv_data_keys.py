@@ -0,0 +1,140 @@
+import calendar
+from datetime import date, datetime
+from typing import List
+
+
+class TvDataKeys:
+    """
+    Redis key layout of the processed TV data, indexed by program_code.
+
+    Every ingestion run writes a complete dataset into its own keyspace, ``tv_data:v<version>``, and publishes it
+    by pointing ``tv_data:version`` at it, so readers never see a partially written or expired dataset. Keys of
+    a dataset never expire; the keyspaces of old versions are deleted by the next publications.
+
+    - ``tv_data:version``: version of the published dataset.
+    - ``tv_data:version:next``: counter allocating the version of every ingestion run.
+    - ``tv_data:version:collected``: oldest version whose keyspace may still exist.
+    - ``tv_data:run:<run_id>:version``: version written by the shards of a sharded ingestion run, expires with the
+      run.
+
+    Keys of the dataset of a version, available on instances created with ``for_version``:
+
+    - ``tv_data:v<version>:dataset``: JSON object with the publication time and size of the dataset.
+    - ``tv_data:v<version>:programs``: set with every stored program_code.
+    - ``tv_data:v<version>:program:{<program_code>}:records``: hash mapping record ids to the encoded records.
+    - ``tv_data:v<version>:program:{<program_code>}:weekday:<weekday>``: set with the record ids exhibited on a
+      weekday.
+    - ``tv_data:v<version>:program:{<program_code>}:dates``: sorted set with the record ids scored by exhibition
+      date.
+    - ``tv_data:v<version>:shards:finished``: set with the indexes of the shards that wrote their programs.
+    - ``tv_data:v<version>:shards:publisher``: counter electing the single shard that publishes the version.
+
+The columnar snapshots written with a version are named after it, ``<name>.v<version>``, so a reader never pairs
+a version with the snapshots of another one.
+
+    The braces are a Redis Cluster hash tag: every key of a program hashes to the same slot, in every version, so a
+    program is read, replaced and copied between versions on a single node while the programs are spread over the
+    whole cluster.
+
+    The incremental ingestion state never expires:
+
+    - ``tv_data:state:watermark``: latest audience exhibition date already ingested.
+    - ``tv_data:state:windows``: hash mapping each (signal, program_code, weekday) to its last audience values.
+    - ``tv_data:state:inventory``: JSON object mapping each program_code to a digest of its inventory rows.
+    """
+    prefix: str = "tv_data"
+    weekdays: List[str] = list(calendar.day_name)
+
+    def __init__(self, dataset_version: int | str = None):
+        """
+        Initializes the key layout.
+
+        :param dataset_version: (Optional) Version of the dataset addressed by the dataset keys.
+        """
+        self.dataset_version = dataset_version
+
+    def for_version(self, dataset_version: int | str) -> "TvDataKeys":
+        return TvDataKeys(dataset_version)
+
+    def version(self) -> str:
+        return f"{self.prefix}:version"
+
+    def next_version(self) -> str:
+        return f"{self.prefix}:version:next"
+
+    def collected_version(self) -> str:
+        return f"{self.prefix}:version:collected"
+
+    def run_version(self, run_id: str) -> str:
+        return f"{self.prefix}:run:{run_id}:version"
+
+    def dataset_info(self) -> str:
+        return f"{self.dataset}:dataset"
+
+    def programs(self) -> str:
+        return f"{self.dataset}:programs"
+
+    def records(self, program_code: str) -> str:
+        return f"{self.dataset}:program:{{{program_code}}}:records"
+
+    def weekday(self, program_code: str, weekday: str) -> str:
+        return f"{self.dataset}:program:{{{program_code}}}:weekday:{weekday}"
+
+    def dates(self, program_code: str) -> str:
+        return f"{self.dataset}:program:{{{program_code}}}:dates"
+
+    def finished_shards(self) -> str:
+        return f"{self.dataset}:shards:finished"
+
+    def shard_publisher(self) -> str:
+        return f"{self.dataset}:shards:publisher"
+
+    def snapshot(self, name: str) -> str:
+        return f"{name}.v{self.dataset_version}"
+
+    @property
+    def dataset(self) -> str:
+        """
+        Prefix of the keys of the addressed dataset.
+
+        :return: The ``tv_data:v<version>`` prefix.
+        :raises ValueError: If the keys were created without a dataset version.
+        """
+        if self.dataset_version is None:
+            raise ValueError("Dataset keys require a dataset version, see TvDataKeys.for_version.")
+        return f"{self.prefix}:v{self.dataset_version}"
+
+    def state_watermark(self) -> str:
+        return f"{self.prefix}:state:watermark"
+
+    def state_watermark_rows(self) -> str:
+        return f"{self.prefix}:state:watermark:rows"
+
+    def state_windows(self) -> str:
+        return f"{self.prefix}:state:windows"
+
+    def state_inventory(self) -> str:
+        return f"{self.prefix}:state:inventory"
+
+    def program_keys(self, program_code: str) -> List[str]:
+        """
+        Lists every key holding data of a program.
+
+        :param program_code: The program code.
+        :return: List of keys.
+        """
+        return [self.records(program_code), self.dates(program_code)] + [
+            self.weekday(program_code, weekday) for weekday in self.weekdays
+        ]
+
+    @staticmethod
+    def date_score(value: str | date) -> int:
+        """
+        Converts an exhibition date into its sorted set score (``YYYYMMDD``).
+
+        :param value: Date as a ``YYYY-MM-DD`` string or a date object.
+        :return: The integer score of the date.
+        """
+        if isinstance(value, str):
+            value = datetime.strptime(value, "%Y-%m-%d")
+        return value.year * 10000 + value.month * 100 + value.day
@@ -0,0 +1,283 @@
+import logging
+import sys
+import threading
+import time
+from datetime import date
+from typing import Dict, List, Tuple
+
+from src.cross.cache import LRUCache
+from src.cross.metrics import observe_dataset
+from src.domain.core.config import ENVIRONMENT
+from src.domain.entities.open_tv import TVData
+from src.domain.services.query_index import ProgramIndex
+from src.domain.services.record_store import RecordStore
+from src.domain.services.tv_data_reader import TvDataReader
+
+logger = logging.getLogger(__name__)
+
+
+class TvDataQueryCache:
+    """
+    Per-worker cache in front of TvDataReader for the open_tv endpoints.
+
+    Holds the ProgramIndex of the most requested programs and the results of (program_code, weekday) and
+    (program_code, period) queries in a single memory-bounded LRU cache. The cache is cleared whenever the
+    dataset version published by the cron job changes; the version is checked at most once every
+    ``version_check_interval`` seconds. Cache keys start with the dataset version a request is served from, and
+    results loaded for a version replaced in the meantime are not cached.
+
+    With ``API_DATA_SOURCE=snapshot`` program records are read from the memory-mapped predictions snapshot of the
+    served dataset version instead of Redis; the snapshot is opened on first use. The mapped file lives in the page
+    cache, so every server worker shares a single copy of the dataset.
+
+    With ``API_FAST_RESPONSES`` enabled the program indexes also hold every record serialized to JSON, and the
+    ``*_payload`` methods return query results as ready-made JSON arrays.
+    """
+
+    def __init__(self, tv_service: TvDataReader, max_bytes: int = None, version_check_interval: float = None):
+        """
+        Initializes the cache.
+
+        :param tv_service: Service used to load data on cache misses.
+        :param max_bytes: (Optional) Memory budget of the cache. Defaults to ``QUERY_CACHE_MAX_BYTES`` split
+                          evenly between the ``API_WORKERS`` server processes.
+        :param version_check_interval: (Optional) Seconds between dataset version checks.
+                                       Defaults to ``QUERY_CACHE_VERSION_CHECK_INTERVAL``.
+        """
+        self.tv_service = tv_service
+        if max_bytes is None:
+            max_bytes = ENVIRONMENT.query_cache_max_bytes // max(ENVIRONMENT.api_workers, 1)
+        self.cache = LRUCache(max_bytes)
+        self.version_check_interval = (ENVIRONMENT.query_cache_version_check_interval
+                                       if version_check_interval is None else version_check_interval)
+        self.use_snapshot = ENVIRONMENT.api_data_source == "snapshot"
+        self.serialize = ENVIRONMENT.api_fast_responses
+        self.version = None
+        self.dataset_info = {}
+        self._snapshot = None
+        self._version_checked_at = None
+        self._lock = threading.Lock()
+
+    async def get_program_data_async(self, program_code: str, weekday: str) -> List[TVData]:
+        """
+        Asynchronously retrieves the TV data of a program exhibited on a given weekday.
+
+        :param program_code: The program code.
+        :param weekday: Weekday name, e.g. ``Saturday``.
+        :return: List of TVData objects.
+        """
+        version = await self._refresh_version_async()
+        key = (version, "weekday", program_code, weekday)
+        result = self.cache.get(key)
+        if result is None:
+            index = await self._program_index_async(program_code, version)
+            result = self._cache_result(key, index.by_weekday(weekday))
+        return result
+
+    async def get_period_data_async(self, program_code: str, start_date: date, end_date: date) -> List[TVData]:
+        """
+        Asynchronously retrieves the TV data of a program exhibited between two dates, both inclusive.
+
+        :param program_code: The program code.
+        :param start_date: First exhibition date of the period.
+        :param end_date: Last exhibition date of the period.
+        :return: List of TVData objects.
+        """
+        version = await self._refresh_version_async()
+        key = (version, "period", program_code, start_date.toordinal(), end_date.toordinal())
+        result = self.cache.get(key)
+        if result is None:
+            index = await self._program_index_async(program_code, version)
+            result = self._cache_result(key, index.by_period(start_date, end_date))
+        return result
+
+    async def get_program_payload_async(self, program_code: str, weekday: str) -> bytes:
+        """
+        Asynchronously retrieves the TV data of a program exhibited on a given weekday, serialized to JSON once
+        per dataset version.
+
+        :param program_code: The program code.
+        :param weekday: Weekday name, e.g. ``Saturday``.
+        :return: JSON array of the records, ``ProgramIndex.empty_payload`` if there are none.
+        """
+        version = await self._refresh_version_async()
+        key = (version, "weekday_payload", program_code, weekday)
+        payload = self.cache.get(key)
+        if payload is None:
+            index = await self._program_index_async(program_code, version)
+            payload = self._cache_payload(key, index.weekday_payload(weekday))
+        return payload
+
+    async def get_period_payload_async(self, program_code: str, start_date: date, end_date: date) -> bytes:
+        """
+        Asynchronously retrieves the TV data of a program exhibited between two dates, both inclusive,
+        serialized to JSON.
+
+        :param program_code: The program code.
+        :param start_date: First exhibition date of the period.
+        :param end_date: Last exhibition date of the period.
+        :return: JSON array of the records, ``ProgramIndex.empty_payload`` if there are none.
+        """
+        version = await self._refresh_version_async()
+        key = (version, "period_payload", program_code, start_date.toordinal(), end_date.toordinal())
+        payload = self.cache.get(key)
+        if payload is None:
+            index = await self._program_index_async(program_code, version)
+            payload = self._cache_payload(key, index.period_payload(start_date, end_date))
+        return payload
+
+    async def get_program_indexes_async(self, program_codes: List[str]) -> Dict[str, ProgramIndex]:
+        """
+        Asynchronously retrieves the query indexes of several programs, loading every missing one in a single
+        round trip.
+
+        :param program_codes: The program codes, possibly repeated.
+        :return: Dictionary mapping each distinct program code to its ProgramIndex.
+        """
+        version = await self._refresh_version_async()
+        indexes, missing = self._cached_indexes(program_codes, version)
+        if missing:
+            if self.use_snapshot:
+                records = {program_code: self._snapshot_records(program_code, version) for program_code in missing}
+            else:
+                records = await self.tv_service.get_many_program_records_async(missing, version)
+            indexes.update({program_code: self._cache_index(program_code, version, program_records)
+                            for program_code, program_records in records.items()})
+        return indexes
+
+    async def get_dataset_version_async(self) -> str | None:
+        """
+        Asynchronously retrieves the dataset version served by the cache, checking for a new version when the
+        check is due.
+
+        :return: The dataset version, or None if no dataset was published yet.
+        """
+        return await self._refresh_version_async()
+
+    def stats(self) -> dict:
+        """
+        Reports the usage counters of the cache.
+
+        :return: Dictionary with the dataset version and the cache hit/miss counters and sizes.
+        """
+        return {"version": self.version, **self.cache.stats()}
+
+    async def _program_index_async(self, program_code: str, version: str | None) -> ProgramIndex:
+        """
+        Asynchronously retrieves the query index of a program, loading and indexing its records on a cache miss.
+
+        :param program_code: The program code.
+        :param version: The dataset version the request is served from.
+        :return: The ProgramIndex of the program for the dataset version.
+        """
+        index = self.cache.get((version, "program", program_code))
+        if index is None:
+            records = (self._snapshot_records(program_code, version) if self.use_snapshot
+                       else await self.tv_service.get_program_records_async(program_code, version))
+            index = self._cache_index(program_code, version, records)
+        return index
+
+    def _cached_indexes(self, program_codes: List[str],
+                        version: str | None) -> Tuple[Dict[str, ProgramIndex], List[str]]:
+        """
+        Looks up the cached query indexes of several programs.
+
+        :param program_codes: The program codes, possibly repeated.
+        :param version: The dataset version the request is served from.
+        :return: The cached indexes by program code and the distinct program codes missing from the cache.
+        """
+        indexes, missing = {}, []
+        for program_code in dict.fromkeys(program_codes):
+            index = self.cache.get((version, "program", program_code))
+            if index is None:
+                missing.append(program_code)
+            else:
+                indexes[program_code] = index
+        return indexes, missing
+
+    def _snapshot_records(self, program_code: str, version: str | None) -> RecordStore:
+        """
+        Reads the records of a program from the predictions snapshot of a dataset version, opening it on first use.
+
+        :param program_code: The program code.
+        :param version: The dataset version the request is served from.
+        :return: RecordStore with the records, empty if the version has no snapshot.
+        """
+        with self._lock:
+            if self._snapshot is None or self._snapshot[0] != version:
+                self._snapshot = (version, self.tv_service.load_predictions_snapshot(version))
+            snapshot = self._snapshot[1]
+        return RecordStore() if snapshot is None else snapshot.records(program_code)
+
+    def _cache_index(self, program_code: str, version: str | None, records: RecordStore) -> ProgramIndex:
+        index = ProgramIndex(records, serialize=self.serialize)
+        self._cache_value((version, "program", program_code), index, index.index_size())
+        return index
+
+    def _cache_result(self, key: tuple, result: List[TVData]) -> List[TVData]:
+        self._cache_value(key, result, self._estimate_size(result))
+        return result
+
+    def _cache_payload(self, key: tuple, payload: bytes) -> bytes:
+        self._cache_value(key, payload, sys.getsizeof(payload))
+        return payload
+
+    def _cache_value(self, key: tuple, value, size: int) -> None:
+        """
+        Caches a value computed for the dataset version at the start of its key. Values of a version replaced
+        while they were loading are not cached: the cache was already cleared for the new version.
+
+        :param key: Cache key, starting with the dataset version.
+        :param value: The value to cache.
+        :param size: Estimated size of the value in bytes.
+        """
+        if key[0] == self.version:
+            self.cache.set(key, value, size)
+
+    async def _refresh_version_async(self) -> str | None:
+        """
+        Asynchronously clears the cache if the dataset version changed since the last check, and updates the dataset
+        information and metrics.
+
+        :return: The dataset version to serve the request from. Cache keys start with it, so results loaded for a
+                 version are never served for another one.
+        """
+        if self._version_check_due():
+            version = await self.tv_service.get_dataset_version_async()
+            dataset_info = self.dataset_info
+            if version != self.version:
+                dataset_info = await self.tv_service.get_dataset_info_async(version)
+                observe_dataset(version, dataset_info)
+            self._apply_version(version, dataset_info)
+        return self.version
+
+    def _version_check_due(self) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            if self._version_checked_at is not None and now - self._version_checked_at < self.version_check_interval:
+                return False
+            self._version_checked_at = now
+            return True
+
+    def _apply_version(self, version: str | None, dataset_info: dict) -> None:
+        if version != self.version:
+            logger.info(f"Dataset version changed from {self.version} to {version}, clearing query cache.")
+            self.cache.clear()
+            self.dataset_info = dataset_info
+            self.version = version
+
+    @staticmethod
+    def _estimate_size(records: List[TVData]) -> int:
+        """
+        Estimates the memory held by a list of records, extrapolated from its first record.
+
+        :param records: List of TVData objects.
+        :return: Estimated size in bytes.
+        """
+        size = sys.getsizeof(records)
+        if records:
+            fields = records[0].__dict__
+            record_size = sys.getsizeof(records[0]) + sys.getsizeof(fields) + sum(
+                sys.getsizeof(value) for value in fields.values())
+            size += record_size * len(records)
+        return size
@@ -0,0 +1,233 @@
+import json
+import logging
+from functools import cached_property
+from typing import TYPE_CHECKING, Dict, List
+
+from src.domain.core.config import ENVIRONMENT
+from src.domain.interfaces.repositories.database_repository import IDataBaseRepository
+from src.domain.services.record_store import RecordStore
+from src.domain.services.tv_data_keys import TvDataKeys
+
+if TYPE_CHECKING:
+    from src.domain.interfaces.repositories.snapshot_repository import ISnapshotRepository
+    from src.domain.services.predictions_snapshot import PredictionsSnapshot
+
+logger = logging.getLogger(__name__)
+
+
+class TvDataReader:
+    """
+    Read side of the TV data stored by the ingestion pipeline, used by the API.
+
+    Clients are created on first use and the modules behind the optional Arrow snapshots are imported only when
+    snapshots are enabled, so importing and instantiating the reader is cheap and needs no credentials.
+    """
+    keys: TvDataKeys = TvDataKeys()
+
+    def __init__(self, database_repository: IDataBaseRepository = None,
+                 async_database_repository: IDataBaseRepository = None):
+        """
+        Initializes the reader.
+
+        :param database_repository: (Optional) Repository used by the synchronous methods. Defaults to Redis, or
+                                    Redis Cluster with ``REDIS_CLUSTER`` enabled.
+        :param async_database_repository: (Optional) Repository used by the coroutines. Defaults to asyncio Redis,
+                                          or asyncio Redis Cluster with ``REDIS_CLUSTER`` enabled.
+        """
+        if database_repository is not None:
+            self.database_repository = database_repository
+        if async_database_repository is not None:
+            self.async_database_repository = async_database_repository
+
+    @cached_property
+    def database_repository(self) -> IDataBaseRepository:
+        if ENVIRONMENT.redis_cluster:
+            from src.infra.repositories.redis_cluster_repository import RedisClusterRepository
+
+            return RedisClusterRepository.setup_connection_strings().connect()
+
+        from src.infra.repositories.redis_repository import RedisRepository
+
+        return RedisRepository.setup_connection_strings().connect()
+
+    @cached_property
+    def async_database_repository(self) -> IDataBaseRepository:
+        if ENVIRONMENT.redis_cluster:
+            from src.infra.repositories.async_redis_cluster_repository import AsyncRedisClusterRepository
+
+            return AsyncRedisClusterRepository.setup_connection_strings().connect()
+
+        from src.infra.repositories.async_redis_repository import AsyncRedisRepository
+
+        return AsyncRedisRepository.setup_connection_strings().connect()
+
+    @cached_property
+    def snapshot_repository(self) -> "ISnapshotRepository | None":
+        """
+        Creates the repository of columnar snapshots configured by ``SNAPSHOT_PATH`` and ``SNAPSHOT_BUCKET``.
+
+        :return: The snapshot repository, or None if snapshots are disabled.
+        """
+        if not ENVIRONMENT.snapshot_path:
+            return None
+        if ENVIRONMENT.snapshot_bucket:
+            from src.infra.repositories.arrow_s3_snapshot_repository import S3ArrowSnapshotRepository
+
+            return S3ArrowSnapshotRepository(ENVIRONMENT.snapshot_bucket, ENVIRONMENT.snapshot_path)
+
+        from src.infra.repositories.arrow_snapshot_repository import LocalArrowSnapshotRepository
+
+        return LocalArrowSnapshotRepository(ENVIRONMENT.snapshot_path)
+
+    def load_predictions_snapshot(self, dataset_version: str | None) -> "PredictionsSnapshot | None":
+        """
+        Memory-maps the predictions snapshot of a dataset version.
+
+        :param dataset_version: The dataset version, see ``get_dataset_version_async``.
+        :return: The predictions snapshot, or None if snapshots are disabled, no dataset was published yet or the
+                 version has no snapshot.
+        """
+        if self.snapshot_repository is None or dataset_version is None:
+            return None
+
+        table = self.snapshot_repository.read_table(self.keys.for_version(dataset_version).snapshot("predictions"))
+        if table is None:
+            return None
+
+        from src.domain.services.predictions_snapshot import PredictionsSnapshot
+
+        return PredictionsSnapshot(table)
+
+    async def close(self) -> None:
+        """
+        Closes the asyncio Redis client, if it was created.
+        """
+        if "async_database_repository" in self.__dict__:
+            await self.async_database_repository.close()
+
+    async def get_program_records_async(self, program_code: str, version: str = None) -> RecordStore:
+        """
+        Asynchronously retrieves every TV data record of a program, in no particular order.
+
+        :param program_code: The program code.
+        :param version: (Optional) Dataset version to read. Defaults to the published one.
+        :return: RecordStore with the records.
+        """
+        return (await self.get_many_program_records_async([program_code], version))[program_code]
+
+    async def get_many_program_records_async(self, program_codes: List[str],
+                                             version: str = None) -> Dict[str, RecordStore]:
+        """
+        Asynchronously retrieves every TV data record of several programs in a single pipelined round trip.
+
+        :param program_codes: The program codes.
+        :param version: (Optional) Dataset version to read. Defaults to the published one.
+        :return: Dictionary mapping each program code to the RecordStore of its records.
+        """
+        keys = await self._dataset_keys_async(version)
+        if keys is None:
+            return {program_code: RecordStore() for program_code in program_codes}
+
+        async with self.async_database_repository.pipeline() as batch:
+            for program_code in program_codes:
+                await batch.get_hash_values(keys.records(program_code), raw=True)
+        return {program_code: self._decode_records(raw_records)
+                for program_code, raw_records in zip(program_codes, batch.results)}
+
+    @staticmethod
+    def _decode_records(raw_records) -> RecordStore:
+        """
+        Decodes records read from Redis, skipping missing ones.
+
+        :param raw_records: Encoded records.
+        :return: RecordStore with the records.
+        """
+        return RecordStore.from_encoded(raw_records)
+
+    def _dataset_keys(self, version: str = None) -> TvDataKeys | None:
+        """
+        Resolves the key layout of a dataset version.
+
+        :param version: (Optional) The dataset version. Defaults to the published one.
+        :return: The key layout, or None if no dataset was published yet.
+        """
+        version = self.get_dataset_version() if version is None else version
+        return None if version is None else self.keys.for_version(version)
+
+    async def _dataset_keys_async(self, version: str = None) -> TvDataKeys | None:
+        """
+        Asynchronously resolves the key layout of a dataset version.
+
+        :param version: (Optional) The dataset version. Defaults to the published one.
+        :return: The key layout, or None if no dataset was published yet.
+        """
+        version = await self.get_dataset_version_async() if version is None else version
+        return None if version is None else self.keys.for_version(version)
+
+    def get_dataset_version(self) -> str | None:
+        """
+        Retrieves the version of the dataset currently published in Redis.
+
+        :return: The dataset version, or None if no dataset was published yet.
+        """
+        return self.database_repository.get(self.keys.version())
+
+    async def get_dataset_version_async(self) -> str | None:
+        """
+        Asynchronously retrieves the version of the dataset currently published in Redis.
+
+        :return: The dataset version, or None if no dataset was published yet.
+        """
+        return await self.async_database_repository.get(self.keys.version())
+
+    def get_dataset_info(self, version: str = None) -> dict:
+        """
+        Retrieves the publication time and size of a dataset.
+
+        :param version: (Optional) The dataset version. Defaults to the published one.
+        :return: Dictionary with the ``published_at`` Unix time and the number of ``programs``, empty if no
+                 dataset was published yet.
+        """
+        keys = self._dataset_keys(version)
+        dataset_info = None if keys is None else self.database_repository.get(keys.dataset_info())
+        return json.loads(dataset_info) if dataset_info else {}
+
+    async def get_dataset_info_async(self, version: str = None) -> dict:
+        """
+        Asynchronously retrieves the publication time and size of a dataset.
+
+        :param version: (Optional) The dataset version. Defaults to the published one.
+        :return: Dictionary with the ``published_at`` Unix time and the number of ``programs``, empty if no
+                 dataset was published yet.
+        """
+        keys = await self._dataset_keys_async(version)
+        dataset_info = None if keys is None else await self.async_database_repository.get(keys.dataset_info())
+        return json.loads(dataset_info) if dataset_info else {}
+
+    def get_program_codes(self, version: str = None) -> set:
+        """
+        Retrieves the codes of every program of a dataset.
+
+        :param version: (Optional) The dataset version. Defaults to the published one.
+        :return: Set of program codes, empty if no dataset was published yet.
+        """
+        keys = self._dataset_keys(version)
+        return set() if keys is None else self.database_repository.get_set_members(keys.programs())
+
+    def get_all_data(self, version: str = None) -> RecordStore:
+        """
+        Retrieves all TV data of a dataset.
+
+        :param version: (Optional) The dataset version. Defaults to the published one.
+        :return: RecordStore with every record.
+        """
+        keys = self._dataset_keys(version)
+        if keys is None:
+            return RecordStore()
+
+        program_codes = self.database_repository.get_set_members(keys.programs())
+        with self.database_repository.pipeline() as batch:
+            for program_code in program_codes:
+                batch.get_hash_values(keys.records(program_code), raw=True)
+
+        return self._decode_records(raw_record for raw_records in batch.results for raw_record in raw_records)
@@ -1,42 +1,486 @@
-import json
-from collections import defaultdict
-from typing import List
+import multiprocessing
+import random
+import time
+import uuid
+from collections import Counter
+from contextlib import ExitStack, closing, contextmanager
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+import numpy as np
 import pandas as pd
+from src.cross.csv_engine import CsvEngine, CsvSchema
+from src.cross.errors import NotFound
+from src.cross.metrics import observe_rows
+from src.cross.prefetch import Prefetcher
+from src.cross.timing import log_duration, record_duration
+from src.domain.core.config import ENVIRONMENT
 from src.domain.entities.open_tv import TVData
+from src.domain.interfaces.repositories.csv_repository import ICsvRepository
+from src.domain.interfaces.repositories.database_repository import IDataBaseRepository
+from src.domain.services.audience_history import AudienceHistoryEngine
+from src.domain.services.tv_data_keys import TvDataKeys
+from src.domain.services.tv_data_reader import TvDataReader
+from src.domain.services.tv_data_state import IncrementalState
+from src.domain.services.tv_data_writer import TvDataWriter
 from src.infra.repositories.csv_s3_repository import S3CSVRepository
-from src.infra.repositories.redis_repository import RedisRepository
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-class TvDataService:
+def _parse_and_validate_csv(raw_csv: bytes, schema: CsvSchema, validator):
+    """
+    Parses and validates a downloaded CSV file. Runs inside the ingestion process pool.
+
+    :param raw_csv: Content of the CSV file.
+    :param schema: Column types applied while parsing.
+    :param validator: Validation function applied to the parsed DataFrame.
+    :return: Tuple containing the validated DataFrame and the time spent, in seconds.
+    """
+    start = time.perf_counter()
+    dataframe = CsvEngine.from_settings().read(raw_csv, schema)
+    return validator(dataframe), time.perf_counter() - start
+
+
+def _process_and_store_shard(audience_csv_key: str, inventory_csv_key: str, shard: int, shard_count: int,
+                             run_id: str) -> None:
+    """
+    Processes and stores a single shard with the default repositories. Runs inside the ingestion process pool.
+    """
+    TvDataService().process_and_store_shard(audience_csv_key, inventory_csv_key, shard, shard_count, run_id)
+
+
+class TvDataService(TvDataReader):
     """
     Service responsible for processing TV audience and inventory data, storing it in Redis,
     and providing access to structured TV data.
-    """
-    redis_key: str = "tv_data"
 
-    def __init__(self):
+    Used by the ingestion cron job only; the API depends on the lighter TvDataReader.
+    """
+    snapshot_names: tuple = ("audience", "inventory", "predictions")
+    run_expiration: int = 7 * 24 * 3600
+    audience_schema: CsvSchema = CsvSchema({
+        "signal": "category",
+        "program_code": "category",
+        "exhibition_date": "date",
+        "program_start_time": "string",
+        "average_audience": "float64",
+    }, date_formats={"exhibition_date": "%Y-%m-%d"})
+    inventory_schema: CsvSchema = CsvSchema({
+        "signal": "category",
+        "program_code": "category",
+        "date": "date",
+        "available_time": "Int64",
+    }, date_formats={"date": "%d/%m/%Y"})
+
+    def __init__(self, csv_repository: ICsvRepository = None, database_repository: IDataBaseRepository = None,
+                 async_database_repository: IDataBaseRepository = None):
         """
         Initializes the service with the required repositories.
+
+        :param csv_repository: (Optional) Source of the input CSV files. Defaults to the S3 bucket.
+        :param database_repository: (Optional) Repository where the data is stored. Defaults to Redis.
+        :param async_database_repository: (Optional) Repository used by the coroutines. Defaults to asyncio Redis.
         """
-        self.csv_repository = S3CSVRepository(bucket_name="globo-challange")
-        self.database_repository = RedisRepository.setup_connection_strings().connect()
+        super().__init__(database_repository, async_database_repository)
+        self.csv_repository = csv_repository or S3CSVRepository(bucket_name="globo-challange")
+        self.history_engine = AudienceHistoryEngine(window_size=ENVIRONMENT.history_window_size)
 
-    def process_and_store_data(self, audience_csv_key: str, inventory_csv_key: str):
+    def process_and_store_data(self, audience_csv_key: str, inventory_csv_key: str, chunksize: int = None):
         """
         Fetches, validates, processes, and stores TV audience and inventory data.
 
         :param audience_csv_key: S3 key for the audience CSV file.
         :param inventory_csv_key: S3 key for the inventory CSV file.
+        :param chunksize: (Optional) Number of CSV rows processed at a time. Defaults to ``CSV_CHUNK_SIZE``;
+                          0 loads each file at once.
+        """
+        chunksize = ENVIRONMENT.csv_chunk_size if chunksize is None else chunksize
+        if chunksize:
+            return self._process_and_store_in_chunks(audience_csv_key, inventory_csv_key, chunksize)
+
+        with log_duration("fetch and validate"):
+            if ENVIRONMENT.ingestion_parallel:
+                audience_df, inventory_df = self._fetch_and_load_data_in_parallel(audience_csv_key,
+                                                                                  inventory_csv_key)
+            else:
+                audience_df, inventory_df = self._fetch_and_load_data(audience_csv_key, inventory_csv_key)
+                audience_df = self._validate_audience_data(audience_df)
+                inventory_df = self._validate_inventory_data(inventory_df)
+
+        writer = self._create_writer()
+        with self._open_snapshots(writer.keys) as snapshots:
+            self._write_snapshot(snapshots, "audience", audience_df)
+            self._write_snapshot(snapshots, "inventory", inventory_df)
+
+            with log_duration("history"):
+                medians = self._create_audience_history(audience_df)
+            with log_duration("generate"):
+                tv_data_list = self._generate_tv_data(inventory_df, medians, snapshots.get("predictions"))
+
+        with log_duration("store"):
+            self._store_in_redis(writer, tv_data_list)
+
+    def process_and_store_from_snapshot(self):
+        """
+        Recomputes and stores the TV data from the validated audience and inventory snapshots of the published
+        dataset version, skipping the CSV download and parsing.
+
+        :raises NotFound: If snapshots are disabled or were not written with the published version.
+        """
+        if self.snapshot_repository is None:
+            raise NotFound("Snapshots are disabled, set SNAPSHOT_PATH to enable them.")
+
+        version = self.get_dataset_version()
+        audience_df = inventory_df = None
+        if version is not None:
+            keys = self.keys.for_version(version)
+            with log_duration("load snapshots"):
+                audience_df = self.snapshot_repository.read_snapshot(keys.snapshot("audience"))
+                inventory_df = self.snapshot_repository.read_snapshot(keys.snapshot("inventory"))
+        if audience_df is None or inventory_df is None:
+            raise NotFound(f"Audience and inventory snapshots of dataset version {version} not found.")
+
+        writer = self._create_writer()
+        with self._open_snapshots(writer.keys) as snapshots:
+            self._write_snapshot(snapshots, "audience", audience_df)
+            self._write_snapshot(snapshots, "inventory", inventory_df)
+
+            with log_duration("history"):
+                medians = self._create_audience_history(audience_df)
+            with log_duration("generate"):
+                tv_data_list = self._generate_tv_data(inventory_df, medians, snapshots.get("predictions"))
+
+        with log_duration("store"):
+            self._store_in_redis(writer, tv_data_list)
+
+    @contextmanager
+    def _open_snapshots(self, keys: TvDataKeys):
+        """
+        Opens a writer for each snapshot emitted by the ingestion pipeline, named after the dataset version being
+        written. The snapshots are published together when the context exits, which must happen before the
+        version is committed, so readers of the version always find its snapshots.
+
+        :param keys: Key layout of the dataset version being written.
+        :return: Context manager yielding a dictionary mapping snapshot names to writers, empty if snapshots are
+                 disabled.
+        """
+        if self.snapshot_repository is None:
+            yield {}
+            return
+
+        with ExitStack() as stack:
+            yield {name: stack.enter_context(self.snapshot_repository.snapshot_writer(keys.snapshot(name)))
+                   for name in self.snapshot_names}
+
+    def _commit(self, writer: TvDataWriter) -> None:
+        """
+        Publishes the dataset version of a writer, then deletes the snapshots of the versions it collected.
+
+        :param writer: Writer of the dataset version.
+        """
+        collected_versions = writer.commit()
+        if self.snapshot_repository is None:
+            return
+
+        for version in collected_versions:
+            keys = self.keys.for_version(version)
+            for name in self.snapshot_names:
+                try:
+                    self.snapshot_repository.delete_snapshot(keys.snapshot(name))
+                except Exception as e:
+                    logger.error(f"Error deleting snapshot {keys.snapshot(name)} - {e}")
+
+    @staticmethod
+    def _write_snapshot(snapshots: dict, name: str, dataframe: pd.DataFrame) -> None:
+        writer = snapshots.get(name)
+        if writer is not None:
+            writer.write(dataframe)
+
+    def _process_and_store_in_chunks(self, audience_csv_key: str, inventory_csv_key: str, chunksize: int):
+        """
+        Streams both CSV files chunk by chunk, so memory is bounded by the chunk size instead of the file size.
+
+        The audience chunks are folded into a rolling window of last records per key; the inventory chunks are
+        then joined with the resulting medians and written to Redis one at a time. With ``INGESTION_PARALLEL``,
+        both files are streamed from the start, see ``_stream_csv``, so the first inventory chunks are downloaded
+        and parsed while the audience is folded.
+
+        :param audience_csv_key: S3 key for the audience CSV file.
+        :param inventory_csv_key: S3 key for the inventory CSV file.
+        :param chunksize: Number of CSV rows processed at a time.
+        """
+        writer = self._create_writer()
+        with self._open_snapshots(writer.keys) as snapshots, \
+                self._stream_csv(audience_csv_key, chunksize, self.audience_schema) as audience_chunks, \
+                self._stream_csv(inventory_csv_key, chunksize, self.inventory_schema) as inventory_chunks:
+            with log_duration("stream audience and history"):
+                window_df = None
+                for audience_chunk in audience_chunks:
+                    audience_chunk = self._validate_audience_data(audience_chunk)
+                    self._write_snapshot(snapshots, "audience", audience_chunk)
+                    window_df = self.history_engine.update(window_df, audience_chunk)
+
+                if window_df is None:
+                    raise KeyError(f"Missing required columns in audience data: {self.history_engine.key_columns}")
+
+                medians = self.history_engine.medians(window_df)
+                observe_rows("history", len(medians))
+                logger.info(f"Audience history generated: {len(medians)} records.")
+
+            with log_duration("stream inventory, generate and store"):
+                for inventory_chunk in inventory_chunks:
+                    inventory_chunk = self._validate_inventory_data(inventory_chunk)
+                    self._write_snapshot(snapshots, "inventory", inventory_chunk)
+                    writer.write(self._generate_tv_data(inventory_chunk, medians, snapshots.get("predictions")))
+
+        self._commit(writer)
+
+    def _stream_csv(self, file_key: str, chunksize: int, schema: CsvSchema):
+        """
+        Opens the chunk stream of a CSV file. With ``INGESTION_PARALLEL``, up to ``INGESTION_PREFETCH_CHUNKS``
+        chunks are downloaded and parsed ahead in a background thread, starting immediately, while the pipeline
+        processes the current ones.
+
+        :param file_key: S3 key for the CSV file.
+        :param chunksize: Number of CSV rows per chunk.
+        :param schema: Column types applied while parsing.
+        :return: Context manager yielding an iterator over the DataFrame chunks, closed when the context exits.
+        """
+        chunks = self.csv_repository.fetch_csv_in_chunks(file_key, chunksize, schema)
+        if ENVIRONMENT.ingestion_parallel and ENVIRONMENT.ingestion_prefetch_chunks > 0:
+            return Prefetcher(chunks, ENVIRONMENT.ingestion_prefetch_chunks)
+        return closing(chunks)
+
+    def process_and_store_incremental(self, audience_csv_key: str, inventory_csv_key: str):
+        """
+        Recomputes and rewrites only the programs affected since the previous run.
+
+        Only audience rows exhibited from the stored watermark day on are ingested, skipping the rows of the
+        watermark day that a previous run already ingested, so late rows of that day are still counted. They are
+        folded into the stored rolling windows of their keys, and only programs with new audience rows or changed
+        inventory rows are regenerated; the other programs are copied from the published dataset into the new
+        version. The first run, with no stored state or no published dataset, rebuilds every program.
+
+        :param audience_csv_key: S3 key for the audience CSV file, either the full history or a delta file.
+        :param inventory_csv_key: S3 key for the inventory CSV file.
+        :raises ValueError: If snapshots are enabled, see ``_require_snapshots_disabled``.
+        """
+        self._require_snapshots_disabled("Incremental")
+        state = IncrementalState(self.database_repository, self.keys, self.history_engine)
+        watermark = state.get_watermark()
+        watermark_rows = state.get_watermark_rows() if watermark is not None else {}
+        previous_version = self.get_dataset_version()
+        key_columns = self.history_engine.key_columns
+
+        with log_duration("incremental audience"):
+            delta_window, new_watermark, new_watermark_rows = None, watermark, Counter(watermark_rows)
+            unmatched_rows = Counter(watermark_rows)
+            for audience_chunk in self._iter_validated_csv(audience_csv_key, self.audience_schema,
+                                                           self._validate_audience_data):
+                exhibition_dates = audience_chunk["exhibition_date"]
+                if watermark is None:
+                    audience_chunk = audience_chunk[exhibition_dates.notna()]
+                else:
+                    new_rows = (exhibition_dates > watermark).to_numpy()
+                    on_watermark = (exhibition_dates == watermark).to_numpy()
+                    # every row of the watermark day already ingested is matched once, the other rows are late
+                    new_rows[on_watermark] = [not self._consume(unmatched_rows, digest) for digest
+                                              in state.audience_row_digests(audience_chunk[on_watermark])]
+                    audience_chunk = audience_chunk[new_rows]
+                if audience_chunk.empty:
+                    continue
+
+                chunk_watermark = audience_chunk["exhibition_date"].max()
+                if new_watermark is None or chunk_watermark > new_watermark:
+                    new_watermark, new_watermark_rows = chunk_watermark, Counter()
+                new_watermark_rows.update(state.audience_row_digests(
+                    audience_chunk[audience_chunk["exhibition_date"] == new_watermark]))
+                delta_window = self.history_engine.update(delta_window, audience_chunk)
+
+        with log_duration("incremental inventory"):
+            inventory_df = pd.concat(list(self._iter_validated_csv(inventory_csv_key, self.inventory_schema,
+                                                                   self._validate_inventory_data)))
+            stored_digests = state.get_inventory_digests() if previous_version is not None else {}
+            digests = state.inventory_digests(inventory_df)
+
+            affected_programs = {program_code for program_code, digest in digests.items()
+                                 if stored_digests.get(program_code) != digest}
+            if delta_window is not None:
+                affected_programs |= set(delta_window["program_code"].astype(str))
+            affected_inventory = inventory_df[inventory_df["program_code"].astype(str).isin(affected_programs)]
+
+        with log_duration("incremental history"):
+            needed_keys = affected_inventory[key_columns].dropna().astype(str)
+            if delta_window is not None:
+                needed_keys = pd.concat([needed_keys, delta_window[key_columns].astype(str)])
+
+            window_df = state.load_windows(needed_keys)
+            if delta_window is not None:
+                window_df = self.history_engine.update(window_df, delta_window)
+            medians = self.history_engine.medians(window_df)
+            observe_rows("history", len(medians))
+
+        with log_duration("incremental generate and store"):
+            writer = self._create_writer()
+            writer.write(self._generate_tv_data(affected_inventory, medians))
+            if previous_version is not None:
+                writer.copy_programs(self.keys.for_version(previous_version), set(digests) - affected_programs)
+            writer.commit()
+
+            state.save_windows(window_df)
+            state.set_inventory_digests(digests)
+            if new_watermark is not None:
+                state.set_watermark(new_watermark, dict(new_watermark_rows))
+
+        logger.info(f"Incremental run rewrote {len(affected_programs & set(digests))} of {len(digests)} programs "
+                    f"up to watermark {new_watermark}.")
+
+    def process_and_store_sharded(self, audience_csv_key: str, inventory_csv_key: str, shard_count: int):
+        """
+        Runs every shard of a sharded ingestion in a pool of ``INGESTION_PROCESS_WORKERS`` processes, see
+        ``process_and_store_shard``. The dataset is published by the last shard to finish.
+
+        :param audience_csv_key: S3 key for the audience CSV file.
+        :param inventory_csv_key: S3 key for the inventory CSV file.
+        :param shard_count: Number of shards the programs are partitioned into.
+        :raises ValueError: If snapshots are enabled, see ``_require_snapshots_disabled``.
+        """
+        self._require_snapshots_disabled("Sharded")
+        run_id = uuid.uuid4().hex
+        process_context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=min(ENVIRONMENT.ingestion_process_workers, shard_count),
+                                 mp_context=process_context) as pool:
+            shards = [pool.submit(_process_and_store_shard, audience_csv_key, inventory_csv_key, shard, shard_count,
+                                  run_id) for shard in range(shard_count)]
+            for shard in as_completed(shards):
+                shard.result()
+
+    def process_and_store_shard(self, audience_csv_key: str, inventory_csv_key: str, shard: int, shard_count: int,
+                                run_id: str):
+        """
+        Processes and stores the programs of one shard of a sharded ingestion run.
+
+        Programs are partitioned by a stable hash of their program_code. Every (signal, program_code) key, and so
+        its audience history, belongs to a single shard, and each program's keys are written by a single shard.
+        Every shard streams both CSV files, keeps only its own rows and writes its programs into the dataset
+        version shared by the run. The last shard to finish publishes the version. Shards can run in any order, in
+        processes or pods, e.g. as the indexes of a Kubernetes Indexed Job. A retried shard rewrites the same
+        records.
+
+        :param audience_csv_key: S3 key for the audience CSV file.
+        :param inventory_csv_key: S3 key for the inventory CSV file.
+        :param shard: Index of the shard, from 0 to ``shard_count - 1``.
+        :param shard_count: Number of shards the programs are partitioned into.
+        :param run_id: Identifier shared by every shard of the run.
+        :raises ValueError: If the shard index is out of range, the run identifier is missing or snapshots are
+                            enabled, see ``_require_snapshots_disabled``.
+        """
+        self._require_snapshots_disabled("Sharded")
+        if not 0 <= shard < shard_count:
+            raise ValueError(f"Shard index {shard} out of range for {shard_count} shards.")
+        if not run_id:
+            raise ValueError("Sharded runs require a run identifier shared by every shard, see INGESTION_RUN_ID.")
+
+        writer = TvDataWriter(self.database_repository, self.keys.for_version(self._run_version(run_id)),
+                              ENVIRONMENT.redis_pipeline_batch_size)
+
+        with log_duration(f"shard {shard} audience and history"):
+            window_df = None
+            for audience_chunk in self._iter_validated_csv(audience_csv_key, self.audience_schema,
+                                                           self._validate_audience_data):
+                audience_chunk = audience_chunk[self.program_shards(audience_chunk, shard_count) == shard]
+                if window_df is None or not audience_chunk.empty:
+                    window_df = self.history_engine.update(window_df, audience_chunk)
+            medians = self.history_engine.medians(window_df)
+            observe_rows("history", len(medians))
+
+        with log_duration(f"shard {shard} inventory, generate and store"):
+            for inventory_chunk in self._iter_validated_csv(inventory_csv_key, self.inventory_schema,
+                                                            self._validate_inventory_data):
+                inventory_chunk = inventory_chunk[self.program_shards(inventory_chunk, shard_count) == shard]
+                if not inventory_chunk.empty:
+                    writer.write(self._generate_tv_data(inventory_chunk, medians))
+
+        logger.info(f"Shard {shard + 1} of {shard_count} wrote {writer.next_record_id} TV Data records for "
+                    f"{len(writer.program_codes)} programs into dataset version {writer.keys.dataset_version}.")
+
+        self.database_repository.add_to_set(writer.keys.finished_shards(), [shard], 0)
+        finished = self.database_repository.get_set_members(writer.keys.finished_shards())
+        if len(finished) == shard_count and self.database_repository.increment(writer.keys.shard_publisher()) == 1:
+            writer.commit()
+
+    @staticmethod
+    def _consume(counts: Counter, key: str) -> bool:
+        """
+        Decrements the count of a key if it is positive.
+
+        :param counts: Counter to decrement.
+        :param key: The key to decrement.
+        :return: True if the key was counted.
+        """
+        if counts[key] <= 0:
+            return False
+        counts[key] -= 1
+        return True
+
+    def _require_snapshots_disabled(self, mode: str) -> None:
+        """
+        Checks that snapshots are disabled before an incremental or sharded run.
+
+        These runs never hold the full dataset in one place, so they do not write snapshots. Otherwise the new
+        dataset version would have none: the API would serve no records with ``API_DATA_SOURCE=snapshot``, and
+        ``process_and_store_from_snapshot`` would find no inputs.
+
+        :param mode: Name of the ingestion mode, used in the error message.
+        :raises ValueError: If snapshots are enabled.
+        """
+        if self.snapshot_repository is not None:
+            raise ValueError(f"{mode} runs do not write snapshots, unset SNAPSHOT_PATH to use them.")
+
+    def _run_version(self, run_id: str) -> str:
+        """
+        Retrieves the dataset version written by a sharded run, allocating it for the first shard to ask.
+
+        :param run_id: Identifier shared by every shard of the run.
+        :return: The dataset version of the run.
+        """
+        key = self.keys.run_version(run_id)
+        version = self.database_repository.get(key)
+        if version is None:
+            self.database_repository.create_if_absent(key, self.database_repository.increment(self.keys.next_version()),
+                                                      self.run_expiration)
+            version = self.database_repository.get(key)
+        return version
+
+    @staticmethod
+    def program_shards(dataframe: pd.DataFrame, shard_count: int) -> np.ndarray:
+        """
+        Assigns every row to a shard by a hash of its program_code that is stable across processes and runs.
+
+        :param dataframe: DataFrame with a ``program_code`` column.
+        :param shard_count: Number of shards.
+        :return: Array with the shard index of every row. Rows without a program_code belong to shard 0.
+        """
+        codes, program_codes = pd.factorize(dataframe["program_code"])
+        hashes = pd.util.hash_array(np.asarray(program_codes.astype(str), dtype=object))
+        shards = (hashes % np.uint64(shard_count)).astype(np.int64)
+        return np.where(codes < 0, 0, shards[codes]) if len(shards) else np.zeros(len(codes), dtype=np.int64)
+
+    def _iter_validated_csv(self, file_key: str, schema: CsvSchema, validator):
+        """
+        Yields validated chunks of a CSV file, or the whole file at once when ``CSV_CHUNK_SIZE`` is 0.
+
+        :param file_key: S3 key for the CSV file.
+        :param schema: Column types applied while parsing.
+        :param validator: Validation function applied to each chunk.
+        :return: Iterator over the validated DataFrames.
         """
-        audience_df, inventory_df = self._fetch_and_load_data(audience_csv_key, inventory_csv_key)
-        audience_df = self._validate_audience_data(audience_df)
-        inventory_df = self._validate_inventory_data(inventory_df)
-        history = self._create_audience_history(audience_df)
-        tv_data_list = self._generate_tv_data(inventory_df, history)
-        self._store_in_redis(tv_data_list)
+        if not ENVIRONMENT.csv_chunk_size:
+            yield validator(self.csv_repository.fetch_csv_as_dataframe(file_key, schema))
+            return
+
+        for chunk in self.csv_repository.fetch_csv_in_chunks(file_key, ENVIRONMENT.csv_chunk_size, schema):
+            yield validator(chunk)
 
     def _fetch_and_load_data(self, audience_csv_key: str, inventory_csv_key: str):
         """
@@ -46,11 +490,55 @@ class TvDataService:
         :param inventory_csv_key: S3 key for the inventory CSV file.
         :return: Tuple containing audience and inventory DataFrames.
         """
-        audience_df = self.csv_repository.fetch_csv_as_dataframe(audience_csv_key)
-        inventory_df = self.csv_repository.fetch_csv_as_dataframe(inventory_csv_key)
+        audience_df = self.csv_repository.fetch_csv_as_dataframe(audience_csv_key, self.audience_schema)
+        inventory_df = self.csv_repository.fetch_csv_as_dataframe(inventory_csv_key, self.inventory_schema)
         return audience_df, inventory_df
 
-    def _validate_audience_data(self, audience_df):
+    def _fetch_and_load_data_in_parallel(self, audience_csv_key: str, inventory_csv_key: str):
+        """
+        Fetches both CSV files concurrently and parses and validates them in parallel processes.
+
+        Downloads run in a thread pool; each file is handed to the process pool as soon as it arrives, so the
+        stage takes as long as the slowest input rather than the sum of both.
+
+        :param audience_csv_key: S3 key for the audience CSV file.
+        :param inventory_csv_key: S3 key for the inventory CSV file.
+        :return: Tuple containing the validated audience and inventory DataFrames.
+        """
+        inputs = [
+            (audience_csv_key, self.audience_schema, TvDataService._validate_audience_data),
+            (inventory_csv_key, self.inventory_schema, TvDataService._validate_inventory_data),
+        ]
+        process_context = multiprocessing.get_context("spawn")
+
+        with ThreadPoolExecutor(max_workers=len(inputs)) as io_pool, \
+                ProcessPoolExecutor(max_workers=ENVIRONMENT.ingestion_process_workers,
+                                    mp_context=process_context) as cpu_pool:
+            downloads = {io_pool.submit(self._fetch_csv_bytes, file_key): position
+                         for position, (file_key, _, _) in enumerate(inputs)}
+            parsed = [None] * len(inputs)
+            for download in as_completed(downloads):
+                file_key, schema, validator = inputs[downloads[download]]
+                parsed[downloads[download]] = cpu_pool.submit(_parse_and_validate_csv, download.result(), schema,
+                                                              validator)
+
+            dataframes = []
+            for (file_key, _, _), future in zip(inputs, parsed):
+                dataframe, seconds = future.result()
+                record_duration(f"parse and validate {file_key}", seconds)
+                dataframes.append(dataframe)
+
+        audience_df, inventory_df = dataframes
+        observe_rows("validate audience", len(audience_df))
+        observe_rows("validate inventory", len(inventory_df))
+        return audience_df, inventory_df
+
+    def _fetch_csv_bytes(self, file_key: str) -> bytes:
+        with log_duration(f"fetch {file_key}"):
+            return self.csv_repository.fetch_csv_bytes(file_key)
+
+    @staticmethod
+    def _validate_audience_data(audience_df):
         """
         Validates and processes audience data.
 
@@ -62,14 +550,17 @@ class TvDataService:
         if not all(col in audience_df.columns for col in required_columns):
             raise KeyError(f"Missing required columns in audience data: {required_columns}")
 
-        audience_df['exhibition_date'] = pd.to_datetime(audience_df['exhibition_date'], format="%Y-%m-%d",
-                                                        errors='coerce')
+        if audience_df['exhibition_date'].dtype.kind != "M":
+            audience_df['exhibition_date'] = pd.to_datetime(audience_df['exhibition_date'], format="%Y-%m-%d",
+                                                            errors='coerce')
         audience_df['weekday'] = audience_df['exhibition_date'].dt.day_name()
 
+        observe_rows("validate audience", len(audience_df))
         logger.info("Audience data validation completed successfully!")
         return audience_df
 
-    def _validate_inventory_data(self, inventory_df):
+    @staticmethod
+    def _validate_inventory_data(inventory_df):
         """
         Validates and processes inventory data.
 
@@ -78,84 +569,94 @@ class TvDataService:
         """
         required_columns = ['signal', 'program_code', 'date', 'available_time']
 
-        if 'signal;program_code;date;available_time' in inventory_df.columns:
-            logger.info("Detected invalid format in 'inventory_df'. Correcting...")
-            inventory_df[['signal', 'program_code', 'date', 'available_time']] = inventory_df[
-                'signal;program_code;date;available_time'].str.split(';', expand=True)
-            inventory_df = inventory_df.drop(columns=['signal;program_code;date;available_time'])
-
         if not all(col in inventory_df.columns for col in required_columns):
             raise KeyError(f"Missing required columns in inventory data: {required_columns}")
 
-        inventory_df['date'] = pd.to_datetime(inventory_df['date'], format="%d/%m/%Y", errors='coerce')
+        if inventory_df['date'].dtype.kind != "M":
+            inventory_df['date'] = pd.to_datetime(inventory_df['date'], format="%d/%m/%Y", errors='coerce')
         inventory_df['weekday'] = inventory_df['date'].dt.day_name()
 
-        logger.info("Inventory data validation and correction completed successfully!")
+        observe_rows("validate inventory", len(inventory_df))
+        logger.info("Inventory data validation completed successfully!")
         return inventory_df
 
     def _create_audience_history(self, audience_df):
         """
-        Creates an audience history for each program based on past records.
+        Creates the audience median of each program based on its most recent past records.
 
         :param audience_df: DataFrame containing audience data.
-        :return: Dictionary mapping (signal, program_code, weekday) to past audience records.
+        :return: DataFrame mapping (signal, program_code, weekday) to the median of the last audience records.
         """
-        history = defaultdict(list)
         logger.info("Creating audience history...")
+        medians = self.history_engine.median_table(audience_df)
+        observe_rows("history", len(medians))
+        logger.info(f"Audience history generated: {len(medians)} records.")
+        return medians
 
-        for _, row in audience_df.iterrows():
-            weekday = row["weekday"] if pd.notna(row["weekday"]) else "Unknown"
-            key = (row["signal"], row["program_code"], weekday)
-            history[key].append(row["average_audience"])
-            if len(history[key]) > 4:
-                history[key].pop(0)
-
-        logger.info(f"Audience history generated: {len(history)} records.")
-        return history
-
-    def _generate_tv_data(self, inventory_df, history):
+    def _generate_tv_data(self, inventory_df, medians, snapshot_writer=None):
         """
-        Generates structured TV data by merging inventory data with audience history.
+        Generates structured TV data by joining inventory data with the audience median table.
 
         :param inventory_df: DataFrame containing inventory data.
-        :param history: Dictionary mapping (signal, program_code, weekday) to past audience records.
+        :param medians: DataFrame mapping (signal, program_code, weekday) to the median audience.
+        :param snapshot_writer: (Optional) Writer of the predictions snapshot the generated data is appended to.
         :return: List of structured TV data.
         """
-        tv_data_list = []
-
-        for _, row in inventory_df.iterrows():
-            key = (row["signal"], row["program_code"], row["weekday"])
-            logger.info(f"Generating TV Data for key: {key}")
-
-            median_audience = pd.Series(history[key]).median() if key in history and history[key] else None
-            exhibition_date = row["date"].strftime("%Y-%m-%d")
-
-            tv_data = TVData(
-                signal=row["signal"],
-                program_code=row["program_code"],
-                weekday=row["weekday"],
-                available_time=row["available_time"],
-                predicted_audience=median_audience,
-                exhibition_date=exhibition_date
-            )
+        valid_dates = inventory_df["date"].notna()
+        if not valid_dates.all():
+            logger.warning(f"Skipping {(~valid_dates).sum()} inventory rows with an invalid date.")
+            inventory_df = inventory_df[valid_dates]
+
+        predictions = inventory_df.merge(medians, on=self.history_engine.key_columns, how="left")
+        predicted_audience = predictions[self.history_engine.median_column]
+
+        tv_data_df = pd.DataFrame({
+            "signal": predictions["signal"],
+            "program_code": predictions["program_code"],
+            "weekday": predictions["weekday"],
+            "available_time": pd.to_numeric(predictions["available_time"]).astype("int64"),
+            "predicted_audience": predicted_audience.astype(object).where(predicted_audience.notna(), None),
+            "exhibition_date": predictions["date"].dt.strftime("%Y-%m-%d"),
+        })
+        tv_data_list = tv_data_df.to_dict("records")
+        if snapshot_writer is not None:
+            snapshot_writer.write(tv_data_df)
+
+        self._validate_tv_data_sample(tv_data_list)
+        observe_rows("generate", len(tv_data_list))
+        logger.info(f"TV Data generated: {len(tv_data_list)} records, "
+                    f"{predicted_audience.isna().sum()} without audience history.")
+        return tv_data_list
 
-            tv_data_list.append(tv_data.model_dump_tv_data())
+    def _validate_tv_data_sample(self, tv_data_list):
+        """
+        Validates a random sample of the generated records against the TVData model.
 
-        return tv_data_list
+        :param tv_data_list: List of structured TV data.
+        :raises pydantic.ValidationError: If a sampled record does not match the TVData model.
+        """
+        sample_size = min(ENVIRONMENT.tv_data_validation_sample_size, len(tv_data_list))
+        for record in random.sample(tv_data_list, sample_size):
+            TVData(**record)
 
-    def _store_in_redis(self, tv_data_list):
+    def _store_in_redis(self, writer: TvDataWriter, tv_data_list):
         """
-        Stores processed TV data in Redis.
+        Stores processed TV data in Redis as a new dataset version, indexed by program_code, weekday and
+        exhibition date, and publishes it.
 
+        :param writer: Writer of the new dataset version, see ``_create_writer``.
         :param tv_data_list: List of structured TV data.
         """
-        self.database_repository.create(self.redis_key, json.dumps(tv_data_list))
+        writer.write(tv_data_list)
+        self._commit(writer)
 
-    def get_all_data(self) -> List[TVData]:
+    def _create_writer(self) -> TvDataWriter:
         """
-        Retrieves all TV data stored in Redis.
+        Allocates a new dataset version and creates a writer storing its data in pipelined batches of
+        ``REDIS_PIPELINE_BATCH_SIZE`` programs.
 
-        :return: List of TVData objects.
+        :return: A TvDataWriter bound to the database repository and the keyspace of the new version.
         """
-        raw_data = self.database_repository.get(self.redis_key)
-        return [] if not raw_data else [TVData(**item) for item in json.loads(raw_data)]
+        version = self.database_repository.increment(self.keys.next_version())
+        return TvDataWriter(self.database_repository, self.keys.for_version(version),
+                            ENVIRONMENT.redis_pipeline_batch_size)
@@ -0,0 +1,126 @@
+import json
+from typing import Dict, List
+
+import pandas as pd
+
+from src.domain.interfaces.repositories.database_repository import IDataBaseRepository
+from src.domain.services.audience_history import AudienceHistoryEngine
+from src.domain.services.tv_data_keys import TvDataKeys
+
+
+class IncrementalState:
+    """
+    Persistent state of the incremental ingestion: the audience watermark with a digest of the rows already
+    ingested on the watermark day, the rolling window of last audience values per (signal, program_code, weekday)
+    and a digest of the inventory rows of each program.
+
+    Every state key is stored without expiration.
+    """
+
+    def __init__(self, database_repository: IDataBaseRepository, keys: TvDataKeys,
+                 history_engine: AudienceHistoryEngine):
+        """
+        Initializes the state store.
+
+        :param database_repository: Repository where the state is stored.
+        :param keys: Key layout of the stored data.
+        :param history_engine: Engine defining the key and value columns of the windows.
+        """
+        self.database_repository = database_repository
+        self.keys = keys
+        self.history_engine = history_engine
+
+    def get_watermark(self) -> pd.Timestamp | None:
+        """
+        Retrieves the latest audience exhibition date already ingested.
+
+        :return: The watermark, or None if no incremental run was stored yet.
+        """
+        watermark = self.database_repository.get(self.keys.state_watermark())
+        return pd.Timestamp(watermark) if watermark else None
+
+    def get_watermark_rows(self) -> Dict[str, int]:
+        """
+        Retrieves the audience rows exhibited on the watermark day that were already ingested. Rows of that day
+        may still arrive in later files, so they are matched against these digests instead of being skipped.
+
+        :return: Dictionary mapping row digests, see ``audience_row_digests``, to the number of rows ingested.
+        """
+        row_counts = self.database_repository.get(self.keys.state_watermark_rows())
+        return json.loads(row_counts) if row_counts else {}
+
+    def set_watermark(self, watermark: pd.Timestamp, row_counts: Dict[str, int]) -> None:
+        """
+        Stores the watermark and the audience rows ingested on the watermark day.
+
+        :param watermark: The latest audience exhibition date ingested.
+        :param row_counts: Dictionary mapping row digests to the number of rows ingested on the watermark day.
+        """
+        self.database_repository.create(self.keys.state_watermark_rows(), json.dumps(row_counts), 0)
+        self.database_repository.create(self.keys.state_watermark(), watermark.strftime("%Y-%m-%d"), 0)
+
+    @staticmethod
+    def audience_row_digests(audience_df: pd.DataFrame) -> List[str]:
+        """
+        Computes a digest of every audience row from the columns read from the file.
+
+        :param audience_df: DataFrame containing validated audience data.
+        :return: List of row digests, in row order.
+        """
+        columns = [column for column in audience_df.columns if column != "weekday"]
+        return pd.util.hash_pandas_object(audience_df[columns].astype(str), index=False).astype(str).tolist()
+
+    def load_windows(self, key_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Loads the stored audience windows of a set of keys.
+
+        :param key_df: DataFrame with the (signal, program_code, weekday) key columns.
+        :return: DataFrame with the key columns and the audience values, oldest value first within each key.
+        """
+        key_columns, value_column = self.history_engine.key_columns, self.history_engine.value_column
+        history_keys = list(key_df[key_columns].drop_duplicates().itertuples(index=False, name=None))
+        fields = [json.dumps(list(key)) for key in history_keys]
+        values = self.database_repository.get_hash_values(self.keys.state_windows(), fields)
+
+        rows = [(*key, value) for key, window in zip(history_keys, values) if window
+                for value in json.loads(window)]
+        return pd.DataFrame(rows, columns=key_columns + [value_column])
+
+    def save_windows(self, window_df: pd.DataFrame) -> None:
+        """
+        Stores the audience windows of every key present in a window DataFrame.
+
+        :param window_df: DataFrame with the key columns and the last audience values of each key.
+        """
+        if window_df.empty:
+            return
+
+        history = self.history_engine.build_history(window_df)
+        self.database_repository.create_hash(self.keys.state_windows(), {
+            json.dumps(list(key)): json.dumps(values) for key, values in history.items()
+        }, 0)
+
+    def get_inventory_digests(self) -> Dict[str, str]:
+        """
+        Retrieves the digest of the inventory rows of each program stored by the previous run.
+
+        :return: Dictionary mapping program codes to digests.
+        """
+        digests = self.database_repository.get(self.keys.state_inventory())
+        return json.loads(digests) if digests else {}
+
+    def set_inventory_digests(self, digests: Dict[str, str]) -> None:
+        self.database_repository.create(self.keys.state_inventory(), json.dumps(digests), 0)
+
+    @staticmethod
+    def inventory_digests(inventory_df: pd.DataFrame) -> Dict[str, str]:
+        """
+        Computes an order-independent digest of the inventory rows of each program.
+
+        :param inventory_df: DataFrame containing validated inventory data.
+        :return: Dictionary mapping program codes to digests.
+        """
+        columns = ["signal", "program_code", "date", "available_time"]
+        row_hashes = pd.util.hash_pandas_object(inventory_df[columns].astype(str), index=False)
+        digests = row_hashes.groupby(inventory_df["program_code"].astype(str).to_numpy()).sum()
+        return {program_code: str(digest) for program_code, digest in digests.items()}
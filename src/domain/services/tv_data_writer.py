@@ -0,0 +1,150 @@
+import json
+import logging
+import time
+from collections import defaultdict
+from typing import Iterable, List
+
+from src.cross.metrics import observe_rows
+from src.domain.interfaces.repositories.database_repository import IDataBaseRepository
+from src.domain.services.tv_data_keys import TvDataKeys
+
+logger = logging.getLogger(__name__)
+
+
+class TvDataWriter:
+    """
+    Writes processed TV data into the per-program Redis layout described by TvDataKeys.
+
+    Every writer fills the keyspace of a new dataset version, which readers ignore until ``commit`` publishes it
+    by moving the version pointer, a single atomic write. Records can be written in several calls, e.g. one per
+    inventory chunk: record ids keep increasing across calls. Programs that did not change since the published
+    dataset can be copied over instead of being regenerated. Keys are written without expiration.
+    """
+
+    def __init__(self, database_repository: IDataBaseRepository, keys: TvDataKeys, batch_size: int):
+        """
+        Initializes the writer.
+
+        :param database_repository: Repository where the data is stored.
+        :param keys: Key layout of the dataset version being written, see ``TvDataKeys.for_version``.
+        :param batch_size: Number of programs written per pipelined batch.
+        """
+        self.database_repository = database_repository
+        self.keys = keys
+        self.batch_size = batch_size
+        self.next_record_id = 0
+        self.program_codes = set()
+
+    def write(self, tv_data_list: List[dict]) -> None:
+        """
+        Stores a list of records, indexed by program_code, weekday and exhibition date.
+
+        :param tv_data_list: List of structured TV data.
+        """
+        programs = defaultdict(list)
+        for record_id, record in enumerate(tv_data_list, start=self.next_record_id):
+            programs[record["program_code"]].append((str(record_id), record))
+        self.next_record_id += len(tv_data_list)
+        observe_rows("store", len(tv_data_list))
+
+        program_codes = list(programs)
+        for start in range(0, len(program_codes), self.batch_size):
+            with self.database_repository.pipeline() as batch:
+                for program_code in program_codes[start:start + self.batch_size]:
+                    self._write_program(batch, program_code, programs[program_code])
+
+    def copy_programs(self, source_keys: TvDataKeys, program_codes: Iterable[str]) -> None:
+        """
+        Copies the records and indexes of programs from another dataset version. Record ids are copied as is,
+        the copied programs keep their own id sequences.
+
+        :param source_keys: Key layout of the dataset version holding the programs.
+        :param program_codes: The programs to be copied.
+        """
+        program_codes = [program_code for program_code in program_codes if program_code not in self.program_codes]
+        for start in range(0, len(program_codes), self.batch_size):
+            batch_codes = program_codes[start:start + self.batch_size]
+            with self.database_repository.pipeline() as batch:
+                for program_code in batch_codes:
+                    for source, destination in zip(source_keys.program_keys(program_code),
+                                                   self.keys.program_keys(program_code)):
+                        batch.copy(source, destination)
+                batch.add_to_set(self.keys.programs(), batch_codes, 0)
+            self.program_codes.update(batch_codes)
+
+    def commit(self) -> List[int]:
+        """
+        Publishes the written dataset version, then deletes the keyspaces of the versions readers no longer use.
+
+        The previously published version is kept until the next publication, so API workers still reading it
+        before their next version check get complete data. Programs are counted from the version's program set,
+        which also holds the programs written by other writers of the same version, e.g. ingestion shards.
+
+        :return: The versions whose keyspaces were deleted, see ``collect_garbage``.
+        """
+        previous_version = self.database_repository.get(self.keys.version())
+        programs = len(self.database_repository.get_set_members(self.keys.programs()))
+        dataset_info = {"published_at": time.time(), "programs": programs}
+        self.database_repository.create(self.keys.dataset_info(), json.dumps(dataset_info), 0)
+        self.database_repository.create(self.keys.version(), self.keys.dataset_version, 0)
+
+        logger.info(f"Published dataset version {self.keys.dataset_version} with {programs} programs, "
+                    f"{self.next_record_id} TV Data records written by this writer.")
+        return self.collect_garbage(previous_version)
+
+    def collect_garbage(self, previous_version: str | None) -> List[int]:
+        """
+        Deletes the keyspaces of every version older than the one being published, except the previous one.
+        Versions of failed runs, which were never published, are deleted as well.
+
+        :param previous_version: Version published before this one, None if there was none.
+        :return: The versions whose keyspaces were deleted.
+        """
+        version = int(self.keys.dataset_version)
+        retained = version if previous_version is None else min(int(previous_version), version)
+        collected = self.database_repository.get(self.keys.collected_version())
+        stale_versions = [stale_version for stale_version in range(int(collected or retained), version)
+                          if stale_version != retained]
+        for stale_version in stale_versions:
+            self._delete_version(self.keys.for_version(stale_version))
+        self.database_repository.create(self.keys.collected_version(), retained, 0)
+        return stale_versions
+
+    def _delete_version(self, keys: TvDataKeys) -> None:
+        """
+        Deletes every key of a dataset version.
+
+        :param keys: Key layout of the dataset version.
+        """
+        program_codes = list(self.database_repository.get_set_members(keys.programs()))
+        for start in range(0, len(program_codes), self.batch_size):
+            self.database_repository.delete(*(key for program_code in program_codes[start:start + self.batch_size]
+                                              for key in keys.program_keys(program_code)))
+        self.database_repository.delete(keys.programs(), keys.dataset_info(), keys.finished_shards(),
+                                        keys.shard_publisher())
+        logger.info(f"Deleted dataset version {keys.dataset_version}.")
+
+    def _write_program(self, batch, program_code, records):
+        """
+        Stores the records and indexes of a single program.
+
+        :param batch: Pipelined database repository.
+        :param program_code: The program code.
+        :param records: List of (record_id, record) tuples of the program.
+        """
+        if program_code not in self.program_codes:
+            batch.add_to_set(self.keys.programs(), [program_code], 0)
+            self.program_codes.add(program_code)
+
+        weekdays = defaultdict(list)
+        for record_id, record in records:
+            weekdays[record["weekday"]].append(record_id)
+
+        batch.create_hash(self.keys.records(program_code), {
+            record_id: self.database_repository.serializer.dumps(record) for record_id, record in records
+        }, 0)
+        batch.add_to_sorted_set(self.keys.dates(program_code), {
+            record_id: self.keys.date_score(record["exhibition_date"]) for record_id, record in records
+        }, 0)
+        for weekday, record_ids in weekdays.items():
+            batch.add_to_set(self.keys.weekday(program_code, weekday), record_ids, 0)
@@ -0,0 +1,98 @@
+import fcntl
+import logging
+import os
+from contextlib import contextmanager
+
+import boto3
+import pyarrow as pa
+
+from src.domain.core.config import ENVIRONMENT
+from src.infra.repositories.arrow_snapshot_repository import LocalArrowSnapshotRepository
+
+logger = logging.getLogger(__name__)
+
+
+class S3ArrowSnapshotRepository(LocalArrowSnapshotRepository):
+    """
+    Snapshot repository publishing Arrow IPC files to S3 and memory-mapping them from a local cache directory.
+    """
+
+    def __init__(self, bucket_name: str, base_path: str, prefix: str = "snapshots"):
+        """
+        Initializes the repository.
+
+        :param bucket_name: Name of the S3 bucket where the snapshots are published.
+        :param base_path: Local directory where the snapshots are cached.
+        :param prefix: Key prefix of the snapshots within the bucket.
+        """
+        super().__init__(base_path)
+        self.s3_client = boto3.client(
+            "s3",
+            aws_access_key_id=ENVIRONMENT.aws_client_id.get_secret_value(),
+            aws_secret_access_key=ENVIRONMENT.aws_secret_key.get_secret_value(),
+            region_name=ENVIRONMENT.aws_region_name.get_secret_value()
+        )
+        self.bucket_name = bucket_name
+        self.prefix = prefix
+
+    @contextmanager
+    def snapshot_writer(self, name: str):
+        """
+        Opens a snapshot for writing; once the local file is complete it is uploaded to S3.
+
+        :param name: Name of the snapshot.
+        :return: Context manager yielding an ArrowSnapshotWriter.
+        """
+        with super().snapshot_writer(name) as writer:
+            yield writer
+
+        if writer.rows:
+            self.s3_client.upload_file(self._path(name), self.bucket_name, self._key(name))
+
+    def read_table(self, name: str) -> pa.Table | None:
+        """
+        Loads a snapshot as a memory-mapped Arrow table, downloading it first if the S3 object changed since it
+        was cached. The cached copy is used if S3 cannot be reached. Downloads hold a file lock, so processes
+        sharing the cache directory fetch each snapshot version once and map the same file.
+
+        :param name: Name of the snapshot.
+        :return: The Arrow table, or None if the snapshot does not exist.
+        """
+        path = self._path(name)
+        try:
+            etag = self.s3_client.head_object(Bucket=self.bucket_name, Key=self._key(name))["ETag"]
+            if not os.path.exists(path) or self._cached_etag(name) != etag:
+                os.makedirs(self.base_path, exist_ok=True)
+                with open(f"{path}.lock", "w") as lock:
+                    fcntl.flock(lock, fcntl.LOCK_EX)
+                    if not os.path.exists(path) or self._cached_etag(name) != etag:
+                        self.s3_client.download_file(self.bucket_name, self._key(name), f"{path}.download")
+                        os.replace(f"{path}.download", path)
+                        with open(f"{path}.etag", "w") as file:
+                            file.write(etag)
+        except Exception as e:
+            logger.error(f"Error fetching snapshot {name} from S3 - {e}")
+
+        return super().read_table(name)
+
+    def delete_snapshot(self, name: str) -> None:
+        """
+        Deletes a snapshot from S3 and from the local cache.
+
+        :param name: Name of the snapshot.
+        """
+        self.s3_client.delete_object(Bucket=self.bucket_name, Key=self._key(name))
+        super().delete_snapshot(name)
+        path = self._path(name)
+        self._remove(f"{path}.etag")
+        self._remove(f"{path}.lock")
+
+    def _cached_etag(self, name: str) -> str | None:
+        try:
+            with open(f"{self._path(name)}.etag") as file:
+                return file.read()
+        except OSError:
+            return None
+
+    def _key(self, name: str) -> str:
+        return f"{self.prefix}/{name}.arrow"
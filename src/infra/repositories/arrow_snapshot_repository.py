@@ -0,0 +1,132 @@
+import logging
+import os
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+import pyarrow as pa
+
+from src.domain.interfaces.repositories.snapshot_repository import ISnapshotRepository
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+class ArrowSnapshotWriter:
+    """
+    Appends DataFrames to an uncompressed Arrow IPC file, so the file can later be memory-mapped without copies.
+
+    Every DataFrame is cast to the schema of the first one; categorical columns are stored as plain strings.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initializes the writer.
+
+        :param path: Path of the temporary file being written.
+        """
+        self.path = path
+        self.rows = 0
+        self._schema = None
+        self._sink = None
+        self._writer = None
+
+    def write(self, dataframe: "pd.DataFrame") -> None:
+        """
+        Appends the rows of a DataFrame to the snapshot.
+
+        :param dataframe: DataFrame to be appended.
+        """
+        categorical_columns = dataframe.select_dtypes("category").columns
+        if len(categorical_columns):
+            dataframe = dataframe.astype({column: "string" for column in categorical_columns})
+
+        table = pa.Table.from_pandas(dataframe, preserve_index=False)
+        if self._writer is None:
+            self._schema = table.schema
+            self._sink = pa.OSFile(self.path, "wb")
+            self._writer = pa.ipc.new_file(self._sink, self._schema)
+        else:
+            table = table.select(self._schema.names).cast(self._schema)
+
+        self._writer.write_table(table)
+        self.rows += table.num_rows
+
+    def close(self) -> bool:
+        """
+        Finishes the file.
+
+        :return: True if any rows were written, False otherwise.
+        """
+        if self._writer is None:
+            return False
+
+        self._writer.close()
+        self._sink.close()
+        return True
+
+
+class LocalArrowSnapshotRepository(ISnapshotRepository):
+    """
+    Snapshot repository storing Arrow IPC files in a local directory.
+    """
+
+    def __init__(self, base_path: str):
+        """
+        Initializes the repository.
+
+        :param base_path: Directory where the snapshots are stored.
+        """
+        self.base_path = base_path
+
+    @contextmanager
+    def snapshot_writer(self, name: str):
+        """
+        Opens a snapshot for writing. The file is written next to the current one and atomically renamed over it
+        on exit, so processes that memory-mapped the previous snapshot keep reading it safely.
+
+        :param name: Name of the snapshot.
+        :return: Context manager yielding an ArrowSnapshotWriter.
+        """
+        os.makedirs(self.base_path, exist_ok=True)
+        path = self._path(name)
+        writer = ArrowSnapshotWriter(f"{path}.tmp")
+        try:
+            yield writer
+        except Exception:
+            writer.close()
+            self._remove(writer.path)
+            raise
+
+        if writer.close():
+            os.replace(writer.path, path)
+            logger.info(f"Snapshot '{name}' written with {writer.rows} rows to {path}.")
+
+    def read_table(self, name: str) -> pa.Table | None:
+        """
+        Loads a local snapshot as a memory-mapped Arrow table.
+
+        :param name: Name of the snapshot.
+        :return: The Arrow table, or None if the snapshot does not exist.
+        """
+        path = self._path(name)
+        if not os.path.exists(path):
+            return None
+        return pa.ipc.open_file(pa.memory_map(path, "r")).read_all()
+
+    def delete_snapshot(self, name: str) -> None:
+        """
+        Deletes a local snapshot. Processes that memory-mapped it keep reading it until they unmap it.
+
+        :param name: Name of the snapshot.
+        """
+        self._remove(self._path(name))
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        if os.path.exists(path):
+            os.remove(path)
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.base_path, f"{name}.arrow")
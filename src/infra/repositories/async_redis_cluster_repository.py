@@ -0,0 +1,79 @@
+import logging
+
+import redis
+from redis.asyncio.cluster import RedisCluster
+
+from src.cross.errors import Forbidden, ValidationError
+from src.cross.metrics import instrument_command
+from src.domain.core.config import ENVIRONMENT
+from src.infra.repositories.async_redis_repository import AsyncRedisRepository
+
+logger = logging.getLogger()
+
+
+class AsyncRedisClusterRepository(AsyncRedisRepository):
+    """
+    Asyncio implementation of the database repository backed by a Redis Cluster.
+
+    Routing, pipelines and read replicas behave like RedisClusterRepository; every node keeps its own pool of at
+    most ``REDIS_MAX_CONNECTIONS`` connections.
+    """
+
+    @classmethod
+    def setup_connection_strings(cls):
+        """
+        Sets up the connection parameters for the Redis Cluster.
+
+        :return: The class instance with configured connection parameters.
+        :raises ValueError: If there is an error while setting up the connection strings.
+        """
+        super().setup_connection_strings()
+        cls.read_from_replicas = ENVIRONMENT.redis_read_from_replicas
+        return cls
+
+    @classmethod
+    def connect(cls):
+        """
+        Creates the asyncio cluster client. Nodes and slots are discovered on the first command.
+
+        :return: The class instance with a cluster client.
+        :raises Forbidden: If there is an error creating the cluster client.
+        """
+        try:
+            cls.instance = RedisCluster(
+                host=cls.redis_host,
+                port=cls.redis_port,
+                password=cls.redis_password.get_secret_value(),
+                max_connections=cls.redis_max_connections,
+                read_from_replicas=cls.read_from_replicas,
+                decode_responses=True
+            )
+
+            return cls()
+        except (redis.ConnectionError, redis.exceptions.RedisClusterException) as e:
+            logger.critical(f"Error connecting to Redis Cluster - {e}")
+            raise Forbidden("Error connecting to Redis Cluster.")
+
+    @instrument_command("del")
+    async def delete(self, *keys: str) -> None:
+        """
+        Deletes keys from the Redis Cluster, key by key when pipelined like RedisClusterRepository.
+
+        :param keys: The keys to be deleted.
+        :raises ValidationError: If there is an error deleting the keys.
+        """
+        try:
+            if self.pipelined:
+                for key in keys:
+                    await self.instance.execute_command("DEL", key)
+            elif keys:
+                await self.instance.delete(*keys)
+        except Exception as e:
+            logger.error(f"Error deleting keys from cache - {e}")
+            raise ValidationError("Error deleting keys from cache.")
+
+    async def close(self) -> None:
+        """
+        Closes the cluster client and the connections to every node.
+        """
+        await self.instance.aclose()
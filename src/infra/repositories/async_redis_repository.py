@@ -0,0 +1,331 @@
+import copy
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Iterable, List
+
+import redis
+from redis.client import NEVER_DECODE
+import redis.asyncio as aioredis
+
+from src.cross.errors import Forbidden, ValidationError
+from src.cross.metrics import REDIS_COMMAND_DURATION, REDIS_PAYLOAD_BYTES, instrument_command, payload_size
+from src.cross.serialization import Serializer
+from src.domain.core.config import ENVIRONMENT
+from src.domain.interfaces.repositories.database_repository import IDataBaseRepository
+
+logger = logging.getLogger()
+
+
+class AsyncRedisRepository(IDataBaseRepository):
+    """
+    Asyncio implementation of the database repository backed by a pooled ``redis.asyncio`` client.
+
+    Every data method is a coroutine and ``pipeline`` is an async context manager; otherwise the contract and
+    the error handling match RedisRepository.
+    """
+    default_expiration_time: int = 3600
+    results: list = None
+    pipelined: bool = False
+
+    @classmethod
+    def setup_connection_strings(cls):
+        """
+        Sets up the connection parameters for Redis.
+
+        :return: The class instance with configured connection parameters.
+        :raises ValueError: If there is an error while setting up the connection strings.
+        """
+        try:
+            cls.redis_host = ENVIRONMENT.redis_host
+            cls.redis_port = ENVIRONMENT.redis_port
+            cls.redis_password = ENVIRONMENT.redis_password
+            cls.serializer = Serializer.from_settings()
+            cls.redis_max_connections = ENVIRONMENT.redis_max_connections
+
+            return cls
+        except Exception as e:
+            logger.error(f"Error setting up connection strings - {e}")
+            raise ValueError("Error setting up connection strings.")
+
+    @classmethod
+    def connect(cls):
+        """
+        Creates the connection pool and the asyncio Redis client. Connections are opened lazily by the pool.
+
+        :return: The class instance with a pooled Redis client.
+        :raises Forbidden: If there is an error creating the Redis client.
+        """
+        try:
+            cls.pool = aioredis.ConnectionPool(
+                host=cls.redis_host,
+                port=cls.redis_port,
+                password=cls.redis_password.get_secret_value(),
+                max_connections=cls.redis_max_connections,
+                decode_responses=True
+            )
+            cls.instance = aioredis.Redis(connection_pool=cls.pool)
+
+            return cls()
+        except redis.ConnectionError as e:
+            logger.critical(f"Error connecting to Redis - {e}")
+            raise Forbidden("Error connecting to Redis.")
+
+    @instrument_command("get")
+    async def get(self, key: str):
+        """
+        Retrieves a value from the Redis cache.
+
+        :param key: The key to fetch from Redis.
+        :return: The value associated with the given key, or None if not found.
+        :raises ValidationError: If there is an error retrieving the key.
+        """
+        try:
+            return await self.instance.get(key)
+        except Exception as e:
+            logger.error(f"Error getting key from cache - {e}")
+            raise ValidationError("Error retrieving key from cache.")
+
+    @instrument_command("set", "value")
+    async def create(self, key: str, value: bytes | memoryview | str | int | float,
+                     expiration_time: int = None) -> None:
+        """
+        Stores a value in the Redis cache with an optional expiration time.
+
+        :param key: The key under which the value will be stored.
+        :param value: The value to be stored in Redis.
+        :param expiration_time: (Optional) Expiration time in seconds. Defaults to 3600 seconds if not provided,
+                                0 disables expiration.
+        :raises ValidationError: If there is an error storing the key-value pair in Redis.
+        """
+        try:
+            await self.instance.set(key, value, ex=self._expiration(expiration_time) or None)
+        except Exception as e:
+            logger.error(f"Error setting key in cache - {e}")
+            raise ValidationError("Error storing key in cache.")
+
+    @instrument_command("setnx", "value")
+    async def create_if_absent(self, key: str, value: bytes | memoryview | str | int | float,
+                               expiration_time: int = None) -> bool:
+        """
+        Atomically stores a value in the Redis cache unless the key already exists.
+
+        :param key: The key under which the value will be stored.
+        :param value: The value to be stored in Redis.
+        :param expiration_time: (Optional) Expiration time in seconds. Defaults to 3600 seconds if not provided,
+                                0 disables expiration.
+        :return: Whether the value was stored.
+        :raises ValidationError: If there is an error storing the key-value pair in Redis.
+        """
+        try:
+            return bool(await self.instance.set(key, value, ex=self._expiration(expiration_time) or None, nx=True))
+        except Exception as e:
+            logger.error(f"Error setting key in cache - {e}")
+            raise ValidationError("Error storing key in cache.")
+
+    @instrument_command("hset", "mapping")
+    async def create_hash(self, key: str, mapping: dict, expiration_time: int = None) -> None:
+        """
+        Stores the fields of a Redis hash with an optional expiration time.
+
+        :param key: The key of the hash.
+        :param mapping: Dictionary mapping hash fields to their values.
+        :param expiration_time: (Optional) Expiration time in seconds. Defaults to 3600 seconds if not provided,
+                                0 disables expiration.
+        :raises ValidationError: If there is an error storing the hash in Redis.
+        """
+        try:
+            await self.instance.hset(key, mapping=mapping)
+            await self._expire(key, expiration_time)
+        except Exception as e:
+            logger.error(f"Error setting hash in cache - {e}")
+            raise ValidationError("Error storing hash in cache.")
+
+    @instrument_command(lambda arguments: "hvals" if arguments["fields"] is None else "hmget")
+    async def get_hash_values(self, key: str, fields: List[str] = None, raw: bool = False) -> list:
+        """
+        Retrieves values from a Redis hash.
+
+        :param key: The key of the hash.
+        :param fields: (Optional) Fields to fetch. All values of the hash are returned if not provided.
+        :param raw: (Optional) Whether to return the values as bytes instead of decoded strings, for values
+                    written by the serializer.
+        :return: The values of the requested fields.
+        :raises ValidationError: If there is an error retrieving the hash.
+        """
+        try:
+            options = {NEVER_DECODE: True} if raw else {}
+            if fields is None:
+                return await self.instance.execute_command("HVALS", key, **options)
+            return await self.instance.execute_command("HMGET", key, *fields, **options) if fields else []
+        except Exception as e:
+            logger.error(f"Error getting hash from cache - {e}")
+            raise ValidationError("Error retrieving hash from cache.")
+
+    @instrument_command("sadd", "members")
+    async def add_to_set(self, key: str, members: Iterable[str], expiration_time: int = None) -> None:
+        """
+        Adds members to a Redis set with an optional expiration time.
+
+        :param key: The key of the set.
+        :param members: The members to be added.
+        :param expiration_time: (Optional) Expiration time in seconds. Defaults to 3600 seconds if not provided,
+                                0 disables expiration.
+        :raises ValidationError: If there is an error storing the set in Redis.
+        """
+        try:
+            await self.instance.sadd(key, *members)
+            await self._expire(key, expiration_time)
+        except Exception as e:
+            logger.error(f"Error adding members to set in cache - {e}")
+            raise ValidationError("Error storing set in cache.")
+
+    @instrument_command("smembers")
+    async def get_set_members(self, key: str) -> set:
+        """
+        Retrieves all members of a Redis set.
+
+        :param key: The key of the set.
+        :return: The members of the set.
+        :raises ValidationError: If there is an error retrieving the set.
+        """
+        try:
+            return await self.instance.smembers(key)
+        except Exception as e:
+            logger.error(f"Error getting set from cache - {e}")
+            raise ValidationError("Error retrieving set from cache.")
+
+    @instrument_command("zadd", "mapping")
+    async def add_to_sorted_set(self, key: str, mapping: dict, expiration_time: int = None) -> None:
+        """
+        Adds scored members to a Redis sorted set with an optional expiration time.
+
+        :param key: The key of the sorted set.
+        :param mapping: Dictionary mapping members to their scores.
+        :param expiration_time: (Optional) Expiration time in seconds. Defaults to 3600 seconds if not provided,
+                                0 disables expiration.
+        :raises ValidationError: If there is an error storing the sorted set in Redis.
+        """
+        try:
+            await self.instance.zadd(key, mapping)
+            await self._expire(key, expiration_time)
+        except Exception as e:
+            logger.error(f"Error adding members to sorted set in cache - {e}")
+            raise ValidationError("Error storing sorted set in cache.")
+
+    @instrument_command("zrangebyscore")
+    async def range_by_score(self, key: str, min_score: float, max_score: float) -> list:
+        """
+        Retrieves the members of a Redis sorted set whose score lies within an inclusive range.
+
+        :param key: The key of the sorted set.
+        :param min_score: Lower bound of the range.
+        :param max_score: Upper bound of the range.
+        :return: The members within the range, ordered by score.
+        :raises ValidationError: If there is an error retrieving the sorted set.
+        """
+        try:
+            return await self.instance.zrangebyscore(key, min_score, max_score)
+        except Exception as e:
+            logger.error(f"Error getting sorted set range from cache - {e}")
+            raise ValidationError("Error retrieving sorted set range from cache.")
+
+    @instrument_command("incr")
+    async def increment(self, key: str) -> int:
+        """
+        Atomically increments an integer counter in the Redis cache. Counters never expire.
+
+        :param key: The key of the counter.
+        :return: The value of the counter after the increment.
+        :raises ValidationError: If there is an error incrementing the counter.
+        """
+        try:
+            return await self.instance.incr(key)
+        except Exception as e:
+            logger.error(f"Error incrementing key in cache - {e}")
+            raise ValidationError("Error incrementing key in cache.")
+
+    @instrument_command("copy")
+    async def copy(self, source: str, destination: str) -> bool:
+        """
+        Copies the value of a key to another key, replacing the destination. The copy has no expiration time.
+        Both keys must hash to the same slot in a Redis Cluster.
+
+        :param source: The key to be copied.
+        :param destination: The key receiving the copy.
+        :return: Whether the source key existed.
+        :raises ValidationError: If there is an error copying the key.
+        """
+        try:
+            return await self.instance.copy(source, destination, replace=True)
+        except Exception as e:
+            logger.error(f"Error copying key in cache - {e}")
+            raise ValidationError("Error copying key in cache.")
+
+    @instrument_command("del")
+    async def delete(self, *keys: str) -> None:
+        """
+        Deletes keys from the Redis cache.
+
+        :param keys: The keys to be deleted.
+        :raises ValidationError: If there is an error deleting the keys.
+        """
+        try:
+            if keys:
+                await self.instance.delete(*keys)
+        except Exception as e:
+            logger.error(f"Error deleting keys from cache - {e}")
+            raise ValidationError("Error deleting keys from cache.")
+
+    @asynccontextmanager
+    async def pipeline(self):
+        """
+        Opens a Redis pipeline in which commands are buffered and sent in a single round trip on exit.
+
+        Commands issued on the yielded repository must still be awaited; they resolve immediately.
+
+        :return: Async context manager yielding a repository bound to the pipeline. The replies of its commands
+                 are stored in its ``results`` attribute once the context exits.
+        :raises ValidationError: If there is an error executing the pipeline.
+        """
+        batch = copy.copy(self)
+        batch.instance = self.instance.pipeline(transaction=False)
+        batch.pipelined = True
+        yield batch
+
+        try:
+            start = time.perf_counter()
+            batch.results = await batch.instance.execute()
+            REDIS_COMMAND_DURATION.labels("pipeline").observe(time.perf_counter() - start)
+            REDIS_PAYLOAD_BYTES.labels("pipeline", "received").observe(payload_size(batch.results))
+        except Exception as e:
+            logger.error(f"Error executing pipeline in cache - {e}")
+            raise ValidationError("Error executing pipeline in cache.")
+
+    async def close(self) -> None:
+        """
+        Closes the client and disconnects every pooled connection.
+        """
+        await self.instance.aclose()
+        await self.pool.disconnect()
+
+    async def _expire(self, key: str, expiration_time: int = None):
+        """
+        Applies the expiration time of a write to a key.
+
+        :param key: The key whose expiration time is set.
+        :param expiration_time: (Optional) Expiration time in seconds. 0 removes any expiration.
+        """
+        expiration_time = self._expiration(expiration_time)
+        if expiration_time:
+            return await self.instance.expire(key, expiration_time)
+        return await self.instance.persist(key)
+
+    def _expiration(self, expiration_time: int = None) -> int:
+        """
+        Resolves the expiration time of a write.
+
+        :param expiration_time: (Optional) Expiration time in seconds.
+        :return: The given expiration time, or the default one if not provided.
+        """
+        return self.default_expiration_time if expiration_time is None else expiration_time
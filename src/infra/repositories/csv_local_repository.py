@@ -0,0 +1,71 @@
+import logging
+import os
+from typing import Iterator
+
+import pandas as pd
+
+from src.cross.csv_engine import CsvEngine, CsvSchema
+from src.domain.interfaces.repositories.csv_repository import ICsvRepository
+
+logger = logging.getLogger(__name__)
+
+
+class LocalCSVRepository(ICsvRepository):
+    """
+    CSV repository reading files from a local directory, used as an offline stand-in for S3CSVRepository.
+    """
+
+    def __init__(self, base_path: str):
+        """
+        Initializes the repository to fetch CSV files from a local directory.
+
+        :param base_path: Directory where the files are stored.
+        """
+        self.base_path = base_path
+        self.csv_engine = CsvEngine.from_settings()
+
+    def fetch_csv_as_dataframe(self, file_key: str, schema: CsvSchema = None) -> pd.DataFrame:
+        """
+        Loads a local CSV file as a Pandas DataFrame.
+
+        :param file_key: Path to the file within the base directory.
+        :param schema: (Optional) Column types applied while parsing. Columns missing from the file are ignored.
+        :return: DataFrame containing the CSV data.
+        :raises Exception: If the file cannot be read or parsed.
+        """
+        try:
+            return self.csv_engine.read(os.path.join(self.base_path, file_key), schema)
+        except Exception:
+            logger.exception(f"Error fetching file {file_key}")
+            raise
+
+    def fetch_csv_bytes(self, file_key: str) -> bytes:
+        """
+        Reads the raw content of a local CSV file.
+
+        :param file_key: Path to the file within the base directory.
+        :return: The content of the file.
+        :raises Exception: If the file cannot be read.
+        """
+        try:
+            with open(os.path.join(self.base_path, file_key), "rb") as file:
+                return file.read()
+        except Exception:
+            logger.exception(f"Error fetching file {file_key}")
+            raise
+
+    def fetch_csv_in_chunks(self, file_key: str, chunksize: int, schema: CsvSchema = None) -> Iterator[pd.DataFrame]:
+        """
+        Streams a local CSV file as a sequence of Pandas DataFrames.
+
+        :param file_key: Path to the file within the base directory.
+        :param chunksize: Maximum number of rows per chunk.
+        :param schema: (Optional) Column types applied while parsing. Columns missing from the file are ignored.
+        :return: Iterator over the DataFrame chunks.
+        :raises Exception: If the file cannot be read or parsed, including after chunks were yielded.
+        """
+        try:
+            yield from self.csv_engine.read_in_chunks(os.path.join(self.base_path, file_key), chunksize, schema)
+        except Exception:
+            logger.exception(f"Error streaming file {file_key}")
+            raise
@@ -1,17 +1,25 @@
-from io import StringIO
+import logging
+from io import BytesIO
+from typing import Iterator
 
 import boto3
 import pandas as pd
+from boto3.s3.transfer import TransferConfig
 
+from src.cross.csv_engine import CsvEngine, CsvSchema
 from src.domain.core.config import ENVIRONMENT
 from src.domain.interfaces.repositories.csv_repository import ICsvRepository
 
+logger = logging.getLogger(__name__)
+
 
 class S3CSVRepository(ICsvRepository):
     def __init__(self, bucket_name: str):
         """
         Initializes the repository to fetch CSV files from S3.
 
+        Files are parsed by the engine selected with ``CSV_ENGINE``, which detects the delimiter of every file.
+
         :param bucket_name: Name of the S3 bucket where the files are stored.
         """
         self.s3_client = boto3.client(
@@ -21,18 +29,62 @@ class S3CSVRepository(ICsvRepository):
             region_name=ENVIRONMENT.aws_region_name.get_secret_value()
         )
         self.bucket_name = bucket_name
+        self.csv_engine = CsvEngine.from_settings()
 
-    def fetch_csv_as_dataframe(self, file_key: str) -> pd.DataFrame:
+    def fetch_csv_as_dataframe(self, file_key: str, schema: CsvSchema = None) -> pd.DataFrame:
         """
         Retrieves a CSV file from S3 and loads it as a Pandas DataFrame.
 
         :param file_key: Path to the file within the S3 bucket.
+        :param schema: (Optional) Column types applied while parsing. Columns missing from the file are ignored.
         :return: DataFrame containing the CSV data.
+        :raises Exception: If the file cannot be read or parsed.
+        """
+        try:
+            return self.csv_engine.read(self.fetch_csv_bytes(file_key), schema)
+        except Exception:
+            logger.exception(f"Error fetching file {file_key}")
+            raise
+
+    def fetch_csv_bytes(self, file_key: str) -> bytes:
+        """
+        Downloads the raw content of a CSV file from S3.
+
+        Objects larger than ``S3_MULTIPART_THRESHOLD`` bytes are downloaded as ranged GETs of ``S3_PART_SIZE``
+        bytes, ``S3_MAX_CONCURRENCY`` parts at a time.
+
+        :param file_key: Path to the file within the S3 bucket.
+        :return: The content of the file.
+        :raises Exception: If the file cannot be downloaded.
+        """
+        transfer_config = TransferConfig(
+            multipart_threshold=ENVIRONMENT.s3_multipart_threshold,
+            multipart_chunksize=ENVIRONMENT.s3_part_size,
+            max_concurrency=ENVIRONMENT.s3_max_concurrency
+        )
+        try:
+            buffer = BytesIO()
+            self.s3_client.download_fileobj(self.bucket_name, file_key, buffer, Config=transfer_config)
+            return buffer.getvalue()
+        except Exception:
+            logger.exception(f"Error fetching file {file_key}")
+            raise
+
+    def fetch_csv_in_chunks(self, file_key: str, chunksize: int, schema: CsvSchema = None) -> Iterator[pd.DataFrame]:
+        """
+        Streams a CSV file from S3 as a sequence of Pandas DataFrames.
+
+        The S3 body is fed straight into the chunked CSV parser, so only the current chunk is held in memory.
+
+        :param file_key: Path to the file within the S3 bucket.
+        :param chunksize: Maximum number of rows per chunk.
+        :param schema: (Optional) Column types applied while parsing. Columns missing from the file are ignored.
+        :return: Iterator over the DataFrame chunks.
+        :raises Exception: If the file cannot be read or parsed, including after chunks were yielded.
         """
         try:
             response = self.s3_client.get_object(Bucket=self.bucket_name, Key=file_key)
-            csv_content = response["Body"].read().decode("utf-8")
-            return pd.read_csv(StringIO(csv_content))
-        except Exception as e:
-            print(f"Error fetching file {file_key}: {str(e)}")
-            return pd.DataFrame()
\ No newline at end of file
+            yield from self.csv_engine.read_in_chunks(response["Body"], chunksize, schema)
+        except Exception:
+            logger.exception(f"Error streaming file {file_key}")
+            raise
@@ -0,0 +1,253 @@
+import copy
+from contextlib import asynccontextmanager, contextmanager
+from typing import Iterable, List
+
+from src.cross.serialization import Serializer
+from src.domain.interfaces.repositories.database_repository import IDataBaseRepository
+
+
+class InMemoryRepository(IDataBaseRepository):
+    """
+    Process-local implementation of the database repository, used as an offline stand-in for Redis in
+    benchmarks and tests.
+
+    Values are stored as strings, like Redis with ``decode_responses=True``, except bytes produced by the
+    serializer, which are kept as is. Expiration times are accepted and ignored. Pipelined commands run
+    immediately; their replies are collected in ``results``.
+    """
+    results: list = None
+
+    def __init__(self, serializer: Serializer = None):
+        """
+        Initializes an empty repository.
+
+        :param serializer: (Optional) Serializer of the stored values. Defaults to the configured one.
+        """
+        self.store = {}
+        self.serializer = Serializer.from_settings() if serializer is None else serializer
+
+    @classmethod
+    def setup_connection_strings(cls, **kwargs):
+        """
+        Accepts the connection parameters of other repositories; none are needed.
+
+        :return: The class.
+        """
+        return cls
+
+    @classmethod
+    def connect(cls):
+        """
+        Creates an empty repository.
+
+        :return: A new repository instance.
+        """
+        return cls()
+
+    def create(self, key: str, value: bytes | memoryview | str | int | float, expiration_time: int = None) -> None:
+        """
+        Stores a value.
+
+        :param key: The key to store the value under.
+        :param value: The value to store.
+        :param expiration_time: (Optional) Ignored.
+        """
+        self._reply(self.store.__setitem__(key, self._value(value)))
+
+    def create_if_absent(self, key: str, value: bytes | memoryview | str | int | float,
+                         expiration_time: int = None) -> bool:
+        """
+        Stores a value unless the key already exists.
+
+        :param key: The key to store the value under.
+        :param value: The value to store.
+        :param expiration_time: (Optional) Ignored.
+        :return: True if the value was stored.
+        """
+        stored = key not in self.store
+        if stored:
+            self.store[key] = self._value(value)
+        return self._reply(stored)
+
+    def get(self, key: str):
+        """
+        Retrieves a value.
+
+        :param key: The key to fetch.
+        :return: The value associated with the given key, or None if not found.
+        """
+        return self._reply(self.store.get(key))
+
+    def create_hash(self, key: str, mapping: dict, expiration_time: int = None) -> None:
+        """
+        Sets fields of a hash, creating it if needed.
+
+        :param key: The key of the hash.
+        :param mapping: Dictionary mapping fields to their values.
+        :param expiration_time: (Optional) Ignored.
+        """
+        self._reply(self.store.setdefault(key, {}).update({field: self._value(value)
+                                                           for field, value in mapping.items()}))
+
+    def get_hash_values(self, key: str, fields: List[str] = None, raw: bool = False) -> list:
+        """
+        Retrieves values of a hash.
+
+        :param key: The key of the hash.
+        :param fields: (Optional) Fields to fetch. Defaults to every field.
+        :param raw: (Optional) Ignored, values are stored as they were written.
+        :return: List of values, None for missing fields.
+        """
+        mapping = self.store.get(key, {})
+        return self._reply(list(mapping.values()) if fields is None else [mapping.get(field) for field in fields])
+
+    def add_to_set(self, key: str, members: Iterable[str], expiration_time: int = None) -> None:
+        """
+        Adds members to a set, creating it if needed.
+
+        :param key: The key of the set.
+        :param members: The members to add.
+        :param expiration_time: (Optional) Ignored.
+        """
+        self._reply(self.store.setdefault(key, set()).update(str(member) for member in members))
+
+    def get_set_members(self, key: str) -> set:
+        """
+        Retrieves the members of a set.
+
+        :param key: The key of the set.
+        :return: The members, empty if the set does not exist.
+        """
+        return self._reply(set(self.store.get(key, set())))
+
+    def add_to_sorted_set(self, key: str, mapping: dict, expiration_time: int = None) -> None:
+        """
+        Adds members to a sorted set, creating it if needed.
+
+        :param key: The key of the sorted set.
+        :param mapping: Dictionary mapping members to their scores.
+        :param expiration_time: (Optional) Ignored.
+        """
+        self._reply(self.store.setdefault(key, {}).update({str(member): score for member, score in mapping.items()}))
+
+    def range_by_score(self, key: str, min_score: float, max_score: float) -> list:
+        """
+        Retrieves the members of a sorted set within a score range, ordered by score.
+
+        :param key: The key of the sorted set.
+        :param min_score: Lowest score, inclusive.
+        :param max_score: Highest score, inclusive.
+        :return: List of members.
+        """
+        members = sorted(self.store.get(key, {}).items(), key=lambda item: (item[1], item[0]))
+        return self._reply([member for member, score in members if min_score <= score <= max_score])
+
+    def increment(self, key: str) -> int:
+        """
+        Increments an integer value, starting from 0 if the key does not exist.
+
+        :param key: The key of the counter.
+        :return: The incremented value.
+        """
+        value = int(self.store.get(key, 0)) + 1
+        self.store[key] = str(value)
+        return self._reply(value)
+
+    def copy(self, source: str, destination: str) -> bool:
+        """
+        Copies a value, replacing the destination.
+
+        :param source: The key to copy.
+        :param destination: The key to copy to.
+        :return: True if the source existed and was copied.
+        """
+        if source not in self.store:
+            return self._reply(False)
+        self.store[destination] = copy.deepcopy(self.store[source])
+        return self._reply(True)
+
+    def delete(self, *keys: str) -> None:
+        """
+        Deletes keys, ignoring missing ones.
+
+        :param keys: The keys to delete.
+        """
+        self._reply([self.store.pop(key, None) for key in keys])
+
+    @contextmanager
+    def pipeline(self):
+        """
+        Opens a pipeline. Commands run immediately on the shared store.
+
+        :return: Context manager yielding a repository whose ``results`` collects the replies of its commands.
+        """
+        batch = copy.copy(self)
+        batch.results = []
+        yield batch
+
+    @staticmethod
+    def _value(value):
+        return value if isinstance(value, bytes) else str(value)
+
+    def _reply(self, reply):
+        if self.results is not None:
+            self.results.append(reply)
+        return reply
+
+
+class AsyncInMemoryRepository:
+    """
+    Asyncio facade over an InMemoryRepository, matching the coroutine API of AsyncRedisRepository.
+    """
+
+    def __init__(self, repository: InMemoryRepository):
+        """
+        Initializes the facade.
+
+        :param repository: Repository holding the data.
+        """
+        self.repository = repository
+
+    def __getattr__(self, name: str):
+        """
+        Wraps the methods of the repository as coroutines.
+
+        :param name: Name of the method.
+        :return: Coroutine function calling the method.
+        """
+        method = getattr(self.repository, name)
+
+        async def call(*args, **kwargs):
+            return method(*args, **kwargs)
+
+        return call
+
+    @property
+    def results(self) -> list:
+        """
+        Replies collected by the pipeline of the repository, if any.
+        """
+        return self.repository.results
+
+    @property
+    def serializer(self) -> Serializer:
+        """
+        Serializer of the stored values.
+        """
+        return self.repository.serializer
+
+    @asynccontextmanager
+    async def pipeline(self):
+        """
+        Opens a pipeline, see ``InMemoryRepository.pipeline``.
+
+        :return: Async context manager yielding a facade over the pipelined repository.
+        """
+        with self.repository.pipeline() as batch:
+            yield AsyncInMemoryRepository(batch)
+
+    async def close(self) -> None:
+        """
+        Closes the repository; nothing is held open.
+        """
+        pass
@@ -0,0 +1,75 @@
+import logging
+
+import redis
+from redis.cluster import RedisCluster
+
+from src.cross.errors import Forbidden, ValidationError
+from src.cross.metrics import instrument_command
+from src.domain.core.config import ENVIRONMENT
+from src.infra.repositories.redis_repository import RedisRepository
+
+logger = logging.getLogger()
+
+
+class RedisClusterRepository(RedisRepository):
+    """
+    Implementation of the database repository backed by a Redis Cluster.
+
+    Keys are routed to the node owning their hash slot; the keys of a program share a hash tag (see TvDataKeys),
+    so every program lives on a single node and the programs spread over the whole cluster. Pipelines are split
+    per node on execution and multi-key commands are split per slot. With ``REDIS_READ_FROM_REPLICAS`` enabled
+    read commands are balanced between each primary and its replicas.
+    """
+
+    @classmethod
+    def setup_connection_strings(cls):
+        """
+        Sets up the connection parameters for the Redis Cluster.
+
+        :return: The class instance with configured connection parameters.
+        :raises ValueError: If there is an error while setting up the connection strings.
+        """
+        super().setup_connection_strings()
+        cls.read_from_replicas = ENVIRONMENT.redis_read_from_replicas
+        return cls
+
+    @classmethod
+    def connect(cls):
+        """
+        Connects to the Redis Cluster, discovering its nodes and slots from the configured startup node.
+
+        :return: The class instance with an active cluster client.
+        :raises Forbidden: If there is an error connecting to the cluster.
+        """
+        try:
+            cls.instance = RedisCluster(
+                host=cls.redis_host,
+                port=cls.redis_port,
+                password=cls.redis_password.get_secret_value(),
+                read_from_replicas=cls.read_from_replicas,
+                decode_responses=True
+            )
+
+            return cls()
+        except (redis.ConnectionError, redis.exceptions.RedisClusterException) as e:
+            logger.critical(f"Error connecting to Redis Cluster - {e}")
+            raise Forbidden("Error connecting to Redis Cluster.")
+
+    @instrument_command("del")
+    def delete(self, *keys: str) -> None:
+        """
+        Deletes keys from the Redis Cluster. Cluster pipelines only buffer single-key deletes, so pipelined
+        deletes are issued key by key.
+
+        :param keys: The keys to be deleted.
+        :raises ValidationError: If there is an error deleting the keys.
+        """
+        try:
+            if self.pipelined:
+                for key in keys:
+                    self.instance.execute_command("DEL", key)
+            elif keys:
+                self.instance.delete(*keys)
+        except Exception as e:
+            logger.error(f"Error deleting keys from cache - {e}")
+            raise ValidationError("Error deleting keys from cache.")
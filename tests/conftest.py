@@ -0,0 +1,16 @@
+import pytest
+
+from benchmarks.data_generator import DatasetSpec
+
+
+@pytest.fixture
+def dataset_spec():
+    return DatasetSpec(audience_rows=2_000, inventory_rows=300, signals=2, programs=10)
+
+
+@pytest.fixture
+def stored_records():
+    def records(service):
+        return sorted(record.model_dump_json() for record in service.get_all_data())
+
+    return records
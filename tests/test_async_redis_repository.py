@@ -0,0 +1,95 @@
+import asyncio
+
+import fakeredis
+from fastapi.testclient import TestClient
+
+from main import app
+from src.application.v1.dependencies import get_tv_query_cache
+from src.cross.serialization import Serializer
+from src.domain.core.config import ENVIRONMENT
+from src.domain.services.tv_data_keys import TvDataKeys
+from src.domain.services.tv_data_query_cache import TvDataQueryCache
+from src.domain.services.tv_data_reader import TvDataReader
+from src.domain.services.tv_data_writer import TvDataWriter
+from src.infra.repositories.async_redis_repository import AsyncRedisRepository
+from src.infra.repositories.redis_repository import RedisRepository
+
+RECORD = {"signal": "SP1", "program_code": "HUCK", "weekday": "Monday", "available_time": 30,
+          "predicted_audience": 1.0, "exhibition_date": "2022-08-01"}
+
+
+def _repositories():
+    server = fakeredis.FakeServer()
+    repository = RedisRepository()
+    repository.instance = fakeredis.FakeRedis(server=server, decode_responses=True)
+    repository.serializer = Serializer.from_settings()
+    async_repository = AsyncRedisRepository()
+    async_repository.instance = fakeredis.FakeAsyncRedis(server=server, decode_responses=True)
+    async_repository.serializer = repository.serializer
+    return repository, async_repository
+
+
+def _publish(repository, records):
+    version = repository.increment(TvDataKeys().next_version())
+    writer = TvDataWriter(repository, TvDataKeys().for_version(version), batch_size=10)
+    writer.write(records)
+    writer.commit()
+
+
+def test_async_repository_commands_and_pipeline():
+    _, async_repository = _repositories()
+
+    async def run():
+        await async_repository.create_hash("hash", {"a": 1, "b": 2})
+        await async_repository.add_to_sorted_set("zset", {"x": 2, "y": 1, "z": 5})
+        async with async_repository.pipeline() as batch:
+            await batch.get_hash_values("hash")
+            await batch.get_hash_values("hash", ["b"])
+            await batch.range_by_score("zset", 1, 2)
+            await batch.get("missing")
+        return batch.results
+
+    assert asyncio.run(run()) == [["1", "2"], ["2"], ["y", "x"], None]
+    assert async_repository.results is None
+
+
+def test_async_reader_follows_the_published_version():
+    repository, async_repository = _repositories()
+    reader = TvDataReader(repository, async_repository)
+    assert asyncio.run(reader.get_dataset_version_async()) is None
+
+    _publish(repository, [RECORD])
+    _publish(repository, [RECORD, {**RECORD, "program_code": "JORN"}, {**RECORD, "exhibition_date": "2022-08-08"}])
+
+    async def run():
+        records = await reader.get_many_program_records_async(["HUCK", "JORN", "NONE"])
+        return await reader.get_dataset_version_async(), records, await reader.get_program_records_async("HUCK", "1")
+
+    version, records, first_version_records = asyncio.run(run())
+    assert version == "2"
+    assert {program_code: len(program_records) for program_code, program_records in records.items()} == {
+        "HUCK": 2, "JORN": 1, "NONE": 0}
+    assert [record.exhibition_date for record in first_version_records] == ["2022-08-01"]
+
+
+def test_conditional_requests_over_redis(monkeypatch):
+    repository, async_repository = _repositories()
+    _publish(repository, [RECORD])
+    query_cache = TvDataQueryCache(TvDataReader(repository, async_repository), version_check_interval=0)
+    app.dependency_overrides[get_tv_query_cache] = lambda: query_cache
+    monkeypatch.setattr(ENVIRONMENT, "dataset_refresh_interval", 3600)
+    try:
+        with TestClient(app) as client:
+            url = "/api/v1/program?program_code=HUCK&date=2022-08-08"
+            response = client.get(url)
+            etag = response.headers["etag"]
+            assert response.status_code == 200 and len(response.json()) == 1
+            assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+
+            _publish(repository, [RECORD, {**RECORD, "exhibition_date": "2022-08-08"}])
+            updated = client.get(url, headers={"If-None-Match": etag})
+            assert updated.status_code == 200
+            assert updated.headers["etag"] != etag and len(updated.json()) == 2
+            assert query_cache.version == "2"
+    finally:
+        app.dependency_overrides.clear()
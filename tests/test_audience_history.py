@@ -0,0 +1,48 @@
+import math
+from collections import defaultdict
+
+import pandas as pd
+
+from src.domain.services.audience_history import AudienceHistoryEngine
+
+
+def _legacy_history(audience_df, window_size):
+    history = defaultdict(list)
+    for _, row in audience_df.iterrows():
+        weekday = row["weekday"] if pd.notna(row["weekday"]) else "Unknown"
+        key = (row["signal"], row["program_code"], weekday)
+        history[key].append(row["average_audience"])
+        if len(history[key]) > window_size:
+            history[key].pop(0)
+    return dict(history)
+
+
+def _audience_df():
+    return pd.DataFrame({
+        "signal": ["SP1", "SP1", "RJ1", "SP1", "SP1", "SP1", "RJ1", "SP1", "SP1"],
+        "program_code": ["HUCK", "HUCK", "HUCK", "HUCK", "HUCK", "HUCK", "HUCK", "NEWS", "HUCK"],
+        "weekday": ["Saturday", "Saturday", "Saturday", "Saturday", "Saturday", "Saturday", None, "Monday",
+                    "Sunday"],
+        "average_audience": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, float("nan")],
+    })
+
+
+def test_build_history_matches_legacy_loop():
+    audience_df = _audience_df()
+
+    for window_size in (1, 2, 4):
+        history = AudienceHistoryEngine(window_size=window_size).build_history(audience_df)
+        expected = _legacy_history(audience_df, window_size)
+
+        assert history.keys() == expected.keys()
+        for key, values in expected.items():
+            assert pd.Series(history[key]).equals(pd.Series(values))
+
+
+def test_median_table_uses_last_records_only():
+    medians = AudienceHistoryEngine(window_size=4).median_table(_audience_df())
+    medians = medians.set_index(AudienceHistoryEngine.key_columns)["median_audience"]
+
+    assert medians[("SP1", "HUCK", "Saturday")] == 4.5
+    assert medians[("RJ1", "HUCK", "Unknown")] == 7.0
+    assert math.isnan(medians[("SP1", "HUCK", "Sunday")])
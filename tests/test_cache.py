@@ -0,0 +1,31 @@
+from src.cross.cache import LRUCache
+
+
+def test_lru_cache_evicts_least_recently_used_entries():
+    cache = LRUCache(max_bytes=30)
+    cache.set("a", 1, size=10)
+    cache.set("b", 2, size=10)
+    cache.set("c", 3, size=10)
+
+    assert cache.get("a") == 1
+    cache.set("d", 4, size=10)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("d") == 4
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["bytes"] == 30
+
+
+def test_lru_cache_reports_hits_and_misses():
+    cache = LRUCache(max_bytes=100)
+    cache.set("a", [], size=10)
+    cache.set("too-big", [], size=1000)
+
+    assert cache.get("a") == []
+    assert cache.get("too-big") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+    cache.clear()
+    assert cache.stats()["entries"] == 0
@@ -0,0 +1,81 @@
+import io
+
+import pandas as pd
+import pytest
+
+from src.cross.csv_engine import CsvEngine, CsvSchema, sniff_delimiter
+from src.domain.core.config import ENVIRONMENT
+from src.infra.repositories.csv_local_repository import LocalCSVRepository
+
+SCHEMA = CsvSchema({"signal": "category", "program_code": "category", "date": "date", "available_time": "Int64"},
+                   date_formats={"date": "%d/%m/%Y"})
+ROWS = ["SP1,HUCK,01/08/2022,30", "RJ1,ALTAS,31/02/2022,45", "SP1,HUCK,not a date,", "RJ1,JOR,15/08/2022,60"]
+CSV = ("signal,program_code,date,available_time\n" + "\n".join(ROWS) + "\n").encode()
+
+
+def test_sniff_delimiter():
+    assert sniff_delimiter(b"signal;program_code;date;available_time\nSP1;HUCK;01,08;30\n") == ";"
+    assert sniff_delimiter(b"signal\tprogram_code\nSP1\tHUCK\n") == "\t"
+    assert sniff_delimiter(CSV) == ","
+    assert sniff_delimiter(b"signal\n") == ","
+
+
+@pytest.mark.parametrize("source", [CSV, CSV.replace(b",", b";"), io.BytesIO(CSV)])
+def test_arrow_engine_decodes_typed_columns(source):
+    dataframe = CsvEngine("arrow").read(source, SCHEMA)
+
+    assert list(dataframe.columns) == ["signal", "program_code", "date", "available_time"]
+    assert isinstance(dataframe["signal"].dtype, pd.CategoricalDtype)
+    assert str(dataframe["date"].dtype) == "timestamp[s][pyarrow]"
+    assert str(dataframe["available_time"].dtype) == "int64[pyarrow]"
+    assert dataframe["date"].isna().tolist() == [False, True, True, False]
+    assert dataframe["date"].dt.strftime("%Y-%m-%d").iloc[3] == "2022-08-15"
+    assert dataframe["available_time"].isna().tolist() == [False, False, True, False]
+
+
+def test_engines_agree():
+    arrow = CsvEngine("arrow").read(CSV.replace(b",", b";"), SCHEMA)
+    pandas = CsvEngine("pandas").read(CSV.replace(b",", b";"), SCHEMA)
+
+    pandas["date"] = pd.to_datetime(pandas["date"], format="%d/%m/%Y", errors="coerce")
+    assert arrow.astype(object).where(arrow.notna(), None).values.tolist() == \
+        pandas.astype(object).where(pandas.notna(), None).values.tolist()
+
+
+@pytest.mark.parametrize("engine", ["arrow", "pandas"])
+def test_read_in_chunks(engine):
+    csv_engine = CsvEngine(engine, block_size=64)
+    chunks = list(csv_engine.read_in_chunks(io.BytesIO(CSV + "\n".join(ROWS * 20).encode()), 25, SCHEMA))
+
+    assert [len(chunk) for chunk in chunks] == [25, 25, 25, 9]
+    assert [len(chunk) for chunk in csv_engine.read_in_chunks(io.BytesIO(CSV), 2, SCHEMA)] == [2, 2]
+    assert pd.concat(chunks)["program_code"].astype(str).tolist() == [row.split(",")[1] for row in ROWS * 21]
+
+
+def test_unknown_engine():
+    with pytest.raises(ValueError):
+        CsvEngine("polars")
+
+
+def test_stream_errors_propagate(tmp_path, monkeypatch):
+    monkeypatch.setattr(ENVIRONMENT, "csv_block_size", 64)
+    (tmp_path / "inventory.csv").write_bytes(CSV + "\n".join(ROWS * 20).encode() + b"\nSP1,HUCK,01/08/2022,abc\n")
+    chunks = LocalCSVRepository(str(tmp_path)).fetch_csv_in_chunks("inventory.csv", 25, SCHEMA)
+
+    assert len(next(chunks)) == 25
+    with pytest.raises(ValueError):
+        list(chunks)
+    with pytest.raises(FileNotFoundError):
+        next(LocalCSVRepository(str(tmp_path)).fetch_csv_in_chunks("missing.csv", 25, SCHEMA))
+
+
+def test_fetch_errors_propagate(tmp_path):
+    repository = LocalCSVRepository(str(tmp_path))
+    (tmp_path / "inventory.csv").write_bytes(CSV + b"SP1,HUCK,01/08/2022,abc\n")
+
+    with pytest.raises(FileNotFoundError):
+        repository.fetch_csv_bytes("missing.csv")
+    with pytest.raises(FileNotFoundError):
+        repository.fetch_csv_as_dataframe("missing.csv", SCHEMA)
+    with pytest.raises(ValueError):
+        repository.fetch_csv_as_dataframe("inventory.csv", SCHEMA)
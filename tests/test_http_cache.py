@@ -0,0 +1,60 @@
+from fastapi.testclient import TestClient
+
+from main import app
+from src.application.v1.dependencies import get_tv_query_cache
+from src.application.v1.http_cache import CacheValidators
+from src.domain.core.config import ENVIRONMENT
+from src.domain.services.tv_data_keys import TvDataKeys
+from src.domain.services.tv_data_query_cache import TvDataQueryCache
+from src.domain.services.tv_data_reader import TvDataReader
+from src.domain.services.tv_data_writer import TvDataWriter
+from src.infra.repositories.memory_repository import AsyncInMemoryRepository, InMemoryRepository
+
+RECORD = {"signal": "SP1", "program_code": "HUCK", "weekday": "Monday", "available_time": 30,
+          "predicted_audience": 1.0, "exhibition_date": "2022-08-01"}
+
+
+def _publish(repository, records):
+    version = repository.increment(TvDataKeys().next_version())
+    writer = TvDataWriter(repository, TvDataKeys().for_version(version), batch_size=10)
+    writer.write(records)
+    writer.commit()
+
+
+def test_conditional_requests(monkeypatch):
+    repository = InMemoryRepository()
+    _publish(repository, [RECORD])
+    query_cache = TvDataQueryCache(TvDataReader(repository, AsyncInMemoryRepository(repository)),
+                                   version_check_interval=0)
+    app.dependency_overrides[get_tv_query_cache] = lambda: query_cache
+    monkeypatch.setattr(ENVIRONMENT, "dataset_refresh_interval", 3600)
+    client = TestClient(app)
+    try:
+        url = "/api/v1/program?program_code=HUCK&date=2022-08-08"
+        response = client.get(url)
+        etag = response.headers["etag"]
+        assert response.status_code == 200
+        assert 3500 < int(response.headers["cache-control"].removeprefix("public, max-age=")) <= 3600
+
+        not_modified = client.get(url, headers={"If-None-Match": f'W/"other", {etag}'})
+        assert not_modified.status_code == 304
+        assert not_modified.headers["etag"] == etag and not_modified.content == b""
+
+        assert client.get("/api/v1/program?program_code=HUCK&date=2022-08-15").headers["etag"] != etag
+        assert client.get("/api/v1/program?program_code=NONE&date=2022-08-15",
+                          headers={"If-None-Match": "*"}).status_code == 404
+
+        _publish(repository, [RECORD, {**RECORD, "exhibition_date": "2022-08-08"}])
+        updated = client.get(url, headers={"If-None-Match": etag})
+        assert updated.status_code == 200
+        assert updated.headers["etag"] != etag and len(updated.json()) == 2
+    finally:
+        app.dependency_overrides.clear()
+
+
+def test_cache_control_without_refresh_interval(monkeypatch):
+    monkeypatch.setattr(ENVIRONMENT, "dataset_refresh_interval", 0)
+
+    assert CacheValidators("3", 0.0, "program", "HUCK").headers["Cache-Control"] == "no-cache"
+    assert CacheValidators(None, None, "program", "HUCK").headers == {}
+    assert not CacheValidators(None, None, "program", "HUCK").not_modified("*")
@@ -0,0 +1,121 @@
+import pandas as pd
+import pytest
+
+from benchmarks.data_generator import generate_datasets
+from src.domain.services.tv_data_service import TvDataService
+from src.infra.repositories.arrow_snapshot_repository import LocalArrowSnapshotRepository
+from src.infra.repositories.csv_local_repository import LocalCSVRepository
+from src.infra.repositories.memory_repository import InMemoryRepository
+
+CUTOFF = "2023-10-01"
+
+
+@pytest.fixture
+def rebuild(stored_records):
+    def records(directory, audience_file, inventory_file):
+        service = TvDataService(LocalCSVRepository(str(directory)), InMemoryRepository())
+        service.process_and_store_data(audience_file, inventory_file, chunksize=0)
+        return stored_records(service)
+
+    return records
+
+
+def _generated_programs(service, monkeypatch):
+    programs = set()
+    generate_tv_data = service._generate_tv_data
+
+    def spy(inventory_df, *args, **kwargs):
+        programs.update(inventory_df["program_code"].astype(str))
+        return generate_tv_data(inventory_df, *args, **kwargs)
+
+    monkeypatch.setattr(service, "_generate_tv_data", spy)
+    return programs
+
+
+@pytest.fixture
+def datasets(tmp_path, dataset_spec):
+    audience_df, inventory_df = generate_datasets(dataset_spec)
+    audience_df.to_csv(tmp_path / "audience.csv", index=False)
+    audience_df[audience_df["exhibition_date"] <= CUTOFF].to_csv(tmp_path / "history.csv", index=False)
+    inventory_df.to_csv(tmp_path / "inventory.csv", index=False)
+    service = TvDataService(LocalCSVRepository(str(tmp_path)), InMemoryRepository())
+    service.process_and_store_incremental("history.csv", "inventory.csv")
+    return tmp_path, service, audience_df, inventory_df
+
+
+def test_first_run_and_rerun_match_full_ingestion(datasets, monkeypatch, rebuild, stored_records):
+    directory, service, _, _ = datasets
+    expected = rebuild(directory, "history.csv", "inventory.csv")
+    assert stored_records(service) == expected
+
+    generated = _generated_programs(service, monkeypatch)
+    service.process_and_store_incremental("history.csv", "inventory.csv")
+
+    assert not generated
+    assert service.get_dataset_version() == "2"
+    assert stored_records(service) == expected
+
+
+def test_delta_file_regenerates_affected_programs(datasets, monkeypatch, rebuild, stored_records):
+    directory, service, audience_df, _ = datasets
+    delta_df = audience_df[audience_df["exhibition_date"] > CUTOFF].head(5)
+    delta_df.to_csv(directory / "delta.csv", index=False)
+    pd.concat([audience_df[audience_df["exhibition_date"] <= CUTOFF], delta_df]).to_csv(
+        directory / "combined.csv", index=False)
+
+    generated = _generated_programs(service, monkeypatch)
+    service.process_and_store_incremental("delta.csv", "inventory.csv")
+
+    assert generated == set(delta_df["program_code"])
+    assert stored_records(service) == rebuild(directory, "combined.csv", "inventory.csv")
+
+
+def test_late_rows_of_the_watermark_day_are_ingested(datasets, monkeypatch, rebuild, stored_records):
+    directory, service, audience_df, _ = datasets
+    late_df = audience_df[audience_df["exhibition_date"] == CUTOFF].assign(average_audience=100.0)
+    late_df.to_csv(directory / "late.csv", index=False)
+    pd.concat([audience_df[audience_df["exhibition_date"] <= CUTOFF], late_df]).to_csv(
+        directory / "combined.csv", index=False)
+
+    service.process_and_store_incremental("late.csv", "inventory.csv")
+    expected = rebuild(directory, "combined.csv", "inventory.csv")
+    assert stored_records(service) == expected
+
+    generated = _generated_programs(service, monkeypatch)
+    service.process_and_store_incremental("combined.csv", "inventory.csv")
+
+    assert not generated
+    assert stored_records(service) == expected
+
+
+def test_changed_inventory_row_regenerates_its_program(datasets, monkeypatch, rebuild, stored_records):
+    directory, service, _, inventory_df = datasets
+    inventory_df.loc[0, "available_time"] += 1
+    inventory_df.to_csv(directory / "inventory.csv", index=False)
+
+    generated = _generated_programs(service, monkeypatch)
+    service.process_and_store_incremental("history.csv", "inventory.csv")
+
+    assert generated == {inventory_df.loc[0, "program_code"]}
+    assert stored_records(service) == rebuild(directory, "history.csv", "inventory.csv")
+
+
+def test_program_removed_from_inventory_disappears(datasets, dataset_spec, rebuild, stored_records):
+    directory, service, _, inventory_df = datasets
+    program_code = inventory_df.loc[0, "program_code"]
+    inventory_df[inventory_df["program_code"] != program_code].to_csv(directory / "inventory.csv", index=False)
+
+    service.process_and_store_incremental("history.csv", "inventory.csv")
+
+    assert program_code not in {record.program_code for record in service.get_all_data()}
+    assert service.get_dataset_info()["programs"] == dataset_spec.programs - 1
+    assert stored_records(service) == rebuild(directory, "history.csv", "inventory.csv")
+
+
+def test_incremental_run_refuses_snapshots(datasets):
+    directory, service, _, _ = datasets
+    service.snapshot_repository = LocalArrowSnapshotRepository(str(directory / "snapshots"))
+
+    with pytest.raises(ValueError):
+        service.process_and_store_incremental("history.csv", "inventory.csv")
+    assert service.get_dataset_version() == "1"
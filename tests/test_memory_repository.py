@@ -0,0 +1,44 @@
+from benchmarks.data_generator import write_datasets
+from src.cross.timing import collect_durations, log_duration
+from src.domain.services.tv_data_service import TvDataService
+from src.infra.repositories.csv_local_repository import LocalCSVRepository
+from src.infra.repositories.memory_repository import InMemoryRepository
+
+
+def test_pipeline_collects_replies():
+    repository = InMemoryRepository()
+    repository.create_hash("hash", {"a": 1, "b": 2})
+    repository.add_to_sorted_set("zset", {"x": 2, "y": 1, "z": 5})
+
+    with repository.pipeline() as batch:
+        batch.get_hash_values("hash")
+        batch.range_by_score("zset", 1, 2)
+        batch.get("missing")
+
+    assert batch.results == [["1", "2"], ["y", "x"], None]
+    assert repository.results is None
+
+
+def test_ingestion_runs_offline(tmp_path, dataset_spec):
+    audience_file, inventory_file = write_datasets(dataset_spec, str(tmp_path))
+    service = TvDataService(LocalCSVRepository(str(tmp_path)), InMemoryRepository())
+
+    with collect_durations() as stages:
+        service.process_and_store_data(audience_file, inventory_file, chunksize=500)
+
+    assert stages
+    assert len(service.get_all_data()) == dataset_spec.inventory_rows
+
+
+def test_collect_durations_sums_repeated_stages():
+    with collect_durations() as stages:
+        with log_duration("stage"):
+            pass
+        with log_duration("stage"):
+            pass
+
+    assert list(stages) == ["stage"]
+    with log_duration("outside"):
+        pass
+    assert "outside" not in stages
+
@@ -0,0 +1,54 @@
+import time
+
+from prometheus_client import REGISTRY
+
+from src.cross.metrics import instrument_command, payload_size
+from src.cross.profiler import SamplingProfiler
+
+
+class _Repository:
+    pipelined = False
+
+    @instrument_command("test_hset", "mapping")
+    def create_hash(self, key, mapping):
+        return None
+
+    @instrument_command(lambda arguments: "test_hvals" if arguments["fields"] is None else "test_hmget")
+    def get_hash_values(self, key, fields=None):
+        return ["abc", "de"]
+
+
+def _sample(name, labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+def test_instrument_command_observes_latency_and_payloads():
+    repository = _Repository()
+    repository.create_hash("key", {"field": "12345"})
+    repository.get_hash_values("key")
+    repository.get_hash_values("key", ["a", "b"])
+    repository.pipelined = True
+    repository.get_hash_values("key")
+
+    assert _sample("tv_data_redis_command_duration_seconds_count", {"command": "test_hvals"}) == 1
+    assert _sample("tv_data_redis_command_duration_seconds_count", {"command": "test_hmget"}) == 1
+    assert _sample("tv_data_redis_payload_bytes_sum", {"command": "test_hset", "direction": "sent"}) == 5
+    assert _sample("tv_data_redis_payload_bytes_sum", {"command": "test_hvals", "direction": "received"}) == 5
+
+
+def test_payload_size():
+    assert payload_size({"a": "xyz", "b": ["12", 3]}) == 13
+    assert payload_size(None) == 0
+
+
+def _busy(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def test_sampling_profiler_records_stacks():
+    with SamplingProfiler(interval=0.001) as profiler:
+        _busy(0.05)
+
+    assert "_busy" in profiler.folded()
@@ -0,0 +1,24 @@
+import pytest
+from pydantic import ValidationError
+
+from src.application.v1.endpoints.models import BulkQueryRequest, DateRangeRequest
+
+
+def test_date_range_request_accepts_date_or_period():
+    assert DateRangeRequest(program_code="HUCK", date="2022-08-06").date == "2022-08-06"
+    assert DateRangeRequest(program_code="HUCK", start_date="2022-08-01", end_date="2022-08-06").end_date == "2022-08-06"
+
+
+@pytest.mark.parametrize("fields", [
+    {},
+    {"start_date": "2022-08-01"},
+    {"date": "06/08/2022"},
+])
+def test_date_range_request_rejects_invalid_dates(fields):
+    with pytest.raises(ValidationError):
+        DateRangeRequest(program_code="HUCK", **fields)
+
+
+def test_bulk_query_request_requires_items():
+    with pytest.raises(ValidationError):
+        BulkQueryRequest(items=[])
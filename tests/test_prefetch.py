@@ -0,0 +1,41 @@
+import threading
+
+import pytest
+
+from src.cross.prefetch import Prefetcher
+
+
+def test_prefetcher_keeps_order():
+    with Prefetcher(range(100), depth=3) as items:
+        assert list(items) == list(range(100))
+        assert next(items, None) is None
+
+
+def test_prefetcher_reraises_errors():
+    def failing():
+        yield 1
+        raise ValueError("bad row")
+
+    items = Prefetcher(failing(), depth=2)
+
+    assert next(items) == 1
+    with pytest.raises(ValueError, match="bad row"):
+        next(items)
+
+
+def test_prefetcher_close_stops_the_producer():
+    closed = threading.Event()
+
+    def endless():
+        try:
+            while True:
+                yield 1
+        finally:
+            closed.set()
+
+    with Prefetcher(endless(), depth=1) as items:
+        assert next(items) == 1
+
+    assert closed.wait(timeout=5)
+    with pytest.raises(ValueError):
+        Prefetcher([], depth=0)
@@ -0,0 +1,55 @@
+import asyncio
+import json
+
+from src.domain.services.tv_data_keys import TvDataKeys
+from src.domain.services.tv_data_query_cache import TvDataQueryCache
+from src.domain.services.tv_data_reader import TvDataReader
+from src.domain.services.tv_data_writer import TvDataWriter
+from src.infra.repositories.memory_repository import AsyncInMemoryRepository, InMemoryRepository
+
+RECORD = {"signal": "SP1", "program_code": "HUCK", "weekday": "Monday", "available_time": 30,
+          "predicted_audience": 1.0, "exhibition_date": "2022-08-01"}
+
+
+def _publish(repository, records):
+    version = repository.increment(TvDataKeys().next_version())
+    writer = TvDataWriter(repository, TvDataKeys().for_version(version), batch_size=10)
+    writer.write(records)
+    writer.commit()
+
+
+def _query_cache(repository):
+    return TvDataQueryCache(TvDataReader(repository, AsyncInMemoryRepository(repository)), version_check_interval=0)
+
+
+def test_refresh_during_a_load_does_not_cache_the_old_version():
+    repository = InMemoryRepository()
+    _publish(repository, [RECORD])
+    query_cache = _query_cache(repository)
+    reader = query_cache.tv_service
+    get_records = reader.get_many_program_records_async
+    loaded, release = asyncio.Event(), asyncio.Event()
+
+    async def slow_get_records(program_codes, version=None):
+        records = await get_records(program_codes, version)
+        if not loaded.is_set():
+            loaded.set()
+            await release.wait()
+        return records
+
+    reader.get_many_program_records_async = slow_get_records
+
+    async def interleave():
+        in_flight = asyncio.create_task(query_cache.get_program_payload_async("HUCK", "Monday"))
+        await loaded.wait()
+        _publish(repository, [RECORD, {**RECORD, "exhibition_date": "2022-08-08"}])
+        refreshed = await query_cache.get_program_payload_async("HUCK", "Monday")
+        release.set()
+        return await in_flight, refreshed, await query_cache.get_program_payload_async("HUCK", "Monday")
+
+    in_flight, refreshed, after = asyncio.run(interleave())
+
+    assert len(json.loads(in_flight)) == 1
+    assert len(json.loads(refreshed)) == len(json.loads(after)) == 2
+    assert query_cache.version == "2"
+    assert all(key[0] == "2" for key in query_cache.cache._entries)
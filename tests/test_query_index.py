@@ -0,0 +1,60 @@
+import json
+from datetime import date
+
+from src.domain.entities.open_tv import TVData
+from src.domain.services.query_index import ProgramIndex
+from src.domain.services.record_store import RecordStore
+
+
+def _record(exhibition_date, weekday):
+    return TVData(signal="SP1", program_code="HUCK", weekday=weekday, available_time=30,
+                  predicted_audience=1.0, exhibition_date=exhibition_date)
+
+
+def _index(serialize=False):
+    return ProgramIndex([
+        _record("2022-08-06", "Saturday"),
+        _record("2022-07-25", "Monday"),
+        _record("2022-07-30", "Saturday"),
+        _record("2022-08-08", "Monday"),
+    ], serialize=serialize)
+
+
+def test_by_period_is_inclusive_and_sorted():
+    result = _index().by_period(date(2022, 7, 25), date(2022, 8, 6))
+
+    assert [record.exhibition_date for record in result] == ["2022-07-25", "2022-07-30", "2022-08-06"]
+
+
+def test_by_period_outside_data_is_empty():
+    assert _index().by_period(date(2019, 7, 25), date(2019, 8, 8)) == []
+    assert _index().by_period(date(2022, 8, 8), date(2022, 7, 25)) == []
+
+
+def test_by_weekday():
+    assert [record.exhibition_date for record in _index().by_weekday("Saturday")] == ["2022-07-30", "2022-08-06"]
+    assert _index().by_weekday("Sunday") == []
+
+
+def test_payloads_match_records():
+    index = _index(serialize=True)
+
+    period = json.loads(index.period_payload(date(2022, 7, 25), date(2022, 8, 6)))
+    weekday = json.loads(index.weekday_payload("Monday"))
+
+    assert period == [record.model_dump() for record in index.by_period(date(2022, 7, 25), date(2022, 8, 6))]
+    assert weekday == [record.model_dump() for record in index.by_weekday("Monday")]
+    assert index.weekday_payload("Sunday") == ProgramIndex.empty_payload
+
+
+def test_record_store_round_trip():
+    records = [_record("2022-08-06", "Saturday"), _record("2022-07-25", "Monday")]
+    records[1].predicted_audience = None
+
+    store = RecordStore.from_encoded(json.dumps(record.model_dump()) for record in records)
+
+    assert len(store) == 2
+    assert list(store) == records
+    assert store.models([1]) == records[1:]
+    assert list(store.date_ordinals) == [date(2022, 8, 6).toordinal(), date(2022, 7, 25).toordinal()]
+    assert store.signal.values == ["SP1"]
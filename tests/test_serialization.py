@@ -0,0 +1,30 @@
+import json
+
+import pytest
+
+from src.cross.serialization import Serializer
+
+RECORD = {"signal": "SP1", "program_code": "HUCK", "weekday": "Monday", "available_time": 30,
+          "predicted_audience": None, "exhibition_date": "2022-08-01"}
+
+
+@pytest.mark.parametrize("value_format", ["json", "msgpack"])
+@pytest.mark.parametrize("compression", ["none", "zlib", "zstd", "lz4"])
+def test_round_trip(value_format, compression):
+    serializer = Serializer(value_format, compression)
+
+    assert Serializer.loads(serializer.dumps(RECORD)) == RECORD
+    assert Serializer.loads(serializer.dumps([RECORD] * 50)) == [RECORD] * 50
+
+
+def test_legacy_json_values_stay_readable():
+    assert Serializer.loads(json.dumps(RECORD)) == RECORD
+    assert Serializer.loads(json.dumps(RECORD).encode()) == RECORD
+    assert json.loads(Serializer().dumps(RECORD)) == RECORD
+
+
+def test_small_values_are_not_compressed():
+    serializer = Serializer("msgpack", "zstd", compression_min_bytes=1024)
+
+    assert serializer.dumps(RECORD)[:3] == b"\x00\x02\x00"
+    assert Serializer("msgpack", "zstd").dumps(RECORD)[:3] == b"\x00\x02\x02"
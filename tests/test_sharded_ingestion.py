@@ -0,0 +1,63 @@
+import pytest
+
+from benchmarks.data_generator import write_datasets
+from src.domain.services.tv_data_service import TvDataService
+from src.infra.repositories.arrow_snapshot_repository import LocalArrowSnapshotRepository
+from src.infra.repositories.csv_local_repository import LocalCSVRepository
+from src.infra.repositories.memory_repository import InMemoryRepository
+
+
+@pytest.fixture
+def ingestion(tmp_path, dataset_spec):
+    audience_file, inventory_file = write_datasets(dataset_spec, str(tmp_path))
+    service = TvDataService(LocalCSVRepository(str(tmp_path)), InMemoryRepository())
+    service.process_and_store_data(audience_file, inventory_file, chunksize=0)
+    return service, audience_file, inventory_file
+
+
+def test_sharded_ingestion_matches_single_process(ingestion, dataset_spec, stored_records):
+    service, audience_file, inventory_file = ingestion
+    expected = stored_records(service)
+
+    for shard in range(3):
+        assert service.get_dataset_version() == "1"
+        service.process_and_store_shard(audience_file, inventory_file, shard, 3, run_id="run")
+
+    assert service.get_dataset_version() == "2"
+    assert stored_records(service) == expected
+    assert service.get_dataset_info()["programs"] == dataset_spec.programs
+
+
+def test_shard_rerun_does_not_publish_again(ingestion, stored_records):
+    service, audience_file, inventory_file = ingestion
+    for shard in range(2):
+        service.process_and_store_shard(audience_file, inventory_file, shard, 2, run_id="run")
+    expected, published_at = stored_records(service), service.get_dataset_info()["published_at"]
+
+    service.process_and_store_shard(audience_file, inventory_file, 1, 2, run_id="run")
+
+    assert service.get_dataset_version() == "2"
+    assert service.get_dataset_info()["published_at"] == published_at
+    assert stored_records(service) == expected
+
+
+@pytest.mark.parametrize("shard", [-1, 3])
+def test_shard_index_out_of_range(ingestion, shard):
+    service, audience_file, inventory_file = ingestion
+
+    with pytest.raises(ValueError):
+        service.process_and_store_shard(audience_file, inventory_file, shard, 3, run_id="run")
+    with pytest.raises(ValueError):
+        service.process_and_store_shard(audience_file, inventory_file, 0, 3, run_id="")
+    assert service.get_dataset_version() == "1"
+
+
+def test_sharded_run_refuses_snapshots(ingestion, tmp_path):
+    service, audience_file, inventory_file = ingestion
+    service.snapshot_repository = LocalArrowSnapshotRepository(str(tmp_path / "snapshots"))
+
+    with pytest.raises(ValueError):
+        service.process_and_store_shard(audience_file, inventory_file, 0, 1, run_id="run")
+    with pytest.raises(ValueError):
+        service.process_and_store_sharded(audience_file, inventory_file, 2)
+    assert service.get_dataset_version() == "1"
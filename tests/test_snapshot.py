@@ -0,0 +1,99 @@
+import os
+import shutil
+
+import pandas as pd
+import pytest
+
+from benchmarks.data_generator import write_datasets
+from src.cross.errors import NotFound
+from src.domain.services.predictions_snapshot import PredictionsSnapshot
+from src.domain.services.tv_data_service import TvDataService
+from src.domain.services.tv_data_writer import TvDataWriter
+from src.infra.repositories.arrow_snapshot_repository import LocalArrowSnapshotRepository
+from src.infra.repositories.csv_local_repository import LocalCSVRepository
+from src.infra.repositories.memory_repository import InMemoryRepository
+
+
+def _predictions(program_codes):
+    return pd.DataFrame({
+        "signal": "SP1",
+        "program_code": pd.Categorical(program_codes),
+        "weekday": "Saturday",
+        "available_time": 30,
+        "predicted_audience": 1.5,
+        "exhibition_date": [f"2022-08-{day:02d}" for day in range(1, len(program_codes) + 1)],
+    })
+
+
+def test_snapshot_round_trip_across_chunks(tmp_path):
+    repository = LocalArrowSnapshotRepository(str(tmp_path))
+    with repository.snapshot_writer("predictions") as writer:
+        writer.write(_predictions(["HUCK", "JORN"]))
+        writer.write(_predictions(["HUCK"]))
+
+    snapshot = PredictionsSnapshot(repository.read_table("predictions"))
+
+    assert sorted(snapshot.program_codes) == ["HUCK", "JORN"]
+    assert [record.exhibition_date for record in snapshot.records("HUCK")] == ["2022-08-01", "2022-08-01"]
+    assert len(snapshot.records("MISSING")) == 0
+
+
+def test_missing_snapshot_is_none(tmp_path):
+    assert LocalArrowSnapshotRepository(str(tmp_path)).read_snapshot("predictions") is None
+
+
+def test_failed_write_keeps_previous_snapshot(tmp_path):
+    repository = LocalArrowSnapshotRepository(str(tmp_path))
+    repository.write_snapshot("predictions", _predictions(["HUCK"]))
+
+    try:
+        with repository.snapshot_writer("predictions") as writer:
+            writer.write(_predictions(["JORN"]))
+            raise RuntimeError
+    except RuntimeError:
+        pass
+
+    assert repository.read_snapshot("predictions")["program_code"].tolist() == ["HUCK"]
+
+
+@pytest.mark.parametrize("chunksize", [0, 500])
+def test_ingestion_publishes_snapshots_of_the_committed_version(tmp_path, monkeypatch, chunksize, dataset_spec):
+    audience_file, inventory_file = write_datasets(dataset_spec, str(tmp_path))
+    service = TvDataService(LocalCSVRepository(str(tmp_path)), InMemoryRepository())
+    service.snapshot_repository = LocalArrowSnapshotRepository(str(tmp_path / "snapshots"))
+    published = []
+    commit = TvDataWriter.commit
+
+    def checked_commit(writer):
+        snapshot_name = writer.keys.snapshot("predictions")
+        published.append(service.snapshot_repository.read_table(snapshot_name) is not None)
+        return commit(writer)
+
+    monkeypatch.setattr(TvDataWriter, "commit", checked_commit)
+    for _ in range(3):
+        service.process_and_store_data(audience_file, inventory_file, chunksize=chunksize)
+
+    assert published == [True, True, True]
+    assert sorted(os.listdir(tmp_path / "snapshots")) == [f"{name}.v{version}.arrow" for name in
+                                                          ("audience", "inventory", "predictions")
+                                                          for version in (2, 3)]
+    snapshot = service.load_predictions_snapshot(service.get_dataset_version())
+    rows = sum(len(snapshot.records(program_code)) for program_code in snapshot.program_codes)
+    assert rows == dataset_spec.inventory_rows
+
+
+def test_rerun_from_snapshots_skips_the_csv_files(tmp_path, dataset_spec, stored_records):
+    audience_file, inventory_file = write_datasets(dataset_spec, str(tmp_path / "csv"))
+    service = TvDataService(LocalCSVRepository(str(tmp_path / "csv")), InMemoryRepository())
+    service.snapshot_repository = LocalArrowSnapshotRepository(str(tmp_path / "snapshots"))
+    with pytest.raises(NotFound):
+        service.process_and_store_from_snapshot()
+
+    service.process_and_store_data(audience_file, inventory_file, chunksize=500)
+    expected = stored_records(service)
+    shutil.rmtree(tmp_path / "csv")
+    service.process_and_store_from_snapshot()
+
+    assert service.get_dataset_version() == "2"
+    assert stored_records(service) == expected
+    assert service.load_predictions_snapshot("2").program_codes == service.load_predictions_snapshot("1").program_codes
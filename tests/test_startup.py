@@ -0,0 +1,7 @@
+from benchmarks.startup_benchmark import INGESTION_MODULES, measure_startup
+
+
+def test_api_starts_without_credentials_or_ingestion_modules():
+    result = measure_startup()
+
+    assert result["loaded"] == [], f"API imported {result['loaded']}, expected none of {INGESTION_MODULES}"
@@ -0,0 +1,40 @@
+import pandas as pd
+
+from src.domain.services.audience_history import AudienceHistoryEngine
+from src.domain.services.tv_data_service import TvDataService
+from src.infra.repositories.csv_local_repository import LocalCSVRepository
+from src.infra.repositories.memory_repository import InMemoryRepository
+
+
+def _service(tmp_path):
+    service = TvDataService(LocalCSVRepository(str(tmp_path)), InMemoryRepository())
+    service.history_engine = AudienceHistoryEngine(window_size=4)
+    return service
+
+
+def test_generate_joins_inventory_with_audience_medians(tmp_path):
+    service = _service(tmp_path)
+    audience_df = service._validate_audience_data(pd.DataFrame({
+        "signal": ["SP1"] * 5 + ["RJ1"],
+        "program_code": ["HUCK"] * 6,
+        "exhibition_date": ["2022-08-06", "2022-08-13", "2022-08-20", "2022-08-27", "2022-09-03", "2022-08-06"],
+        "average_audience": [1.0, 2.0, 3.0, 4.0, 5.0, 10.0],
+    }))
+    inventory_df = service._validate_inventory_data(pd.DataFrame({
+        "signal": ["SP1", "RJ1", "SP1", "SP1"],
+        "program_code": ["HUCK", "HUCK", "NEWS", "HUCK"],
+        "date": ["10/09/2022", "10/09/2022", "12/09/2022", "31/02/2022"],
+        "available_time": [30, 15, 20, 10],
+    }))
+
+    tv_data_list = service._generate_tv_data(inventory_df, service._create_audience_history(audience_df))
+
+    assert tv_data_list == [
+        {"signal": "SP1", "program_code": "HUCK", "weekday": "Saturday", "available_time": 30,
+         "predicted_audience": 3.5, "exhibition_date": "2022-09-10"},
+        {"signal": "RJ1", "program_code": "HUCK", "weekday": "Saturday", "available_time": 15,
+         "predicted_audience": 10.0, "exhibition_date": "2022-09-10"},
+        {"signal": "SP1", "program_code": "NEWS", "weekday": "Monday", "available_time": 20,
+         "predicted_audience": None, "exhibition_date": "2022-09-12"},
+    ]
+    assert all(type(record["available_time"]) is int for record in tv_data_list)
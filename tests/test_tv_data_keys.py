@@ -0,0 +1,45 @@
+from redis.crc import key_slot
+
+from src.domain.services.tv_data_keys import TvDataKeys
+from src.infra.repositories.redis_cluster_repository import RedisClusterRepository
+
+
+def test_program_keys_share_a_cluster_slot():
+    keys = TvDataKeys().for_version(1)
+
+    slots = {key_slot(key.encode()) for key in keys.program_keys("HUCK")}
+
+    assert slots == {key_slot(b"HUCK")}
+    assert key_slot(keys.records("HUCK").encode()) != key_slot(keys.records("DOMAIN").encode())
+
+
+def test_program_keys_keep_their_slot_across_versions():
+    source, destination = TvDataKeys().for_version(1), TvDataKeys().for_version(2)
+
+    for source_key, destination_key in zip(source.program_keys("HUCK"), destination.program_keys("HUCK")):
+        assert key_slot(source_key.encode()) == key_slot(destination_key.encode())
+
+
+def test_pipelined_cluster_delete_is_split_per_key():
+    class Client:
+        def __init__(self):
+            self.commands = []
+
+        def execute_command(self, *args):
+            self.commands.append(args)
+
+        def delete(self, *keys):
+            self.commands.append(("DEL", *keys))
+
+    keys = TvDataKeys().for_version(1)
+    repository = RedisClusterRepository()
+    repository.instance = Client()
+    repository.delete(*keys.program_keys("HUCK"))
+    repository.pipelined = True
+    repository.delete(keys.records("HUCK"), keys.records("DOMAIN"))
+
+    assert repository.instance.commands == [
+        ("DEL", *keys.program_keys("HUCK")),
+        ("DEL", keys.records("HUCK")),
+        ("DEL", keys.records("DOMAIN")),
+    ]
@@ -0,0 +1,79 @@
+from src.cross.serialization import Serializer
+from src.domain.services.tv_data_keys import TvDataKeys
+from src.domain.services.tv_data_writer import TvDataWriter
+from src.infra.repositories.memory_repository import InMemoryRepository
+
+
+def _record(program_code, exhibition_date="2022-08-01"):
+    return {"signal": "SP1", "program_code": program_code, "weekday": "Monday", "available_time": 30,
+            "predicted_audience": 1.0, "exhibition_date": exhibition_date}
+
+
+def _writer(repository):
+    version = repository.increment(TvDataKeys().next_version())
+    return TvDataWriter(repository, TvDataKeys().for_version(version), batch_size=10)
+
+
+def _versions(repository):
+    return {key.split(":")[1] for key in repository.store if key.startswith("tv_data:v")} - {"version"}
+
+
+def test_commit_publishes_and_collects_old_versions():
+    repository = InMemoryRepository()
+    for program_codes in (["HUCK"], ["HUCK", "DOMAIN"], ["DOMAIN"]):
+        writer = _writer(repository)
+        assert repository.get("tv_data:version") != str(writer.keys.dataset_version)
+        writer.write([_record(program_code) for program_code in program_codes])
+        writer.commit()
+        assert repository.get("tv_data:version") == str(writer.keys.dataset_version)
+
+    _writer(repository).write([_record("FAILED")])
+    writer = _writer(repository)
+    writer.write([_record("HUCK")])
+    writer.commit()
+
+    assert _versions(repository) == {"v3", "v5"}
+    assert repository.get_set_members("tv_data:v5:programs") == {"HUCK"}
+
+
+def test_copy_programs_from_published_version():
+    repository = InMemoryRepository()
+    writer = _writer(repository)
+    writer.write([_record("HUCK"), _record("HUCK", "2022-08-08"), _record("DOMAIN")])
+    writer.commit()
+
+    update = _writer(repository)
+    update.write([_record("DOMAIN", "2022-08-15")])
+    update.copy_programs(writer.keys, ["HUCK", "DOMAIN"])
+    update.commit()
+
+    keys = update.keys
+    assert repository.get_set_members(keys.programs()) == {"HUCK", "DOMAIN"}
+    assert len(repository.get_hash_values(keys.records("HUCK"))) == 2
+    assert repository.range_by_score(keys.dates("DOMAIN"), 0, 99999999) == ["0"]
+    assert repository.range_by_score(keys.dates("HUCK"), 0, 99999999) == ["0", "1"]
+
+
+def test_write_indexes_records_by_weekday_and_date():
+    repository = InMemoryRepository()
+    writer = _writer(repository)
+    writer.write([_record("HUCK"), _record("HUCK", "2022-08-08"), {**_record("HUCK", "2022-08-13"),
+                                                                    "weekday": "Saturday"}, _record("DOMAIN")])
+    writer.commit()
+
+    keys = writer.keys
+    assert set(repository.store) == {
+        "tv_data:version", "tv_data:version:next", "tv_data:version:collected", "tv_data:v1:dataset",
+        "tv_data:v1:programs", "tv_data:v1:program:{HUCK}:records", "tv_data:v1:program:{HUCK}:dates",
+        "tv_data:v1:program:{HUCK}:weekday:Monday", "tv_data:v1:program:{HUCK}:weekday:Saturday",
+        "tv_data:v1:program:{DOMAIN}:records", "tv_data:v1:program:{DOMAIN}:dates",
+        "tv_data:v1:program:{DOMAIN}:weekday:Monday",
+    }
+    assert repository.get_set_members(keys.weekday("HUCK", "Monday")) == {"0", "1"}
+    assert repository.get_set_members(keys.weekday("HUCK", "Saturday")) == {"2"}
+
+    record_ids = repository.range_by_score(keys.dates("HUCK"), keys.date_score("2022-08-02"),
+                                           keys.date_score("2022-08-13"))
+    records = repository.get_hash_values(keys.records("HUCK"), record_ids)
+    assert record_ids == ["1", "2"]
+    assert [Serializer.loads(record)["exhibition_date"] for record in records] == ["2022-08-08", "2022-08-13"]